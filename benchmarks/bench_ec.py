@@ -0,0 +1,188 @@
+"""Field operations and timings of the point doubling, addition and scalar
+multiplication for each coordinate system. The scalar multiplication is
+measured with a plain double-and-add and with `mul` (width-w NAF), and for
+the generator with the `FixedBase` tables. The sum of many points is measured
+with a loop of additions and with `sum_points` (batch affine additions for
+affine points), and the conversion of many points to affine coordinates with
+`to_affine_coordinates` and `batch_to_affine`.
+
+Run with
+
+    poetry run python benchmarks/bench_ec.py
+"""
+
+import contextlib
+import timeit
+from collections import Counter
+
+from keum import FixedBase, pallas, secp256k1, secp256r1
+
+SUM_POINTS = 1 << 12
+
+
+@contextlib.contextmanager
+def count_operations(Fq, counter):
+    # Count the multiplications (M), squarings (S) and inversions (I)
+    methods = {"__mul__": "M", "square": "S", "inverse": "I"}
+    originals = {name: Fq.__dict__.get(name) for name in methods}
+    for name, key in methods.items():
+
+        def wrapper(x, *args, f=getattr(Fq, name), key=key):
+            counter[key] += 1
+            return f(x, *args)
+
+        setattr(Fq, name, wrapper)
+    try:
+        yield counter
+    finally:
+        for name, f in originals.items():
+            if f is None:
+                delattr(Fq, name)
+            else:
+                setattr(Fq, name, f)
+
+
+def operations(Fq, f):
+    counter = Counter()
+    with count_operations(Fq, counter):
+        f()
+    if counter["I"]:
+        return "%dM+%dS+%dI" % (counter["M"], counter["S"], counter["I"])
+    return "%dM+%dS" % (counter["M"], counter["S"])
+
+
+def double_and_add(p, n):
+    # The same left-to-right double-and-add for every coordinate system
+    res = p.zero()
+    for i in range(n.bit_length() - 1, -1, -1):
+        res = res.double()
+        if (n >> i) & 1:
+            res = res + p
+    return res
+
+
+def loop_sum(Ec, points):
+    acc = Ec.zero()
+    for p in points:
+        acc = acc + p
+    return acc
+
+
+def main():
+    print(
+        "%10s %22s %10s %10s %10s %16s %8s %16s %8s"
+        % (
+            "curve",
+            "class",
+            "double",
+            "add",
+            "add_mixed",
+            "double-and-add",
+            "(ms)",
+            "mul",
+            "(ms)",
+        )
+    )
+    for curve in [pallas, secp256k1, secp256r1]:
+        for name in [
+            "AffineWeierstrass",
+            "ProjectiveWeierstrass",
+            "JacobianWeierstrass",
+        ]:
+            Ec = getattr(curve, name, None)
+            if Ec is None:
+                continue
+            # Non trivial Z coordinates
+            p, q = Ec.random().double(), Ec.random().double()
+            n = Ec.Fr.random().to_int()
+            mixed = "-"
+            if hasattr(Ec, "add_mixed"):
+                affine = curve.AffineWeierstrass(*q.to_affine_coordinates())
+                mixed = operations(Ec.Fq, lambda: p.add_mixed(affine))
+            t0 = timeit.repeat(lambda: double_and_add(p, n), number=1, repeat=5)
+            t1 = timeit.repeat(lambda: p.mul(n), number=1, repeat=5)
+            print(
+                "%10s %22s %10s %10s %10s %16s %8.2f %16s %8.2f"
+                % (
+                    curve.__name__.split(".")[-1],
+                    name,
+                    operations(Ec.Fq, p.double),
+                    operations(Ec.Fq, lambda: p + q),
+                    mixed,
+                    operations(Ec.Fq, lambda: double_and_add(p, n)),
+                    min(t0) * 1e3,
+                    operations(Ec.Fq, lambda: p.mul(n)),
+                    min(t1) * 1e3,
+                )
+            )
+
+    print("multiplication of the generator (ms)")
+    print(
+        "%10s %22s %10s %10s %14s"
+        % ("curve", "class", "mul", "FixedBase", "(table, ms)")
+    )
+    for curve in [pallas, secp256k1, secp256r1]:
+        for name in [
+            "AffineWeierstrass",
+            "ProjectiveWeierstrass",
+            "JacobianWeierstrass",
+        ]:
+            Ec = getattr(curve, name, None)
+            if Ec is None:
+                continue
+            n = Ec.Fr.random()
+            t0 = timeit.repeat(lambda: FixedBase(Ec.generator()), number=1, repeat=3)
+            Ec.mul_generator(n)
+            t1 = timeit.repeat(lambda: Ec.generator().mul(n), number=1, repeat=5)
+            t2 = timeit.repeat(lambda: Ec.mul_generator(n), number=1, repeat=5)
+            print(
+                "%10s %22s %10.2f %10.2f %14.2f"
+                % (
+                    curve.__name__.split(".")[-1],
+                    name,
+                    min(t1) * 1e3,
+                    min(t2) * 1e3,
+                    min(t0) * 1e3,
+                )
+            )
+
+    print("sum of %d points (ms)" % SUM_POINTS)
+    print("%10s %22s %10s %12s" % ("curve", "class", "loop", "sum_points"))
+    for curve in [pallas, secp256k1]:
+        for name in [
+            "AffineWeierstrass",
+            "ProjectiveWeierstrass",
+            "JacobianWeierstrass",
+        ]:
+            Ec = getattr(curve, name, None)
+            if Ec is None:
+                continue
+            points = Ec.random_points(SUM_POINTS)
+            t0 = timeit.repeat(lambda: loop_sum(Ec, points), number=1, repeat=3)
+            t1 = timeit.repeat(lambda: Ec.sum_points(points), number=1, repeat=3)
+            print(
+                "%10s %22s %10.2f %12.2f"
+                % (curve.__name__.split(".")[-1], name, min(t0) * 1e3, min(t1) * 1e3)
+            )
+
+    print("conversion of %d points to affine coordinates (ms)" % SUM_POINTS)
+    print("%10s %22s %10s %16s" % ("curve", "class", "loop", "batch_to_affine"))
+    for curve in [pallas, secp256k1]:
+        for name in ["ProjectiveWeierstrass", "JacobianWeierstrass"]:
+            Ec = getattr(curve, name, None)
+            if Ec is None:
+                continue
+            # Non trivial Z coordinates
+            points = [p.double() for p in Ec.random_points(SUM_POINTS)]
+            t0 = timeit.repeat(
+                lambda: [p.to_affine_coordinates() for p in points], number=1, repeat=3
+            )
+            t1 = timeit.repeat(lambda: Ec.batch_to_affine(points), number=1, repeat=3)
+            print(
+                "%10s %22s %10.2f %16.2f"
+                % (curve.__name__.split(".")[-1], name, min(t0) * 1e3, min(t1) * 1e3)
+            )
+
+
+if __name__ == "__main__":
+    main()
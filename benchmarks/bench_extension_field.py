@@ -0,0 +1,87 @@
+"""Number of base field multiplications and timings of the multiplication in
+the BN254 tower, Karatsuba/Chung-Hasan compared to schoolbook.
+
+Run with
+
+    poetry run python benchmarks/bench_extension_field.py
+"""
+
+import timeit
+
+from keum import bn254, QuadraticExtensionField
+
+
+class CountingFq(bn254.Fq):
+    NB_MUL = 0
+
+    def __mul__(self, other):
+        CountingFq.NB_MUL += 1
+        return super().__mul__(other)
+
+    def square(self):
+        CountingFq.NB_MUL += 1
+        return super().square()
+
+
+class Fq2(bn254.Fq2):
+    BASE_FIELD = CountingFq
+    NON_RESIDUE = CountingFq(-1)
+
+
+class Fq6(bn254.Fq6):
+    BASE_FIELD = Fq2
+    NON_RESIDUE = Fq2(CountingFq(9), CountingFq(1))
+
+
+class Fq12(bn254.Fq12):
+    BASE_FIELD = Fq6
+    NON_RESIDUE = Fq6(Fq2.zero(), Fq2.one(), Fq2.zero())
+
+
+def schoolbook_mul(a, b):
+    if isinstance(a, CountingFq):
+        return a * b
+    x = a.coefficients()
+    y = b.coefficients()
+    mul_by_non_residue = a.mul_by_non_residue
+    if isinstance(a, QuadraticExtensionField):
+        c0 = schoolbook_mul(x[0], y[0]) + mul_by_non_residue(schoolbook_mul(x[1], y[1]))
+        c1 = schoolbook_mul(x[0], y[1]) + schoolbook_mul(x[1], y[0])
+        return a.__class__(c0, c1)
+    # Products of degree 3 and 4 wrap around with the non-residue
+    p = [[schoolbook_mul(x[i], y[j]) for j in range(3)] for i in range(3)]
+    c0 = p[0][0] + mul_by_non_residue(p[1][2] + p[2][1])
+    c1 = p[0][1] + p[1][0] + mul_by_non_residue(p[2][2])
+    c2 = p[0][2] + p[1][1] + p[2][0]
+    return a.__class__(c0, c1, c2)
+
+
+def count(f):
+    CountingFq.NB_MUL = 0
+    f()
+    return CountingFq.NB_MUL
+
+
+def main():
+    print("%-5s %22s %22s %12s" % ("", "schoolbook", "karatsuba", "square"))
+    for F in [Fq2, Fq6, Fq12]:
+        a = F.random()
+        b = F.random()
+        assert schoolbook_mul(a, b) == a * b
+        nb = [
+            count(lambda: schoolbook_mul(a, b)),
+            count(lambda: a * b),
+            count(lambda: a.square()),
+        ]
+        t = [
+            min(timeit.repeat(f, number=200, repeat=3)) / 200 * 1e6
+            for f in [lambda: schoolbook_mul(a, b), lambda: a * b, lambda: a.square()]
+        ]
+        print(
+            "%-5s %4d mul %10.1f us %4d mul %10.1f us %4d %7.1f us"
+            % (F.__name__, nb[0], t[0], nb[1], t[1], nb[2], t[2])
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Micro-benchmarks for the prime field arithmetic.
+
+Run with
+
+    poetry run python benchmarks/bench_ff.py
+
+Timings are given per operation.
+"""
+
+import timeit
+
+from keum import bn254, pallas, PrimeFieldVector
+from keum.backend import available_backends
+
+FIELDS = [
+    ("%s (%s)" % (name, backend.NAME), F.with_backend(backend))
+    for name, F in [("bn254.Fr", bn254.Fr), ("pallas.Fq", pallas.Fq)]
+    for backend in available_backends()
+]
+NUMBER = 20000
+
+
+def bench(stmt, env, number=NUMBER):
+    timer = timeit.Timer(stmt, globals=env)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main():
+    for name, F in FIELDS:
+        env = {"a": F.random(), "b": F.random(), "n": F.ORDER - 2}
+        print("%s" % name)
+        print("  add     %10.1f ns" % bench("a + b", env))
+        print("  sub     %10.1f ns" % bench("a - b", env))
+        print("  mul     %10.1f ns" % bench("a * b", env))
+        print("  square  %10.1f ns" % bench("a.square()", env))
+        print("  pow(5)  %10.1f ns" % bench("a.pow(5)", env))
+        print("  pow(p-2)%10.1f ns" % bench("a.pow(n)", env, number=200))
+        print("  inverse %10.1f ns" % bench("a.inverse()", env, number=2000))
+        env["sq"] = env["a"].square()
+        print("  sqrt    %10.1f ns" % bench("sq.sqrt_opt(True)", env, number=200))
+
+        xs = [F.random() for _ in range(1000)]
+        ys = [F.random() for _ in range(1000)]
+        env = {
+            "xs": xs,
+            "ys": ys,
+            "u": PrimeFieldVector.of_elements(F, xs),
+            "w": PrimeFieldVector.of_elements(F, ys),
+            "zero": F.zero(),
+        }
+        list_dot = "acc = zero\nfor x, y in zip(xs, ys):\n    acc += x * y"
+        list_add = "[x + y for x, y in zip(xs, ys)]"
+        print("  1000 elements, list of elements / PrimeFieldVector")
+        print("    add   %10.1f us" % (bench(list_add, env, 100) / 1e3))
+        print("    add   %10.1f us" % (bench("u + w", env, 100) / 1e3))
+        print("    dot   %10.1f us" % (bench(list_dot, env, 100) / 1e3))
+        print("    dot   %10.1f us" % (bench("u.dot(w)", env, 100) / 1e3))
+
+
+if __name__ == "__main__":
+    main()
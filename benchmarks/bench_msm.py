@@ -0,0 +1,56 @@
+"""Multi-scalar multiplication over pallas with `msm` (Pippenger), compared to
+the naive accumulation of `mul`, for 2^10 to 2^18 points. The naive timings
+are measured on at most 2^10 points and extrapolated linearly above.
+
+Run with
+
+    poetry run python benchmarks/bench_msm.py [max log2 of the number of points]
+"""
+
+import random
+import sys
+import time
+
+from keum import pallas
+
+NAIVE_MAX = 1 << 10
+
+
+def bench(f):
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def naive(Ec, points, scalars):
+    acc = Ec.zero()
+    for p, k in zip(points, scalars):
+        acc = acc + p.mul(k)
+    return acc
+
+
+def main():
+    max_log = int(sys.argv[1]) if len(sys.argv) > 1 else 18
+    rng = random.Random(0)
+    print("%22s %8s %12s %12s %8s" % ("class", "n", "naive", "msm", "speedup"))
+    for Ec in [
+        pallas.AffineWeierstrass,
+        pallas.ProjectiveWeierstrass,
+        pallas.JacobianWeierstrass,
+    ]:
+        for k in range(10, max_log + 1, 2):
+            n = 1 << k
+            points = Ec.random_points(n, rng)
+            scalars = [rng.randrange(Ec.Fr.ORDER) for _ in range(n)]
+            m = min(n, NAIVE_MAX)
+            t0 = bench(lambda: naive(Ec, points[:m], scalars[:m])) * n / m
+            t1 = bench(lambda: Ec.msm(points, scalars))
+            print(
+                "%22s %8d %10.2f s%s %10.2f s %7.1fx"
+                % (Ec.__name__, n, t0, "*" if m < n else " ", t1, t0 / t1)
+            )
+    print("* extrapolated")
+
+
+if __name__ == "__main__":
+    main()
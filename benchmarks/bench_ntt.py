@@ -0,0 +1,35 @@
+"""Timings of the number theoretic transform over bn254.Fr, for power of two
+domains and a mixed radix one.
+
+Run with
+
+    poetry run python benchmarks/bench_ntt.py
+"""
+
+import time
+
+from keum import bn254
+from keum.ntt import EvaluationDomain
+
+
+def bench(f, v):
+    start = time.perf_counter()
+    f(v)
+    return time.perf_counter() - start
+
+
+def main():
+    F = bn254.Fr
+    sizes = [1 << k for k in range(10, 21, 2)] + [3 * (1 << 16)]
+    print("%10s %12s %12s %12s" % ("n", "ntt", "intt", "coset_ntt"))
+    for n in sizes:
+        D = EvaluationDomain.of_size(F, n)
+        D.twiddles()
+        D.inverse_twiddles()
+        v = F.random_vector(n)
+        t = [bench(f, v) for f in [D.ntt, D.intt, D.coset_ntt]]
+        print("%10d %10.3f s %10.3f s %10.3f s" % (n, t[0], t[1], t[2]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Multi-scalar multiplication over pallas with `msm` on a pool of 1 to N
+worker processes, compared to the serial `msm`. The points and the scalars are
+shared with the workers through a shared memory segment. The scaling
+efficiency is the speedup divided by the number of workers.
+
+Run with
+
+    poetry run python benchmarks/bench_parallel_msm.py [log2 of the number of points] [max number of workers]
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from keum import pallas
+
+
+def bench(f):
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def main():
+    log_n = int(sys.argv[1]) if len(sys.argv) > 1 else 14
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    rng = random.Random(0)
+    n = 1 << log_n
+    print("%d points, %d CPUs" % (n, os.cpu_count()))
+    print(
+        "%22s %8s %12s %8s %10s" % ("class", "workers", "msm", "speedup", "efficiency")
+    )
+    for Ec in [pallas.AffineWeierstrass, pallas.JacobianWeierstrass]:
+        points = Ec.random_points(n, rng)
+        scalars = [rng.randrange(Ec.Fr.ORDER) for _ in range(n)]
+        t0 = bench(lambda: Ec.msm(points, scalars))
+        print("%22s %8s %10.2f s" % (Ec.__name__, "serial", t0))
+        workers = 1
+        while workers <= max_workers:
+            with ProcessPoolExecutor(workers) as executor:
+                # Start the workers before measuring
+                list(executor.map(abs, range(workers)))
+                t = bench(
+                    lambda: Ec.msm(points, scalars, workers=workers, executor=executor)
+                )
+            print(
+                "%22s %8d %10.2f s %7.2fx %9.0f%%"
+                % (Ec.__name__, workers, t, t0 / t, 100 * t0 / t / workers)
+            )
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Speedup of the parallel (four-step) number theoretic transform over
+bn254.Fr, compared to the sequential transform, for an increasing number of
+worker processes.
+
+Run with
+
+    poetry run python benchmarks/bench_parallel_ntt.py
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from keum import bn254
+from keum.ntt import EvaluationDomain
+
+
+def bench(f, v, **kwargs):
+    start = time.perf_counter()
+    f(v, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    F = bn254.Fr
+    cores = os.cpu_count() or 1
+    workers = [1 << k for k in range(cores.bit_length()) if 1 << k <= cores]
+    if workers[-1] != cores:
+        workers.append(cores)
+    print("%d cores" % cores)
+    print("%10s %8s %12s %8s" % ("n", "workers", "ntt", "speedup"))
+    for k in [16, 18, 20]:
+        n = 1 << k
+        D = EvaluationDomain.of_size(F, n)
+        D.twiddles()
+        v = F.random_vector(n)
+        t0 = bench(D.ntt, v)
+        print("%10d %8s %10.3f s %8s" % (n, "-", t0, "-"))
+        for m in workers:
+            with ProcessPoolExecutor(m) as executor:
+                # Warm up: start the workers and compute their tables
+                D.ntt(v, executor=executor)
+                t = bench(D.ntt, v, executor=executor)
+            print("%10d %8d %10.3f s %7.2fx" % (n, m, t, t0 / t))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Timings of the polynomial multiplication and division over bn254.Fr, for
+each multiplication algorithm, and of the multipoint evaluation and
+interpolation. Used to tune the thresholds of keum.polynomial.
+
+Run with
+
+    poetry run python benchmarks/bench_polynomial.py
+"""
+
+import timeit
+
+from keum import bn254
+from keum import polynomial
+from keum.polynomial import Polynomial, SubproductTree
+
+F = bn254.Fr
+
+
+def bench(f, number=3):
+    return min(timeit.repeat(f, number=1, repeat=number)) * 1e3
+
+
+def main():
+    F.backend()
+    P = F._MODULUS
+    print("multiplication of two polynomials of n coefficients (ms)")
+    print("%6s %12s %12s %12s" % ("n", "schoolbook", "karatsuba", "ntt"))
+    for k in range(4, 13):
+        n = 1 << k
+        a = Polynomial.random(F, n - 1).values
+        b = Polynomial.random(F, n - 1).values
+        size = polynomial._ntt_size(F, 2 * n - 1)
+        t = [
+            bench(lambda: [x % P for x in polynomial._mul_schoolbook(a, b)]),
+            bench(lambda: [x % P for x in polynomial._mul_karatsuba(a, b)]),
+            bench(lambda: polynomial._mul_ntt(F, a, b, size)),
+        ]
+        print("%6d %12.3f %12.3f %12.3f" % (n, t[0], t[1], t[2]))
+
+    print("division of a polynomial of 2n coefficients by one of n (ms)")
+    print("%6s %12s %12s" % ("n", "long", "newton"))
+    threshold = polynomial.NEWTON_DIVISION_THRESHOLD
+    for k in range(6, 13):
+        n = 1 << k
+        a = Polynomial.random(F, 2 * n - 1)
+        b = Polynomial.random(F, n)
+        polynomial.NEWTON_DIVISION_THRESHOLD = 1 << 30
+        t0 = bench(lambda: divmod(a, b))
+        polynomial.NEWTON_DIVISION_THRESHOLD = 1
+        t1 = bench(lambda: divmod(a, b))
+        print("%6d %12.3f %12.3f" % (n, t0, t1))
+    polynomial.NEWTON_DIVISION_THRESHOLD = threshold
+
+    print("evaluation and interpolation at n points (ms)")
+    print("%6s %12s %12s %12s %12s" % ("n", "horner", "tree", "evaluate", "interp"))
+    for k in range(8, 13):
+        n = 1 << k
+        points = F.random_vector(n)
+        a = Polynomial.random(F, n - 1)
+        elements = points.to_elements()
+        t0 = bench(lambda: [a.evaluate(x) for x in elements], number=1)
+        t1 = bench(lambda: SubproductTree(F, points))
+        tree = SubproductTree(F, points)
+        v = tree.evaluate(a)
+        tree.weights()
+        t2 = bench(lambda: tree.evaluate(a))
+        t3 = bench(lambda: tree.interpolate(v))
+        print("%6d %12.3f %12.3f %12.3f %12.3f" % (n, t0, t1, t2, t3))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,28 @@
+import importlib
+
 from .ff import *
 from .ec import *
-from . import (
-    babyjubjub,
-    secp256k1,
-    secp256r1,
-    pallas,
-    vesta,
-    tweedledee,
-    tweedledum,
-    bn254,
-    grumpkin,
+
+# The curve modules are imported on first access (e.g. `keum.pallas` or
+# `from keum import pallas`) to keep `import keum` cheap.
+CURVE_MODULES = (
+    "babyjubjub",
+    "secp256k1",
+    "secp256r1",
+    "pallas",
+    "vesta",
+    "tweedledee",
+    "tweedledum",
+    "bn254",
+    "grumpkin",
 )
+
+
+def __getattr__(name):
+    if name in CURVE_MODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + list(CURVE_MODULES))
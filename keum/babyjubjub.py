@@ -1,15 +1,55 @@
 from keum import PrimeFiniteField
-from keum import AffineWeierstrass
+from keum import AffineWeierstrass, JacobianWeierstrass
 
 
 class Fr(PrimeFiniteField):
     ORDER = 2736030358979909402780800718157159386076813972158567259200215660948447373041
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 4,
+        3: 1,
+        5: 1,
+        11: 2,
+        17: 1,
+        967: 1,
+        32151195060611136810608359: 1,
+        178259130663561045147472537592047227885001: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 31
+    TWO_ADICITY = 4
+    TWO_ADIC_ROOT_OF_UNITY = (
+        660854635938548466034658205324789272997681163813030924457091119852551226483
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        1043224705284028335988439394520573142339627108237299665735065585269676699527
+    )
 
 
 class Fq(PrimeFiniteField):
     ORDER = (
         21888242871839275222246405745257275088548364400416034343698204186575808495617
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 28,
+        3: 2,
+        13: 1,
+        29: 1,
+        983: 1,
+        11003: 1,
+        237073: 1,
+        405928799: 1,
+        1670836401704629: 1,
+        13818364434197438864469338081: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 5
+    TWO_ADICITY = 28
+    TWO_ADIC_ROOT_OF_UNITY = (
+        19103219067921713944291392827692070036145651957329286315305642004821462161904
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        776454056201908206186590970419435932130236139910903033203789591477115950462
+    )
 
 
 class AffineWeierstrass(AffineWeierstrass):
@@ -24,3 +64,14 @@ class AffineWeierstrass(AffineWeierstrass):
     GENERATOR_Y = Fq(
         16950150798460657717958625567821834550301663161624707787222815936182638968203
     )
+
+
+class JacobianWeierstrass(JacobianWeierstrass):
+    Fq = Fq
+    Fr = Fr
+    A = AffineWeierstrass.A
+    B = AffineWeierstrass.B
+    COFACTOR = AffineWeierstrass.COFACTOR
+    GENERATOR_X = AffineWeierstrass.GENERATOR_X
+    GENERATOR_Y = AffineWeierstrass.GENERATOR_Y
+    AFFINE = AffineWeierstrass
@@ -0,0 +1,109 @@
+"""Big integer backends for the residues of the prime fields.
+
+A backend defines the type of the residues stored in `PrimeFiniteField.v`, and
+the modular exponentiation and inversion used on them. Every prime field uses
+`DEFAULT_BACKEND` unless its class attribute `BACKEND` is set. The default is
+the gmpy2 backend when gmpy2 is installed, CPython integers otherwise.
+
+The residues of all backends support the integer operators (+, -, *, %,
+comparisons), mixed with Python integers. Code manipulating elements through
+the field API (e.g. keum.ec, keum.permutation) is therefore independent of the
+backend.
+"""
+
+from abc import ABCMeta
+from importlib.util import find_spec
+
+# gmpy2 is imported on first use (importing it takes longer than the rest of
+# keum), see `Gmpy2Backend.of_int`
+HAS_GMPY2 = find_spec("gmpy2") is not None
+gmpy2 = None
+
+
+def _import_gmpy2():
+    global gmpy2
+    import gmpy2
+
+    Gmpy2Backend.of_int = staticmethod(gmpy2.mpz)
+
+
+def jacobi(a: int, n: int) -> int:
+    """Jacobi symbol (a / n) for an odd positive n, without exponentiation.
+
+    The factors 2 of a are removed with shifts, using (2 / n) = -1 iff
+    n = 3, 5 mod 8, and the quadratic reciprocity swaps a and n.
+    """
+    a %= n
+    t = 1
+    while a:
+        z = (a & -a).bit_length() - 1
+        if z:
+            a >>= z
+            if z & 1 and n & 7 in (3, 5):
+                t = -t
+        if a & n & 3 == 3:
+            t = -t
+        a, n = n % a, a
+    return t if n == 1 else 0
+
+
+class Backend(metaclass=ABCMeta):
+    NAME = None
+
+    # Convert a Python integer into a residue of the backend
+    of_int = None
+
+    @staticmethod
+    def powmod(v, n: int, p):
+        return pow(v, n, p)
+
+    @staticmethod
+    def invert(v, p):
+        return pow(v, -1, p)
+
+    @staticmethod
+    def jacobi(a, n) -> int:
+        return jacobi(a, n)
+
+
+class IntBackend(Backend):
+    """CPython arbitrary precision integers."""
+
+    NAME = "int"
+    of_int = int
+
+
+class Gmpy2Backend(Backend):
+    """GMP integers through gmpy2, much faster for multiplications, reductions
+    and inversions on 256 bits integers."""
+
+    NAME = "gmpy2"
+
+    @staticmethod
+    def of_int(v):
+        # Replaced by gmpy2.mpz on the first call. The other methods are only
+        # called on residues, created by of_int.
+        _import_gmpy2()
+        return gmpy2.mpz(v)
+
+    @staticmethod
+    def powmod(v, n: int, p):
+        return gmpy2.powmod(v, n, p)
+
+    @staticmethod
+    def invert(v, p):
+        return gmpy2.invert(v, p)
+
+    @staticmethod
+    def jacobi(a, n) -> int:
+        return gmpy2.jacobi(a, n)
+
+
+def available_backends() -> list[type[Backend]]:
+    backends = [IntBackend]
+    if HAS_GMPY2:
+        backends.append(Gmpy2Backend)
+    return backends
+
+
+DEFAULT_BACKEND = Gmpy2Backend if HAS_GMPY2 else IntBackend
@@ -1,8 +1,247 @@
 from abc import ABCMeta, abstractmethod
+import functools
+import operator
+import os
 import random
+import sys
+from random import Random
 
 # From 3.11
-from typing import Self, Optional
+from typing import TYPE_CHECKING, Self, Optional
+
+if TYPE_CHECKING:
+    # The multiprocessing modules are imported by the parallel MSM only, to
+    # keep `import keum` cheap
+    from concurrent.futures import Executor
+
+
+def _random_affine_coordinates(cls, n, rng):
+    # Sample n random points of the curve (before clearing the cofactor) as
+    # affine coordinates. The x-coordinates and the signs of the y-coordinates
+    # are drawn in bulk, the candidates y^2 which are not squares are filtered
+    # out with the Jacobi symbol, and the square roots are computed in a batch.
+    rng = random if rng is None else rng
+    Fq = cls.Fq
+    p = Fq._MODULUS
+    a = cls.A.v
+    b = cls.B.v
+    coordinates = []
+    while len(coordinates) < n:
+        xs = Fq.random_vector(n - len(coordinates), rng)
+        y2s = [Fq._of_reduced((x * x * x + a * x + b) % p) for x in xs.values]
+        jacobi = Fq.BACKEND.jacobi
+        candidates = [(x, y2) for x, y2 in zip(xs, y2s) if jacobi(y2.v, p) != -1]
+        ys = Fq.batch_sqrt([y2 for _, y2 in candidates])
+        signs = rng.getrandbits(len(ys))
+        for i, ((x, _), y) in enumerate(zip(candidates, ys)):
+            if not (signs >> i) & 1:
+                y = y.negate()
+            coordinates.append((x, y))
+    return coordinates
+
+
+def _wnaf_window(nb_bits: int) -> int:
+    # Width minimizing the cost of the table, 2^(w - 2) additions, plus the
+    # nb_bits / (w + 1) additions expected with a width-w NAF
+    return min(range(2, 9), key=lambda w: (1 << (w - 2)) + nb_bits / (w + 1))
+
+
+def _wnaf_chain(n: int, w: int) -> tuple[tuple[int, int], ...]:
+    """Recode the positive scalar `n` in width-w non-adjacent form, for a
+    left-to-right scalar multiplication.
+
+    Return a chain of steps `(nb_doublings, digit)`: starting from the first
+    digit, double `nb_doublings` times, then add digit * P if the digit is
+    non-zero. Digits are odd, of absolute value smaller than 2^(w - 1), and
+    any w consecutive digits contain at most one non-zero digit. The chains
+    are not cached: the scalars are usually random or secret.
+    """
+    digits = []
+    while n:
+        if n & 1:
+            d = n & ((1 << w) - 1)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            n -= d
+        else:
+            d = 0
+        digits.append(d)
+        n >>= 1
+    chain = []
+    nb_doublings = 0
+    for d in reversed(digits):
+        if not d:
+            nb_doublings += 1
+            continue
+        chain.append((nb_doublings + 1 if chain else 0, d))
+        nb_doublings = 0
+    if nb_doublings:
+        chain.append((nb_doublings, 0))
+    return tuple(chain)
+
+
+# Maximum number of tables kept by `FixedBase.of_point`
+FIXED_BASE_CACHE_SIZE = 16
+
+
+def _scalar_to_int(n) -> int:
+    # Scalars are elements of Fr or integers (int, gmpy2.mpz, ...)
+    try:
+        return operator.index(n)
+    except TypeError:
+        return int(n.to_int())
+
+
+def _signed_digits(n: int, w: int) -> list[int]:
+    # Digits d_i in [-2^(w - 1), 2^(w - 1)] such that n = sum d_i 2^(w i),
+    # lowest first. A positive n of k bits has at most k / w + 1 digits.
+    mask = (1 << w) - 1
+    half = 1 << (w - 1)
+    digits = []
+    while n:
+        d = n & mask
+        n >>= w
+        if d > half:
+            d -= 1 << w
+            n += 1
+        digits.append(d)
+    return digits
+
+
+def _msm_window(n: int, nb_bits: int) -> int:
+    # Width c minimizing the number of additions of the bucket method:
+    # (nb_bits / c + 1) windows of n additions in the buckets, plus
+    # 2^c to sum the 2^(c - 1) buckets
+    return min(range(1, 25), key=lambda c: (nb_bits // c + 1) * (n + (1 << c)))
+
+
+# Set in a worker which started its own resource tracker, see
+# `_attach_shared_memory`
+_OWN_RESOURCE_TRACKER = False
+
+
+def _attach_shared_memory(name: str):
+    # Attach a segment created by the parent process, which unlinks it
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before Python 3.13, the segment is also registered in the resource
+    # tracker of the worker, which unlinks it when the worker exits if the
+    # worker started its own tracker (forked before the one of the parent was
+    # started). The registration is undone in that case. It relies on
+    # internals of CPython which are not needed from 3.13.
+    from multiprocessing import resource_tracker
+
+    global _OWN_RESOURCE_TRACKER
+    if os.name == "posix" and resource_tracker._resource_tracker._fd is None:
+        _OWN_RESOURCE_TRACKER = True
+    shm = shared_memory.SharedMemory(name=name)
+    if _OWN_RESOURCE_TRACKER:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _encode_point(point) -> bytes:
+    # Little endian coordinates, empty for zero
+    if point is None or point.is_zero():
+        return b""
+    return point.Fq._encode_ints(
+        [getattr(point, c).v for c in point._COORDINATES], "little"
+    )
+
+
+def _decode_point(cls, data):
+    of_reduced = cls.Fq._of_reduced
+    return cls(*[of_reduced(v) for v in cls.Fq._decode_ints_exn(data, "little")])
+
+
+def _parallel_msm(cls, pairs, window, workers, executor):
+    """Bucket method on chunks of the pairs (point, positive scalar), in the
+    processes of executor (a pool of `workers` processes if None). Return
+    the sum of the partial results, None for zero.
+
+    The coordinates and the scalars are packed in a shared memory segment:
+    the coordinates of the i-th point, little endian, at
+    i * len(_COORDINATES) * Fq.bytes_length(), followed by the scalars on
+    scalar_length bytes each. Each task gets the name of the segment and the
+    range of its points, see `_msm_task`.
+    """
+    from multiprocessing import shared_memory
+
+    if not pairs:
+        return None
+    if executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as executor:
+            return _parallel_msm(cls, pairs, window, workers, executor)
+    n = len(pairs)
+    chunks = min(n, workers or os.cpu_count() or 1)
+    point_length = len(cls._COORDINATES) * cls.Fq.bytes_length()
+    scalar_length = (max(k for _, k in pairs).bit_length() + 7) // 8
+    shm = shared_memory.SharedMemory(
+        create=True, size=n * (point_length + scalar_length)
+    )
+    try:
+        offset = cls.Fq._encode_ints_into(
+            shm.buf,
+            [getattr(p, c).v for p, _ in pairs for c in cls._COORDINATES],
+            0,
+            "little",
+        )
+        shm.buf[offset : offset + n * scalar_length] = b"".join(
+            [k.to_bytes(scalar_length, "little") for _, k in pairs]
+        )
+        futures = [
+            executor.submit(
+                _msm_task,
+                cls,
+                shm.name,
+                n,
+                i * n // chunks,
+                (i + 1) * n // chunks,
+                scalar_length,
+                window,
+            )
+            for i in range(chunks)
+        ]
+        acc = None
+        for future in futures:
+            data = future.result()
+            if data:
+                p = _decode_point(cls, data)
+                acc = p if acc is None else acc + p
+        return acc
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _msm_task(cls, name: str, n: int, start: int, stop: int, scalar_length, window):
+    """Task of `_parallel_msm`, run in a worker: MSM of the points start to
+    stop of the segment name. Return the packed coordinates of the result,
+    empty for zero."""
+    shm = _attach_shared_memory(name)
+    try:
+        point_length = len(cls._COORDINATES) * cls.Fq.bytes_length()
+        with shm.buf[start * point_length : stop * point_length] as mv:
+            points = [
+                _decode_point(cls, mv[i : i + point_length])
+                for i in range(0, len(mv), point_length)
+            ]
+        offset = n * point_length
+        from_bytes = int.from_bytes
+        with shm.buf[
+            offset + start * scalar_length : offset + stop * scalar_length
+        ] as mv:
+            scalars = [
+                from_bytes(mv[i : i + scalar_length], "little")
+                for i in range(0, len(mv), scalar_length)
+            ]
+    finally:
+        shm.close()
+    return _encode_point(cls._msm(list(zip(points, scalars)), window))
 
 
 class EllipticCurve(metaclass=ABCMeta):
@@ -26,10 +265,131 @@ class EllipticCurve(metaclass=ABCMeta):
         pass
 
     @classmethod
-    @abstractmethod
     def generator(cls) -> Self:
+        """Return (a copy of) the generator. It is validated, see
+        `_generator`, on the first call only."""
+        g = cls.__dict__.get("_GENERATOR")
+        if g is None:
+            g = cls._generator()
+            cls._GENERATOR = g
+        return g.copy()
+
+    @classmethod
+    @abstractmethod
+    def _generator(cls) -> Self:
+        # Build the generator, with the on-curve and subgroup checks
         pass
 
+    @classmethod
+    def msm(
+        cls,
+        points,
+        scalars,
+        window: Optional[int] = None,
+        workers: Optional[int] = None,
+        executor: Optional["Executor"] = None,
+    ) -> Self:
+        """Multi-scalar multiplication sum scalars[i] * points[i], the scalars
+        being elements of Fr or integers.
+
+        Pippenger's bucket method: the scalars are recoded with signed digits
+        of c bits (see `_signed_digits`). For each window of c bits, from the
+        most significant one, the accumulator is doubled c times, each point
+        (or its negation) is added in the bucket of its digit, and the sum of
+        d * bucket_d is computed with 2^c additions. c defaults to the width
+        minimizing the number of additions for the number of points and the
+        size of the scalars.
+
+        With `workers` or an `executor` (a `ProcessPoolExecutor`), the points
+        are split in `workers` chunks (the number of CPUs by default) whose
+        MSMs run in parallel, see `_parallel_msm`. A pool of `workers`
+        processes is created if no executor is given. The curve class must
+        then be importable by the workers.
+        """
+        points = list(points)
+        scalars = [_scalar_to_int(k) for k in scalars]
+        if len(points) != len(scalars):
+            raise ValueError(
+                "Expected as many scalars as points (%d != %d)"
+                % (len(scalars), len(points))
+            )
+        pairs = []
+        for p, k in zip(points, scalars):
+            if k < 0:
+                p, k = p.negate(), -k
+            if k and not p.is_zero():
+                pairs.append((p, k))
+        if window is not None and window < 1:
+            raise ValueError("The window must be at least 1")
+        if executor is not None or (workers is not None and workers > 1):
+            acc = _parallel_msm(cls, pairs, window, workers, executor)
+        else:
+            acc = cls._msm(pairs, window)
+        if acc is None or acc.is_zero():
+            return cls.zero()
+        # acc can be one of the points
+        return acc.copy()
+
+    @classmethod
+    def _msm(cls, pairs, window):
+        # Bucket method on pairs (point, positive scalar), None for zero
+        if not pairs:
+            return None
+        nb_bits = max(k for _, k in pairs).bit_length()
+        c = _msm_window(len(pairs), nb_bits) if window is None else window
+        digits = [_signed_digits(k, c) for _, k in pairs]
+        acc = None
+        for j in range(max(map(len, digits)) - 1, -1, -1):
+            if acc is not None:
+                for _ in range(c):
+                    acc = acc.double()
+            buckets = [[] for _ in range(1 << (c - 1))]
+            for (p, _), ds in zip(pairs, digits):
+                if j >= len(ds) or not ds[j]:
+                    continue
+                d = ds[j]
+                if d < 0:
+                    p, d = p.negate(), -d
+                buckets[d - 1].append(p)
+            # sum d * bucket_d as the sum of the partial sums from the top
+            running = None
+            total = None
+            for b in reversed(cls._sum_lists(buckets)):
+                if b is not None:
+                    running = b if running is None else running + b
+                if running is not None:
+                    total = running if total is None else total + running
+            if total is not None:
+                acc = total if acc is None else acc + total
+        return acc
+
+    @classmethod
+    def sum_points(cls, points) -> Self:
+        """Sum of the points. Affine points are added as a tree, with a single
+        field inversion per level, see `AffineWeierstrass.batch_add`."""
+        acc = cls._sum_lists([list(points)])[0]
+        if acc is None or acc.is_zero():
+            return cls.zero()
+        # acc can be one of the points
+        return acc.copy()
+
+    @classmethod
+    def _sum_lists(cls, lists):
+        # Sum of each list of points, None for an empty list
+        res = []
+        for points in lists:
+            acc = None
+            for p in points:
+                acc = p if acc is None else acc + p
+            res.append(acc)
+        return res
+
+    @classmethod
+    def mul_generator(cls, n) -> Self:
+        """Multiplication of the generator by n (an element of Fr or an
+        integer), with the `FixedBase` tables of the class."""
+        return FixedBase.of_generator(cls).mul(n)
+
     @classmethod
     def one(cls) -> Self:
         return cls.generator()
@@ -46,9 +406,11 @@ class EllipticCurve(metaclass=ABCMeta):
     def negate(self) -> Self:
         pass
 
+    # `rng` is a random.Random instance, to get reproducible points. The global
+    # generator of the random module is used if None.
     @classmethod
     @abstractmethod
-    def random(cls) -> Self:
+    def random(cls, rng: Optional[Random] = None) -> Self:
         pass
 
     @abstractmethod
@@ -63,6 +425,47 @@ class EllipticCurve(metaclass=ABCMeta):
     # def __mul__(self, other):
     #     pass
 
+    def mul(self, n, window: Optional[int] = None) -> Self:
+        """Scalar multiplication by n, an element of Fr or an integer (possibly
+        negative).
+
+        Left-to-right width-w NAF: the odd multiples P, 3P, ...,
+        (2^(w - 1) - 1)P are computed once per call, then each non-zero digit
+        of the recoding (see `_wnaf_chain`) costs an addition of one of them or
+        of its negation. The width defaults to the one minimizing the number of
+        additions for the size of the scalar (5 for 256 bits), and must be at
+        least 2 (NAF).
+        """
+        n = _scalar_to_int(n)
+        if n < 0:
+            return self.negate().mul(-n, window)
+        if n == 0 or self.is_zero():
+            return self.zero()
+        w = _wnaf_window(n.bit_length()) if window is None else window
+        if w < 2:
+            raise ValueError("The window must be at least 2")
+        chain = _wnaf_chain(n, w)
+        # Odd multiples P, 3P, ..., up to the largest digit (at most
+        # (2^(w - 1) - 1)P)
+        table = [self]
+        top = max(abs(digit) for _, digit in chain) >> 1
+        if top:
+            double = self.double()
+            for _ in range(top):
+                table.append(table[-1] + double)
+        _, digit = chain[0]
+        acc = table[digit >> 1]
+        if acc is self:
+            acc = self.copy()
+        for nb_doublings, digit in chain[1:]:
+            for _ in range(nb_doublings):
+                acc = acc.double()
+            if digit > 0:
+                acc = acc + table[digit >> 1]
+            elif digit < 0:
+                acc = acc + table[-digit >> 1].negate()
+        return acc
+
 
 class Weierstrass(EllipticCurve, metaclass=ABCMeta):
     A = None
@@ -78,9 +481,12 @@ class AffineWeierstrass(Weierstrass, metaclass=ABCMeta):
     Fr = None
 
     @classmethod
-    def generator(cls):
+    def _generator(cls):
         return cls.from_coordinates_exn(cls.GENERATOR_X, cls.GENERATOR_Y)
 
+    # Coordinates, in the order of the constructor
+    _COORDINATES = ("x", "y")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -152,19 +558,6 @@ class AffineWeierstrass(Weierstrass, metaclass=ABCMeta):
         y3 = tmp1 - (tmp2 / tmp3) - self.y
         return self.__class__(x3, y3)
 
-    def mul(self, n):
-        def aux(x, n):
-            if n == 0:
-                return self.__class__.zero()
-            elif n == 1:
-                return x.copy()
-            elif n % 2 == 0:
-                return aux(x.double(), n / 2)
-            else:
-                return x + aux(x, n - 1)
-
-        return aux(self, n.to_int())
-
     def __eq__(self, other):
         if self.is_zero() and other.is_zero():
             return True
@@ -174,6 +567,11 @@ class AffineWeierstrass(Weierstrass, metaclass=ABCMeta):
             return False
         return (self.x == other.x) and (self.y == other.y)
 
+    def __hash__(self):
+        if self.is_zero():
+            return hash((self.__class__.__name__, None))
+        return hash((self.x, self.y))
+
     # https://hyperelliptic.org/EFD/g1p/auto-shortw.html
     def __add__(self, other):
         if self.is_zero() and other.is_zero():
@@ -212,18 +610,104 @@ class AffineWeierstrass(Weierstrass, metaclass=ABCMeta):
         return self.__class__(self.x, self.y.negate())
 
     @classmethod
-    def random(cls):
+    def batch_add(cls, pairs) -> list[Self]:
+        """Sums p + q of the pairs (p, q), sharing a single field inversion.
+
+        The slopes of all the additions are computed with Montgomery's trick,
+        so that each addition costs about 6 multiplications instead of an
+        inversion. Doublings, opposite points and the point at infinity are
+        handled as in `__add__`.
+        """
+        pairs = list(pairs)
+        of_reduced = cls.Fq._of_reduced
+        sums = cls._add_values_many(
+            [tuple(None if p.is_zero() else (p.x.v, p.y.v) for p in pq) for pq in pairs]
+        )
+        return [
+            cls.zero() if r is None else cls(of_reduced(r[0]), of_reduced(r[1]))
+            for r in sums
+        ]
+
+    @classmethod
+    def _add_values_many(cls, pairs):
+        # Additions of the pairs of points given by the residues (x, y) of
+        # their coordinates, None for zero, with a single inversion
+        p = cls.Fq._MODULUS
+        a = cls.A.v
+        res = [None] * len(pairs)
+        numerators = [0] * len(pairs)
+        denominators = [0] * len(pairs)
+        for i, (p1, p2) in enumerate(pairs):
+            if p1 is None or p2 is None:
+                res[i] = p2 if p1 is None else p1
+                continue
+            (x1, y1), (x2, y2) = p1, p2
+            if x1 != x2:
+                # (y2 - y1) / (x2 - x1)
+                numerators[i] = y2 - y1
+                denominators[i] = (x2 - x1) % p
+            elif y1 == y2 and y1:
+                # (3 x1^2 + a) / (2 y1)
+                numerators[i] = 3 * x1 * x1 + a
+                denominators[i] = 2 * y1 % p
+            # Otherwise p2 = -p1 and the sum is zero
+        inverses = cls.Fq._batch_inverse_values(denominators, True)
+        for i, d in enumerate(denominators):
+            if not d:
+                continue
+            (x1, y1), (x2, _) = pairs[i]
+            slope = numerators[i] * inverses[i] % p
+            x3 = (slope * slope - x1 - x2) % p
+            res[i] = (x3, (slope * (x1 - x3) - y1) % p)
+        return res
+
+    @classmethod
+    def _sum_lists(cls, lists):
+        # Tree sums, adding the points of all the lists two by two with one
+        # batch inversion per level
+        of_reduced = cls.Fq._of_reduced
+        levels = [
+            [(p.x.v, p.y.v) for p in points if not p.is_zero()] for points in lists
+        ]
+        while any(len(level) > 1 for level in levels):
+            pairs = []
+            for level in levels:
+                pairs += zip(level[0::2], level[1::2])
+            sums = cls._add_values_many(pairs)
+            start = 0
+            for i, level in enumerate(levels):
+                k = len(level) // 2
+                levels[i] = [r for r in sums[start : start + k] if r is not None]
+                levels[i] += level[2 * k :]
+                start += k
+        return [
+            cls(of_reduced(level[0][0]), of_reduced(level[0][1])) if level else None
+            for level in levels
+        ]
+
+    @classmethod
+    def random(cls, rng: Optional[Random] = None):
+        rng = random if rng is None else rng
         y = None
         while y is None:
-            x = cls.Fq.random()
+            x = cls.Fq.random(rng)
             x2 = x * x
             x3 = x2 * x
             y2 = x3 + cls.A * x + cls.B
-            # FIXME: seed
-            sign = bool(random.getrandbits(1))
+            if not y2.is_quadratic_residue():
+                continue
+            sign = bool(rng.getrandbits(1))
             y = y2.sqrt_opt(sign=sign)
         return cls(x, y).mul(cls.Fr(cls.COFACTOR))
 
+    @classmethod
+    def random_points(cls, n: int, rng: Optional[Random] = None) -> list[Self]:
+        points = [cls(x, y) for (x, y) in _random_affine_coordinates(cls, n, rng)]
+        if cls.COFACTOR != 1:
+            cofactor = cls.Fr(cls.COFACTOR)
+            points = [p.mul(cofactor) for p in points]
+        return points
+
     def to_compressed_bytes(self):
         raise Exception("Not implemented")
 
@@ -236,20 +720,128 @@ class AffineWeierstrass(Weierstrass, metaclass=ABCMeta):
         return not p_cof.is_zero()
 
 
-class ProjectiveWeierstrass(Weierstrass, metaclass=ABCMeta):
-    CHECKED_PARAMETERS = False
-    GENERATOR_X = None
-    GENERATOR_Y = None
-    GENERATOR_Z = None
+class _WeightedWeierstrass(Weierstrass, metaclass=ABCMeta):
+    """Points (X, Y, Z) representing the affine point (X / Z^i, Y / Z^j), where
+    (i, j) is `_Z_EXPONENTS`: (1, 1) for projective coordinates, (2, 3) for
+    Jacobian coordinates. The point at infinity has Z = 0."""
+
+    # Class of the affine points of the curve, see `to_affine`
+    AFFINE = None
     # Redefining for typing
     Fq = None
     Fr = None
 
+    _COORDINATES = ("x", "y", "z")
+    _Z_EXPONENTS = None
+
     def __init__(self, x, y, z):
         self.x = x
         self.y = y
         self.z = z
 
+    def copy(self):
+        return self.__class__(x=self.x.copy(), y=self.y.copy(), z=self.z.copy())
+
+    def negate(self):
+        return self.__class__(x=self.x, y=self.y.negate(), z=self.z)
+
+    @classmethod
+    def _z_powers(cls, z):
+        """Return (z^i, z^j) for (i, j) = `_Z_EXPONENTS`."""
+        i, j = cls._Z_EXPONENTS
+        zi = z
+        for _ in range(i - 1):
+            zi = zi * z
+        zj = zi
+        for _ in range(j - i):
+            zj = zj * z
+        return zi, zj
+
+    def __eq__(self, other):
+        # X1 Z2^i = X2 Z1^i and Y1 Z2^j = Y2 Z1^j, without inversion
+        if self.z.is_zero() or other.z.is_zero():
+            return self.z.is_zero() and other.z.is_zero()
+        z1i, z1j = self._z_powers(self.z)
+        z2i, z2j = self._z_powers(other.z)
+        if self.x * z2i != other.x * z1i:
+            return False
+        return self.y * z2j == other.y * z1j
+
+    def __hash__(self):
+        # Hash of the affine coordinates, to be consistent with the equality.
+        # It costs an inversion.
+        if self.z.is_zero():
+            return hash((self.__class__.__name__, None))
+        return hash(self.to_affine_coordinates())
+
+    def to_affine_coordinates(self) -> Optional[tuple]:
+        """Return (x, y), or None for the point at infinity."""
+        if self.z.is_zero():
+            return None
+        z_inv_i, z_inv_j = self._z_powers(self.z.inverse())
+        return (self.x * z_inv_i, self.y * z_inv_j)
+
+    def to_affine(self):
+        """Return the point as an element of `AFFINE`."""
+        return self.batch_to_affine([self])[0]
+
+    @classmethod
+    def batch_to_affine(cls, points) -> list:
+        """Normalize the points to `AFFINE` (X / Z^i, Y / Z^j) with a single
+        inversion, see `PrimeFiniteField.batch_inverse`."""
+        points = list(points)
+        p = cls.Fq._MODULUS
+        of_reduced = cls.Fq._of_reduced
+        i, j = cls._Z_EXPONENTS
+        inverses = cls.Fq._batch_inverse_values([q.z.v for q in points], True)
+        res = []
+        for q, z_inv in zip(points, inverses):
+            if q.z.is_zero():
+                res.append(cls.AFFINE.zero())
+                continue
+            # Same chain of multiplications as `_z_powers`, on residues
+            z_inv_i = z_inv
+            for _ in range(i - 1):
+                z_inv_i = z_inv_i * z_inv % p
+            z_inv_j = z_inv_i
+            for _ in range(j - i):
+                z_inv_j = z_inv_j * z_inv % p
+            x = q.x.v * z_inv_i % p
+            y = q.y.v * z_inv_j % p
+            res.append(cls.AFFINE(of_reduced(x), of_reduced(y)))
+        return res
+
+    @classmethod
+    def is_in_prime_subgroup(cls, x: Fq, y: Fq, z: Fq):
+        p = cls(x=x, y=y, z=z)
+        if p.is_zero():
+            return True
+        p_cof = p.mul(cls.Fr(cls.COFACTOR))
+        return not p_cof.is_zero()
+
+    @classmethod
+    def random_points(cls, n: int, rng: Optional[Random] = None) -> list[Self]:
+        z = cls.Fq.one()
+        points = [
+            cls(x=x, y=y, z=z) for (x, y) in _random_affine_coordinates(cls, n, rng)
+        ]
+        if cls.COFACTOR != 1:
+            cofactor = cls.Fr(cls.COFACTOR)
+            points = [p.mul(cofactor) for p in points]
+        return points
+
+
+class ProjectiveWeierstrass(_WeightedWeierstrass, metaclass=ABCMeta):
+    CHECKED_PARAMETERS = False
+    GENERATOR_X = None
+    GENERATOR_Y = None
+    GENERATOR_Z = None
+    # Redefining for typing
+    Fq = None
+    Fr = None
+
+    _Z_EXPONENTS = (1, 1)
+
     @classmethod
     def zero(cls):
         return cls(x=cls.Fq.zero(), y=cls.Fq.one(), z=cls.Fq.zero())
@@ -257,9 +849,6 @@ class ProjectiveWeierstrass(Weierstrass, metaclass=ABCMeta):
     def is_zero(self):
         return self.x.is_zero() and self.z.is_zero()
 
-    def copy(self):
-        return self.__class__(x=self.x.copy(), y=self.y.copy(), z=self.z.copy())
-
     def __add__(self, other):
         if self.is_zero():
             return other.copy()
@@ -303,31 +892,6 @@ class ProjectiveWeierstrass(Weierstrass, metaclass=ABCMeta):
     def double(self):
         return self + self
 
-    def __eq__(self, other):
-        if self.z.is_zero() and other.z.is_zero():
-            return True
-        elif self.z.is_zero() or other.z.is_zero():
-            return False
-        else:
-            x1 = self.x / self.z
-            x2 = other.x / other.z
-            y1 = self.y / self.z
-            y2 = other.y / other.z
-            return x1 == x2 and y1 == y2
-
-    def mul(self, n):
-        def aux(x, n):
-            if n == 0:
-                return self.__class__.zero()
-            elif n == 1:
-                return x.copy()
-            elif n % 2 == 0:
-                return aux(x.double(), n / 2)
-            else:
-                return x + aux(x, n - 1)
-
-        return aux(self, n.to_int())
-
     def to_be_bytes(self):
         x_be = self.x.to_be_bytes()
         y_be = self.y.to_be_bytes()
@@ -390,14 +954,6 @@ class ProjectiveWeierstrass(Weierstrass, metaclass=ABCMeta):
         rhs = x3 + ax + cls.B
         return lhs == rhs
 
-    @classmethod
-    def is_in_prime_subgroup(cls, x: Fq, y: Fq, z: Fq):
-        p = cls(x=x, y=y, z=z)
-        if p.is_zero():
-            return True
-        p_cof = p.mul(cls.Fr(cls.COFACTOR))
-        return not p_cof.is_zero()
-
     @classmethod
     def from_affine_coordinates_exn(cls, x: Fq, y: Fq) -> Self:
         z = cls.Fq.one()
@@ -422,16 +978,18 @@ class ProjectiveWeierstrass(Weierstrass, metaclass=ABCMeta):
             return None
 
     @classmethod
-    def random(cls):
+    def random(cls, rng: Optional[Random] = None):
+        rng = random if rng is None else rng
         z = cls.Fq.one()
         y = None
         while y is None:
-            x = cls.Fq.random()
+            x = cls.Fq.random(rng)
             x2 = x * x
             x3 = x2 * x
             y2 = x3 + cls.A * x + cls.B
-            # FIXME: seed
-            sign = bool(random.getrandbits(1))
+            if not y2.is_quadratic_residue():
+                continue
+            sign = bool(rng.getrandbits(1))
             y = y2.sqrt_opt(sign=sign)
         return cls(x=x, y=y, z=z).mul(cls.Fr(cls.COFACTOR))
 
@@ -449,11 +1007,277 @@ class ProjectiveWeierstrass(Weierstrass, metaclass=ABCMeta):
         else:
             raise ValueError("This is not a valid point on the curve")
 
-    def negate(self):
-        return self.__class__(x=self.x, y=self.y.negate(), z=self.z)
-
     @classmethod
-    def generator(cls):
+    def _generator(cls):
         return cls.from_coordinates_exn(
             x=cls.GENERATOR_X, y=cls.GENERATOR_Y, z=cls.GENERATOR_Z
         )
+
+
+class JacobianWeierstrass(_WeightedWeierstrass, metaclass=ABCMeta):
+    """Points in Jacobian coordinates (X, Y, Z), representing the affine point
+    (X / Z^2, Y / Z^3). The point at infinity has Z = 0.
+
+    The doubling formula is chosen from A when the class is created: a = 0
+    (dbl-2009-l, 2M + 5S) and a = -3 (dbl-2001-b, 3M + 5S) are specialized,
+    other curves use dbl-2007-bl (1M + 8S). Additions use add-2007-bl
+    (11M + 5S), or madd-2007-bl (7M + 4S) with an affine point, see
+    `add_mixed`. The formulas come from
+    https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html.
+    """
+
+    CHECKED_PARAMETERS = False
+    GENERATOR_X = None
+    GENERATOR_Y = None
+    # Redefining for typing
+    Fq = None
+    Fr = None
+
+    _Z_EXPONENTS = (2, 3)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.A is None:
+            return
+        if cls.A.is_zero():
+            cls._double = cls._double_a_zero
+        elif (cls.A + cls.Fq(3)).is_zero():
+            cls._double = cls._double_a_minus_three
+        else:
+            cls._double = cls._double_generic
+
+    @classmethod
+    def zero(cls):
+        return cls(x=cls.Fq.one(), y=cls.Fq.one(), z=cls.Fq.zero())
+
+    def is_zero(self):
+        return self.z.is_zero()
+
+    @classmethod
+    def _generator(cls):
+        return cls.from_affine_coordinates_exn(x=cls.GENERATOR_X, y=cls.GENERATOR_Y)
+
+    @classmethod
+    def __check_parameters(cls):
+        if not cls.CHECKED_PARAMETERS:
+            assert cls.A is not None
+            assert cls.B is not None
+            assert cls.COFACTOR is not None
+            assert cls.GENERATOR_X is not None
+            assert cls.GENERATOR_Y is not None
+            cls.CHECKED_PARAMETERS = True
+
+    def double(self):
+        if self.z.is_zero():
+            return self.zero()
+        return self._double()
+
+    def _double_a_zero(self):
+        # dbl-2009-l
+        a = self.x.square()
+        b = self.y.square()
+        c = b.square()
+        d = ((self.x + b).square() - a - c).double()
+        e = a.double() + a
+        f = e.square()
+        x3 = f - d.double()
+        y3 = e * (d - x3) - c.double().double().double()
+        z3 = (self.y * self.z).double()
+        return self.__class__(x=x3, y=y3, z=z3)
+
+    def _double_a_minus_three(self):
+        # dbl-2001-b
+        delta = self.z.square()
+        gamma = self.y.square()
+        beta = self.x * gamma
+        alpha = (self.x - delta) * (self.x + delta)
+        alpha = alpha.double() + alpha
+        beta4 = beta.double().double()
+        x3 = alpha.square() - beta4.double()
+        z3 = (self.y + self.z).square() - gamma - delta
+        y3 = alpha * (beta4 - x3) - gamma.square().double().double().double()
+        return self.__class__(x=x3, y=y3, z=z3)
+
+    def _double_generic(self):
+        # dbl-2007-bl
+        xx = self.x.square()
+        yy = self.y.square()
+        yyyy = yy.square()
+        zz = self.z.square()
+        s = ((self.x + yy).square() - xx - yyyy).double()
+        m = xx.double() + xx + self.A * zz.square()
+        t = m.square() - s.double()
+        y3 = m * (s - t) - yyyy.double().double().double()
+        z3 = (self.y + self.z).square() - yy - zz
+        return self.__class__(x=t, y=y3, z=z3)
+
+    def __add__(self, other):
+        # add-2007-bl
+        if self.z.is_zero():
+            return other.copy()
+        if other.z.is_zero():
+            return self.copy()
+        z1z1 = self.z.square()
+        z2z2 = other.z.square()
+        u1 = self.x * z2z2
+        u2 = other.x * z1z1
+        s1 = self.y * other.z * z2z2
+        s2 = other.y * self.z * z1z1
+        h = u2 - u1
+        r = (s2 - s1).double()
+        if h.is_zero():
+            if r.is_zero():
+                return self.double()
+            return self.zero()
+        i = h.double().square()
+        j = h * i
+        v = u1 * i
+        x3 = r.square() - j - v.double()
+        y3 = r * (v - x3) - (s1 * j).double()
+        z3 = ((self.z + other.z).square() - z1z1 - z2z2) * h
+        return self.__class__(x=x3, y=y3, z=z3)
+
+    def add_mixed(self, other):
+        """Addition of an affine point (e.g. an `AffineWeierstrass` point of
+        the same curve), cheaper than an addition of Jacobian points."""
+        # madd-2007-bl
+        if other.is_zero():
+            return self.copy()
+        if self.z.is_zero():
+            return self.__class__(x=other.x, y=other.y, z=self.Fq.one())
+        z1z1 = self.z.square()
+        u2 = other.x * z1z1
+        s2 = other.y * self.z * z1z1
+        h = u2 - self.x
+        r = (s2 - self.y).double()
+        if h.is_zero():
+            if r.is_zero():
+                return self.double()
+            return self.zero()
+        hh = h.square()
+        i = hh.double().double()
+        j = h * i
+        v = self.x * i
+        x3 = r.square() - j - v.double()
+        y3 = r * (v - x3) - (self.y * j).double()
+        z3 = (self.z + h).square() - z1z1 - hh
+        return self.__class__(x=x3, y=y3, z=z3)
+
+    @classmethod
+    def is_on_curve(cls, x: Fq, y: Fq, z: Fq) -> bool:
+        # Y^2 = X^3 + a X Z^4 + b Z^6
+        if z.is_zero():
+            return True
+        z2 = z.square()
+        z4 = z2.square()
+        return y.square() == x.square() * x + cls.A * x * z4 + cls.B * z4 * z2
+
+    @classmethod
+    def from_coordinates_opt(cls, x: Fq, y: Fq, z: Fq) -> Optional[Self]:
+        cls.__check_parameters()
+        if cls.is_on_curve(x=x, y=y, z=z) and cls.is_in_prime_subgroup(x=x, y=y, z=z):
+            return cls(x=x, y=y, z=z)
+        else:
+            return None
+
+    @classmethod
+    def from_coordinates_exn(cls, x: Fq, y: Fq, z: Fq) -> Self:
+        p = cls.from_coordinates_opt(x=x, y=y, z=z)
+        if p is None:
+            raise ValueError("This is not a valid point on the curve")
+        return p
+
+    @classmethod
+    def from_affine_coordinates_opt(cls, x: Fq, y: Fq) -> Optional[Self]:
+        assert isinstance(x, cls.Fq)
+        assert isinstance(y, cls.Fq)
+        return cls.from_coordinates_opt(x=x, y=y, z=cls.Fq.one())
+
+    @classmethod
+    def from_affine_coordinates_exn(cls, x: Fq, y: Fq) -> Self:
+        assert isinstance(x, cls.Fq)
+        assert isinstance(y, cls.Fq)
+        return cls.from_coordinates_exn(x=x, y=y, z=cls.Fq.one())
+
+    @classmethod
+    def random(cls, rng: Optional[Random] = None):
+        ((x, y),) = _random_affine_coordinates(cls, 1, rng)
+        return cls(x=x, y=y, z=cls.Fq.one()).mul(cls.Fr(cls.COFACTOR))
+
+
+class FixedBase:
+    """Precomputed multiples of a point P, for the scalar multiplications of a
+    base used many times (e.g. a generator).
+
+    The scalars are recoded with signed digits d_i in [-2^(w - 1), 2^(w - 1)],
+    i.e. n = sum d_i 2^(w i), and row i of the table holds
+    2^(w i) P, 2 * 2^(w i) P, ..., 2^(w - 1) * 2^(w i) P. A multiplication is
+    then one addition per non-zero digit and no doubling: about
+    bits(Fr) / w additions, against bits(Fr) doublings and
+    bits(Fr) / (w + 1) additions with `EllipticCurve.mul`. The table holds
+    about 2^(w - 1) bits(Fr) / w points.
+    """
+
+    __slots__ = ("point", "window", "bits", "rows")
+
+    def __init__(self, point, window: int = 5):
+        if window < 1:
+            raise ValueError("The window must be at least 1")
+        self.point = point.copy()
+        self.window = window
+        # Scalars of bits(Fr) bits have at most bits(Fr) / w + 1 signed digits
+        self.bits = point.Fr.ORDER.bit_length()
+        nb_rows = (self.bits + window) // window
+        half = 1 << (window - 1)
+        rows = []
+        base = self.point
+        for _ in range(nb_rows):
+            row = [base]
+            for _ in range(half - 1):
+                row.append(row[-1] + base)
+            rows.append(row)
+            # 2^w times the base of the row
+            base = row[-1].double()
+        self.rows = rows
+
+    @classmethod
+    def of_point(cls, point, window: int = 5) -> "FixedBase":
+        """Return the table of the point, from a cache keeping the
+        `FIXED_BASE_CACHE_SIZE` most recently used tables."""
+        return _fixed_base(cls, point.__class__, point, window)
+
+    @classmethod
+    def of_generator(cls, curve) -> "FixedBase":
+        """Return the table of the generator of the curve class, built on the
+        first call."""
+        table = curve.__dict__.get("_GENERATOR_FIXED_BASE")
+        if table is None:
+            table = cls(curve.generator())
+            curve._GENERATOR_FIXED_BASE = table
+        return table
+
+    def __repr__(self):
+        return "FixedBase(%s, window=%d)" % (self.point.__class__.__name__, self.window)
+
+    def mul(self, n):
+        """Multiplication of the point by n, an element of Fr or an integer."""
+        n = _scalar_to_int(n)
+        if n < 0:
+            return self.mul(-n).negate()
+        if n >> self.bits:
+            # Larger than the table
+            return self.point.mul(n)
+        acc = self.point.zero()
+        for row, d in zip(self.rows, _signed_digits(n, self.window)):
+            if d > 0:
+                acc = acc + row[d - 1]
+            elif d < 0:
+                acc = acc + row[-d - 1].negate()
+        return acc
+
+
+@functools.lru_cache(maxsize=FIXED_BASE_CACHE_SIZE)
+def _fixed_base(cls, curve, point, window):
+    # The curve class comes before the point in the key of the cache, so that
+    # the points of different curves are never compared.
+    return cls(point, window)
@@ -1,10 +1,184 @@
-from abc import ABC, abstractmethod
-import sympy
+from abc import ABC, ABCMeta, abstractmethod
+import functools
+import itertools
+import json
+import operator
+import os
 import random
-from typing import Self
+from random import Random
+from typing import Iterator, Optional, Self
 
+from .backend import DEFAULT_BACKEND
 
-class FiniteField(ABC):
+# Bypasses __init__. Used by the trusted constructors on the hot paths.
+_object_new = object.__new__
+
+# Directory where the metadata of the prime fields which do not ship static
+# tables (i.e. the factorization of ORDER - 1, which can be very long to
+# compute) is cached. Caching is disabled if None.
+METADATA_CACHE_DIR = os.environ.get("KEUM_CACHE_DIR")
+
+
+def _metadata_cache_path(order: int) -> Optional[str]:
+    if METADATA_CACHE_DIR is None:
+        return None
+    return os.path.join(METADATA_CACHE_DIR, "prime-field-%x.json" % order)
+
+
+def _load_cached_prime_decomposition(order: int) -> Optional[dict[int, int]]:
+    # None if there is no cache, or if it is corrupted or does not match the
+    # order (it is then recomputed and overwritten)
+    path = _metadata_cache_path(order)
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            metadata = json.load(f)
+        if int(metadata["order"]) != order:
+            return None
+        res = {int(q): e for q, e in metadata["prime_decomposition"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    product = 1
+    for q, e in res.items():
+        if type(e) is not int or e < 1 or not _is_probable_prime(q):
+            return None
+        product *= q**e
+    if product != order - 1:
+        return None
+    return res
+
+
+def _store_cached_prime_decomposition(order: int, prime_decomposition):
+    path = _metadata_cache_path(order)
+    if path is None:
+        return
+    os.makedirs(METADATA_CACHE_DIR, exist_ok=True)
+    metadata = {
+        "order": str(order),
+        "prime_decomposition": {str(q): e for q, e in prime_decomposition.items()},
+    }
+    # Write then rename to never leave a partially written file
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    with open(tmp_path, "w") as f:
+        json.dump(metadata, f)
+    os.replace(tmp_path, path)
+
+
+# Bases of the Miller-Rabin test of `_is_probable_prime`, the primes below 72.
+# The test is deterministic below _MILLER_RABIN_BOUND with the first 13 of them.
+_MILLER_RABIN_BASES = tuple(q for q in range(2, 72) if all(q % d for d in range(2, q)))
+_MILLER_RABIN_BOUND = 3317044064679887385961981
+
+
+def _is_probable_prime(n: int) -> bool:
+    # Strong probable prime test to the bases _MILLER_RABIN_BASES
+    if n < 2:
+        return False
+    for b in _MILLER_RABIN_BASES:
+        if n % b == 0:
+            return n == b
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    bases = _MILLER_RABIN_BASES
+    if n < _MILLER_RABIN_BOUND:
+        bases = bases[:13]
+    for b in bases:
+        x = pow(b, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _check_lucas_certificate(p: int, prime_decomposition, g: int):
+    """Check that p is prime with Lucas' test: the factors q of p - 1 are
+    prime (strong probable primes, see `_is_probable_prime`), their product is
+    p - 1, g^(p - 1) = 1 mod p and g^((p - 1) / q) != 1 mod p for each q, i.e.
+    g has order p - 1. Raise a ValueError otherwise."""
+    if prime_decomposition is None or g is None:
+        raise ValueError(
+            "A trusted prime order requires PRIME_DECOMPOSITION and "
+            "MULTIPLICATIVE_GENERATOR"
+        )
+    product = 1
+    for q, e in prime_decomposition.items():
+        if not _is_probable_prime(q):
+            raise ValueError("%d is not prime, in the factorization of %d" % (q, p - 1))
+        product *= q**e
+    if p < 2 or product != p - 1:
+        raise ValueError("The factorization does not match %d - 1" % p)
+    if pow(g, p - 1, p) != 1 or any(
+        pow(g, (p - 1) // q, p) == 1 for q in prime_decomposition
+    ):
+        raise ValueError("%d does not have order %d - 1 modulo %d" % (g, p, p))
+
+
+# Exponents below this bound use plain square-and-multiply in FiniteField.pow.
+_TINY_EXPONENT_BOUND = 1 << 4
+
+
+@functools.lru_cache(maxsize=256)
+def _sliding_window_chain(n: int) -> tuple[int, tuple[tuple[int, int], ...]]:
+    """Recode the exponent `n` for a left-to-right sliding-window exponentiation.
+
+    Return the window size `w` and a chain of steps `(nb_squarings, digit)`:
+    starting from the first digit, square `nb_squarings` times, then multiply
+    by x^digit if the digit is non-zero. Digits are odd and smaller than 2^w.
+    A NAF recoding would save a few more multiplications but requires an
+    inversion per exponentiation, which is not worth it in a field.
+    The chains only depend on the exponent and are cached, as the same
+    exponents (ORDER - 2, (ORDER - 1) / 2, the S-box exponent of a
+    permutation, ...) are used over and over.
+    """
+    nb_bits = n.bit_length()
+    if nb_bits <= 32:
+        w = 2
+    elif nb_bits <= 96:
+        w = 3
+    elif nb_bits <= 256:
+        w = 4
+    else:
+        w = 5
+    chain = []
+    nb_squarings = 0
+    i = nb_bits - 1
+    while i >= 0:
+        if not (n >> i) & 1:
+            nb_squarings += 1
+            i -= 1
+            continue
+        # Longest window of at most w bits starting at bit i and ending with a 1
+        j = max(i - w + 1, 0)
+        while not (n >> j) & 1:
+            j += 1
+        digit = (n >> j) & ((1 << (i - j + 1)) - 1)
+        chain.append((nb_squarings + i - j + 1 if chain else 0, digit))
+        nb_squarings = 0
+        i = j - 1
+    if nb_squarings:
+        chain.append((nb_squarings, 0))
+    return w, tuple(chain)
+
+
+class FiniteFieldMeta(ABCMeta):
+    # Give every field class an empty __slots__ unless it defines its own, so
+    # that the elements of user-defined fields (e.g. `class F13(PrimeFiniteField)`)
+    # do not carry a __dict__.
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
+class FiniteField(ABC, metaclass=FiniteFieldMeta):
     ORDER = None
     # This is set to True when a first object is instantiated. It avoids potential heavy computation
     ORDER_CHECK_PERFORMED = False
@@ -12,7 +186,7 @@ class FiniteField(ABC):
     def __init__(self, v):
         if not self.ORDER_CHECK_PERFORMED:
             assert self.ORDER is not None
-            self.ORDER_CHECK_PERFORMED = True
+            self.__class__.ORDER_CHECK_PERFORMED = True
         self.v = v % self.ORDER
 
     @classmethod
@@ -76,18 +250,52 @@ class FiniteField(ABC):
     def sqrt_opt(self, sign: bool):
         pass
 
-    @abstractmethod
     def pow(self, n):
-        pass
+        """Exponentiation by a non-negative integer `n`.
+
+        Generic left-to-right sliding-window exponentiation, only relying on
+        `one`, `square` and `__mul__`. The recoding of the exponent is cached
+        (see `_sliding_window_chain`), so that exponentiations by a fixed
+        exponent only pay for the table of odd powers and the chain itself.
+        Subclasses with a faster exponentiation can override it.
+        """
+        if n < 0:
+            raise ValueError("The exponent must be non-negative")
+        if n < _TINY_EXPONENT_BOUND:
+            # Tiny exponents (e.g. the Poseidon S-box x^5, x^7): plain
+            # square-and-multiply, no table to precompute.
+            if n == 0:
+                return self.one()
+            acc = self
+            for b in format(n, "b")[1:]:
+                acc = acc.square()
+                if b == "1":
+                    acc = acc * self
+            return acc
+        w, chain = _sliding_window_chain(n)
+        # Odd powers x, x^3, ..., x^(2^w - 1)
+        x2 = self.square()
+        table = [self]
+        for _ in range((1 << (w - 1)) - 1):
+            table.append(table[-1] * x2)
+        _, digit = chain[0]
+        acc = table[digit >> 1]
+        for nb_squarings, digit in chain[1:]:
+            for _ in range(nb_squarings):
+                acc = acc.square()
+            if digit:
+                acc = acc * table[digit >> 1]
+        return acc
 
     @abstractmethod
     def inverse(self):
         pass
 
-    # Add a seed
+    # `rng` is a random.Random instance, to get reproducible values. The global
+    # generator of the random module is used if None.
     @classmethod
     @abstractmethod
-    def random(cls):
+    def random(cls, rng: Optional[Random] = None):
         pass
 
     @abstractmethod
@@ -101,18 +309,113 @@ class FiniteField(ABC):
 
 
 class PrimeFiniteField(FiniteField):
+    __slots__ = ("v",)
+    # Metadata of the field. The bundled fields define them statically,
+    # otherwise they are computed when first needed:
+    # - the factorization of ORDER - 1, as a dictionary prime -> exponent
     PRIME_DECOMPOSITION = None
+    # - the smallest generator of the multiplicative group
+    MULTIPLICATIVE_GENERATOR = None
+    # - the largest s such that 2^s divides ORDER - 1
+    TWO_ADICITY = None
+    # - the primitive 2^s-th root of unity MULTIPLICATIVE_GENERATOR^((p-1)/2^s)
+    #   and its inverse
+    TWO_ADIC_ROOT_OF_UNITY = None
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = None
+    SQRT_PARAMETERS = None
+    _ZERO = None
+    _ONE = None
+    # Set to True for well-known prime orders (e.g. the fields of the bundled
+    # curves) to replace the primality test of sympy by a check of the Lucas
+    # certificate given by PRIME_DECOMPOSITION and MULTIPLICATIVE_GENERATOR,
+    # which must then be set (see `_check_lucas_certificate`). It does not
+    # import sympy. A ValueError is raised if the certificate is invalid.
+    TRUSTED_PRIME_ORDER = False
+    # ORDER, once its primality has been checked. Inherited by the copies of
+    # `with_backend`, which do not check it again.
+    _PRIME_ORDER = None
+    # Big integer backend of the residues, see keum.backend. DEFAULT_BACKEND is
+    # used if None.
+    BACKEND = None
+    # ORDER as a residue of the backend, set when the order is checked
+    _MODULUS = None
 
     @classmethod
     def zero(cls):
-        return cls(0)
+        # Interned, see `intern`
+        zero = cls._ZERO
+        if zero is None or zero.__class__ is not cls:
+            zero = cls._ZERO = cls.intern(0)
+        return zero
 
     @classmethod
     def one(cls):
-        return cls(1)
+        # Interned, see `intern`
+        one = cls._ONE
+        if one is None or one.__class__ is not cls:
+            one = cls._ONE = cls.intern(1)
+        return one
+
+    @classmethod
+    def intern(cls, v) -> Self:
+        """Return the element v (an integer or an element of the field) from a
+        pool of constants shared per field.
+
+        Interning the constants used in hot loops (0, 1, curve coefficients,
+        round constants, ...) avoids allocating them over and over. Elements
+        are never mutated by the field operations, so the shared instances can
+        be used like any other element.
+        """
+        pool = cls.__dict__.get("_INTERNED")
+        if pool is None:
+            cls.__check_order()
+            pool = {}
+            cls._INTERNED = pool
+        if isinstance(v, cls):
+            v = v.v
+        v = v % cls._MODULUS
+        x = pool.get(v)
+        if x is None:
+            x = pool[v] = cls._of_reduced(v)
+        return x
+
+    @classmethod
+    def backend(cls):
+        """Return the big integer backend used by the field."""
+        cls.__check_order()
+        return cls.BACKEND
+
+    @classmethod
+    def with_backend(cls, backend) -> type[Self]:
+        """Return a copy of the field using the given backend, e.g. to compare
+        the backends in benchmarks."""
+        return type(
+            cls.__name__,
+            (cls,),
+            {
+                "BACKEND": backend,
+                "ORDER_CHECK_PERFORMED": False,
+                "__module__": cls.__module__,
+            },
+        )
+
+    @classmethod
+    def _of_reduced(cls, v):
+        # Trusted constructor. The caller guarantees 0 <= v < ORDER, and that
+        # the order of the field has already been checked (i.e. an element has
+        # been built with the public constructor before).
+        r = _object_new(cls)
+        r.v = v
+        return r
 
     def double(self):
-        return self + self
+        cls = self.__class__
+        v = self.v + self.v
+        if v >= cls._MODULUS:
+            v -= cls._MODULUS
+        r = _object_new(cls)
+        r.v = v
+        return r
 
     def is_zero(self):
         return self.v == 0
@@ -126,27 +429,52 @@ class PrimeFiniteField(FiniteField):
     def __str__(self):
         return "F_%d(%d)" % (self.ORDER, self.v)
 
+    # The arithmetic operators below are on the hot path of every curve and
+    # permutation computation. They compare the classes directly (falling back
+    # to isinstance for subclasses), read the modulus once and build the result with
+    # the trusted constructor, as both operands are already reduced.
     def __eq__(self, other):
         # Hypothesis: both are smaller than the order.
-        if isinstance(other, self.__class__):
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
             return self.v == other.v
         raise ValueError("Equality only possible between element of the same field")
 
+    def __hash__(self):
+        # ORDER is included to limit the collisions between fields, as
+        # comparing elements of different fields raises an exception.
+        return hash((self.ORDER, self.v))
+
     def __add__(self, other):
-        if isinstance(other, self.__class__):
-            return self.__class__((self.v + other.v) % self.ORDER)
+        cls = self.__class__
+        if other.__class__ is cls or isinstance(other, cls):
+            p = cls._MODULUS
+            v = self.v + other.v
+            if v >= p:
+                v -= p
+            r = _object_new(cls)
+            r.v = v
+            return r
         raise ValueError("Addition only possible between element of the same field")
 
     def __mul__(self, other):
-        if isinstance(other, self.__class__):
-            return self.__class__((self.v * other.v) % self.ORDER)
+        cls = self.__class__
+        if other.__class__ is cls or isinstance(other, cls):
+            r = _object_new(cls)
+            r.v = (self.v * other.v) % cls._MODULUS
+            return r
         raise ValueError(
             "Multiplication only possible between element of the same field"
         )
 
     def __sub__(self, other):
-        if isinstance(other, self.__class__):
-            return self.__class__((self.v - other.v) % self.ORDER)
+        cls = self.__class__
+        if other.__class__ is cls or isinstance(other, cls):
+            v = self.v - other.v
+            if v < 0:
+                v += cls._MODULUS
+            r = _object_new(cls)
+            r.v = v
+            return r
         raise ValueError("Substraction only possible between element of the same field")
 
     def __truediv__(self, other):
@@ -156,25 +484,81 @@ class PrimeFiniteField(FiniteField):
             return self * other.inverse()
         raise ValueError("Division only possible between element of the same field")
 
+    def square(self):
+        cls = self.__class__
+        r = _object_new(cls)
+        r.v = (self.v * self.v) % cls._MODULUS
+        return r
+
     def copy(self):
-        return self.__class__(self.v)
+        r = _object_new(self.__class__)
+        r.v = self.v
+        return r
 
     @classmethod
     def prime_decomposition_multiplicative_subgroup(cls):
         if cls.PRIME_DECOMPOSITION is None:
             cls.__check_order()
-            res = sympy.ntheory.factorint(cls.ORDER - 1)
+            res = _load_cached_prime_decomposition(cls.ORDER)
+            if res is None:
+                from sympy.ntheory import factorint
+
+                res = {int(q): e for q, e in factorint(cls.ORDER - 1).items()}
+                _store_cached_prime_decomposition(cls.ORDER, res)
             cls.PRIME_DECOMPOSITION = res
         return cls.PRIME_DECOMPOSITION
 
+    @classmethod
+    def multiplicative_generator(cls) -> Self:
+        if cls.MULTIPLICATIVE_GENERATOR is None:
+            p = cls.ORDER
+            primes = cls.prime_decomposition_multiplicative_subgroup().keys()
+            g = 2 if p > 2 else 1
+            while any(pow(g, (p - 1) // q, p) == 1 for q in primes):
+                g += 1
+            cls.MULTIPLICATIVE_GENERATOR = g
+        return cls(cls.MULTIPLICATIVE_GENERATOR)
+
+    @classmethod
+    def two_adic_root_of_unity(cls) -> Self:
+        """Primitive 2^s-th root of unity, s = highest_power_of_two()."""
+        if cls.TWO_ADIC_ROOT_OF_UNITY is None:
+            g = cls.multiplicative_generator()
+            w = g.pow((cls.ORDER - 1) >> cls.highest_power_of_two())
+            cls.TWO_ADIC_ROOT_OF_UNITY = w.to_int()
+        return cls(cls.TWO_ADIC_ROOT_OF_UNITY)
+
+    @classmethod
+    def two_adic_root_of_unity_inverse(cls) -> Self:
+        if cls.TWO_ADIC_ROOT_OF_UNITY_INVERSE is None:
+            w_inv = cls.two_adic_root_of_unity().inverse()
+            cls.TWO_ADIC_ROOT_OF_UNITY_INVERSE = w_inv.to_int()
+        return cls(cls.TWO_ADIC_ROOT_OF_UNITY_INVERSE)
+
+    @classmethod
+    def root_of_unity(cls, n: int) -> Self:
+        """Primitive n-th root of unity. n must divide ORDER - 1.
+
+        For powers of two, it is derived from the 2-adic root of unity by
+        squarings and does not need the factorization of ORDER - 1.
+        """
+        if n <= 0 or (cls.ORDER - 1) % n != 0:
+            raise ValueError("%d does not divide the order of the group" % n)
+        if n & (n - 1) == 0:
+            w = cls.two_adic_root_of_unity()
+            for _ in range(cls.highest_power_of_two() - (n.bit_length() - 1)):
+                w = w.square()
+            return w
+        return cls.multiplicative_generator().pow((cls.ORDER - 1) // n)
+
     def legendre_symbol(self):
+        # Computed as a Jacobi symbol, which is equal to the Legendre symbol
+        # modulo a prime and does not need an exponentiation.
         if self.is_zero():
             return 0
-        tmp = self.pow(self.ORDER / 2)
-        if tmp.is_one():
+        if self.ORDER == 2:
             return 1
-        else:
-            return -1
+        return int(self.BACKEND.jacobi(self.v, self._MODULUS))
 
     def is_quadratic_residue(self):
         if self.is_zero():
@@ -182,61 +566,291 @@ class PrimeFiniteField(FiniteField):
         else:
             return self.legendre_symbol() == 1
 
+    @classmethod
+    def split_quadratic_residues(cls, elements) -> tuple[list[Self], list[Self]]:
+        """Sort the elements into quadratic residues (including zero) and
+        non-residues, keeping their order. Useful for rejection sampling, e.g.
+        before computing square roots."""
+        cls.__check_order()
+        residues = []
+        non_residues = []
+        if cls.ORDER == 2:
+            return list(elements), non_residues
+        jacobi = cls.BACKEND.jacobi
+        p = cls._MODULUS
+        for x in elements:
+            if jacobi(x.v, p) == -1:
+                non_residues.append(x)
+            else:
+                residues.append(x)
+        return residues, non_residues
+
     def negate(self):
-        return self.__class__(self.ORDER - self.v)
+        cls = self.__class__
+        r = _object_new(cls)
+        r.v = cls._MODULUS - self.v if self.v else self.v
+        return r
 
     @classmethod
     def highest_power_of_two(cls):
-        prime_decomposition = cls.prime_decomposition_multiplicative_subgroup()
-        return prime_decomposition[2] if 2 in prime_decomposition else 0
+        if cls.TWO_ADICITY is None:
+            # No need to factorize ORDER - 1 to get its 2-adicity
+            cls.__check_order()
+            n = cls.ORDER - 1
+            cls.TWO_ADICITY = (n & -n).bit_length() - 1
+        return cls.TWO_ADICITY
+
+    @classmethod
+    def sqrt_parameters(cls):
+        """Return the parameters used to compute square roots, computed once per
+        field.
+
+        It is a tuple `(s, q, z_powers)` where ORDER - 1 = 2^s * q with q odd,
+        and `z_powers[k] = z^(q * 2^k)` for k < s, z being the smallest quadratic
+        non-residue.
+        """
+        if cls.SQRT_PARAMETERS is None:
+            p = cls.ORDER
+            s = cls.highest_power_of_two()
+            q = (p - 1) >> s
+            z = 2
+            # Only happens for p = 2, where every element is a square
+            while z < p and pow(z, (p - 1) >> 1, p) != p - 1:
+                z += 1
+            c = pow(z, q, p) if z < p else 1
+            z_powers = []
+            for _ in range(s):
+                z_powers.append(c)
+                c = c * c % p
+            cls.SQRT_PARAMETERS = (s, q, tuple(z_powers))
+        return cls.SQRT_PARAMETERS
+
+    @classmethod
+    def _sqrt_int(cls, a: int) -> Optional[int]:
+        # Square root of a residue, None if it is not a quadratic residue.
+        # The smallest of the two roots is returned.
+        p = cls._MODULUS
+        if a == 0 or p == 2:
+            return a
+        if p & 3 == 3:
+            r = pow(a, (p + 1) >> 2, p)
+        elif p & 7 == 5:
+            # Atkin
+            b = pow(2 * a, (p - 5) >> 3, p)
+            i = 2 * a * b * b % p
+            r = a * b * (i - 1) % p
+        else:
+            # Tonelli-Shanks, with the powers of the non-residue precomputed
+            s, q, z_powers = cls.sqrt_parameters()
+            x = pow(a, (q - 1) >> 1, p)
+            r = a * x % p
+            t = r * x % p
+            m = s
+            while t != 1:
+                i = 0
+                t2 = t
+                while t2 != 1:
+                    t2 = t2 * t2 % p
+                    i += 1
+                if i == m:
+                    return None
+                b = z_powers[s - i - 1]
+                r = r * b % p
+                t = t * b * b % p
+                m = i
+        if r * r % p != a:
+            return None
+        return min(r, p - r)
 
     @classmethod
     def __check_order(cls):
         if not cls.ORDER_CHECK_PERFORMED:
             assert cls.ORDER is not None
-            assert sympy.isprime(cls.ORDER), "%d is not prime" % cls.ORDER
+            if cls._PRIME_ORDER != cls.ORDER:
+                if cls.TRUSTED_PRIME_ORDER:
+                    _check_lucas_certificate(
+                        cls.ORDER,
+                        cls.PRIME_DECOMPOSITION,
+                        cls.MULTIPLICATIVE_GENERATOR,
+                    )
+                else:
+                    # Imported here as importing sympy is slow
+                    from sympy import isprime
+
+                    assert isprime(cls.ORDER), "%d is not prime" % cls.ORDER
+                cls._PRIME_ORDER = cls.ORDER
+            if cls.BACKEND is None:
+                cls.BACKEND = DEFAULT_BACKEND
+            cls._MODULUS = cls.BACKEND.of_int(cls.ORDER)
             cls.ORDER_CHECK_PERFORMED = True
 
     @classmethod
-    def random(cls):
-        v = random.randint(0, cls.ORDER - 1)
-        return cls(v)
+    def random(cls, rng: Optional[Random] = None):
+        cls.__check_order()
+        v = (random if rng is None else rng).randint(0, cls.ORDER - 1)
+        return cls._of_reduced(cls.BACKEND.of_int(v))
 
-    def sqrt_opt(self, sign: bool):
-        # TODO: reimplement
-        from sympy.ntheory import sqrt_mod
+    @classmethod
+    def random_vector(cls, n: int, rng: Optional[Random] = None) -> "PrimeFieldVector":
+        """Sample n uniformly random elements.
+
+        The random bytes are drawn in bulk, and the values which are not smaller
+        than the order are rejected (less than half of them).
+        """
+        cls.__check_order()
+        rng = random if rng is None else rng
+        p = cls.ORDER
+        nb_bytes = cls.bytes_length()
+        mask = (1 << p.bit_length()) - 1
+        from_bytes = int.from_bytes
+        values = []
+        while len(values) < n:
+            bs = rng.randbytes((n - len(values)) * nb_bytes)
+            candidates = [
+                from_bytes(bs[i : i + nb_bytes], "little") & mask
+                for i in range(0, len(bs), nb_bytes)
+            ]
+            values.extend([v for v in candidates if v < p])
+        values = list(map(cls.BACKEND.of_int, values))
+        return PrimeFieldVector._of_reduced(cls, values)
 
-        s = sqrt_mod(self.v, self.ORDER)
+    def sqrt_opt(self, sign: bool):
+        s = self._sqrt_int(self.v)
         if s is None:
             return s
-        s = self.__class__(s)
+        s = self._of_reduced(s)
         if sign:
             return s
         else:
             return s.negate()
 
+    @classmethod
+    def batch_sqrt(cls, elements, sign: bool = True) -> list[Optional[Self]]:
+        """Square roots of many elements, None for the elements which are not
+        quadratic residues.
+
+        This is a convenience loop over `sqrt_opt`: each element still costs
+        its own exponentiation, only `sqrt_parameters()` and the attribute
+        lookups are shared. None of the square root algorithms used here needs
+        an inversion, so there is no work to batch with Montgomery's trick.
+        """
+        cls.sqrt_parameters()
+        sqrt_int = cls._sqrt_int
+        of_reduced = cls._of_reduced
+        p = cls._MODULUS
+        res = []
+        for x in elements:
+            s = sqrt_int(x.v)
+            if s is None:
+                res.append(None)
+            else:
+                res.append(of_reduced(s if sign or s == 0 else p - s))
+        return res
+
     def pow(self, n):
-        if n == 0:
-            return self.__class__.one()
-        n_bits = format(n, "b")[1:]
-        acc = self.copy()
-        for b in n_bits:
-            acc *= acc
-            if b == "1":
-                acc = acc * self
-        return acc
+        # The modular exponentiation of the backends (builtin pow, GMP) already
+        # implements a sliding window in C, it is faster than any chain
+        # evaluated in Python, including for tiny exponents like 5 and 7.
+        if n < 0:
+            return self.inverse().pow(-n)
+        return self._of_reduced(self.BACKEND.powmod(self.v, n, self._MODULUS))
 
     def inverse(self):
         if self.is_zero():
             raise ValueError("Zero has no inverse")
-        return self.pow(self.ORDER - 2)
+        # Extended Euclidean algorithm (in C), much faster than Fermat's
+        # little theorem, i.e. x^(p - 2).
+        return self._of_reduced(self.BACKEND.invert(self.v, self._MODULUS))
+
+    @classmethod
+    def batch_inverse(
+        cls, elements, skip_zeros: bool = False, chunk_size: Optional[int] = None
+    ) -> list[Self]:
+        """Invert all the elements at once with Montgomery's trick.
+
+        Each chunk of `chunk_size` elements (all the elements if None) costs
+        a single field inversion and 3(n-1) multiplications. By default, a
+        ValueError is raised if one of the elements is zero. If `skip_zeros` is
+        set, the zeros are left out of the product and returned as zero at the
+        same position.
+        """
+        return list(cls.batch_inverse_iter(elements, skip_zeros, chunk_size))
+
+    @classmethod
+    def batch_inverse_iter(
+        cls, elements, skip_zeros: bool = False, chunk_size: Optional[int] = 4096
+    ) -> Iterator[Self]:
+        """Streaming version of `batch_inverse`.
+
+        `elements` can be any iterable. It is consumed `chunk_size` elements
+        at a time, and the inverses are yielded in the same order, so that the
+        memory usage stays bounded by the chunk size. A ValueError is raised if
+        `chunk_size` is smaller than 1.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1, got %d" % chunk_size)
+        return cls._batch_inverse_chunks(iter(elements), skip_zeros, chunk_size)
+
+    @classmethod
+    def _batch_inverse_chunks(cls, it, skip_zeros, chunk_size):
+        while True:
+            chunk = list(itertools.islice(it, chunk_size))
+            if not chunk:
+                return
+            yield from cls._batch_inverse_chunk(chunk, skip_zeros)
+            if chunk_size is None:
+                return
+
+    @classmethod
+    def _batch_inverse_chunk(cls, chunk, skip_zeros):
+        of_reduced = cls._of_reduced
+        inverses = cls._batch_inverse_values([x.v for x in chunk], skip_zeros)
+        return [of_reduced(v) for v in inverses]
+
+    @classmethod
+    def _batch_inverse_values(cls, vs, skip_zeros):
+        # Montgomery's trick on a list of residues, returning residues
+        p = cls._MODULUS
+        # prefix[i] is the product of the non-zero elements before index i
+        prefix = [1] * len(vs)
+        acc = 1
+        for i, v in enumerate(vs):
+            prefix[i] = acc
+            if v == 0:
+                if not skip_zeros:
+                    raise ValueError("Zero has no inverse")
+                continue
+            acc = acc * v % p
+        inv = cls._of_reduced(acc).inverse().v
+        res = [None] * len(vs)
+        for i in range(len(vs) - 1, -1, -1):
+            v = vs[i]
+            if v == 0:
+                res[i] = v
+                continue
+            res[i] = inv * prefix[i] % p
+            inv = inv * v % p
+        return res
 
     def __init__(self, v):
         self.__check_order()
-        self.v = v
+        self.v = v % self._MODULUS
 
     def to_int(self):
-        return self.v
+        return int(self.v)
+
+    @classmethod
+    def characteristic(cls) -> int:
+        return cls.ORDER
+
+    @classmethod
+    def absolute_degree(cls) -> int:
+        """Degree of the field over its prime subfield."""
+        return 1
+
+    def frobenius(self, k: int = 1) -> Self:
+        """x^(p^k). The identity in a prime field."""
+        return self.copy()
 
     def to_be_bytes(self) -> str:
         exp_bs_length = self.bytes_length() * 2
@@ -268,3 +882,648 @@ class PrimeFiniteField(FiniteField):
         if v >= cls.ORDER:
             raise ValueError("The value must be smaller than the order of the field")
         return cls(v)
+
+    # Binary encoding. Contrary to to_be_bytes/of_be_bytes_*, which use
+    # hexadecimal strings, the functions below work on actual bytes. Each
+    # element is encoded on bytes_length() bytes, in big or little endian
+    # (byteorder is "big" or "little"), and sequences of elements are simply
+    # concatenated.
+    def to_bytes(self, byteorder: str = "big") -> bytes:
+        return int(self.v).to_bytes(self.bytes_length(), byteorder)
+
+    @classmethod
+    def of_bytes_opt(cls, bs, byteorder: str = "big") -> Optional[Self]:
+        if len(bs) != cls.bytes_length():
+            return None
+        v = int.from_bytes(bs, byteorder)
+        if v >= cls.ORDER:
+            return None
+        return cls(v)
+
+    @classmethod
+    def of_bytes_exn(cls, bs, byteorder: str = "big") -> Self:
+        n = cls.bytes_length()
+        if len(bs) != n:
+            raise ValueError("The bytestring should be of length %d" % n)
+        v = int.from_bytes(bs, byteorder)
+        if v >= cls.ORDER:
+            raise ValueError("The value must be smaller than the order of the field")
+        return cls(v)
+
+    @classmethod
+    def encode_many(cls, elements, byteorder: str = "big") -> bytes:
+        return cls._encode_ints([x.v for x in elements], byteorder)
+
+    @classmethod
+    def encode_many_into(
+        cls, buffer, elements, offset: int = 0, byteorder: str = "big"
+    ) -> int:
+        """Encode the elements into a writable buffer (bytearray, writable
+        memoryview or mmap), starting at `offset`. Return the offset following
+        the last written byte."""
+        return cls._encode_ints_into(buffer, [x.v for x in elements], offset, byteorder)
+
+    @classmethod
+    def decode_many_exn(cls, buffer, byteorder: str = "big") -> list[Self]:
+        """Decode a concatenation of encoded elements from any object supporting
+        the buffer protocol (bytes, bytearray, memoryview, mmap). Raise a
+        ValueError if the length is not a multiple of bytes_length() or if one
+        of the values is not smaller than the order."""
+        of_reduced = cls._of_reduced
+        return [of_reduced(v) for v in cls._decode_ints_exn(buffer, byteorder)]
+
+    @classmethod
+    def _encode_ints(cls, values, byteorder: str) -> bytes:
+        n = cls.bytes_length()
+        return b"".join([int(v).to_bytes(n, byteorder) for v in values])
+
+    @classmethod
+    def _encode_ints_into(cls, buffer, values, offset: int, byteorder: str) -> int:
+        n = cls.bytes_length()
+        end = offset + n * len(values)
+        with memoryview(buffer).cast("B") as mv:
+            if end > len(mv):
+                raise ValueError("The buffer is too small")
+            mv[offset:end] = cls._encode_ints(values, byteorder)
+        return end
+
+    @classmethod
+    def _decode_ints_exn(cls, buffer, byteorder: str) -> list[int]:
+        cls.__check_order()
+        n = cls.bytes_length()
+        with memoryview(buffer).cast("B") as mv:
+            if len(mv) % n != 0:
+                raise ValueError(
+                    "The length of the buffer should be a multiple of %d" % n
+                )
+            from_bytes = int.from_bytes
+            values = [
+                from_bytes(mv[i : i + n], byteorder) for i in range(0, len(mv), n)
+            ]
+        # Range check of all the values in a single pass
+        if values and max(values) >= cls.ORDER:
+            p = cls.ORDER
+            i = next(i for i, v in enumerate(values) if v >= p)
+            raise ValueError(
+                "The value at index %d must be smaller than the order of the field" % i
+            )
+        return list(map(cls.BACKEND.of_int, values))
+
+
+class PrimeFieldVector:
+    """A vector of elements of a prime field, stored as a list of residues.
+
+    Contrary to a list of `PrimeFiniteField` elements, no object is created
+    per coordinate: the operations below work on the residues directly and
+    only reduce when needed (e.g. once at the end of a dot product).
+    """
+
+    __slots__ = ("field", "values")
+
+    def __init__(self, field, values):
+        field.backend()
+        p = field._MODULUS
+        self.field = field
+        self.values = [v % p for v in values]
+
+    @classmethod
+    def _of_reduced(cls, field, values):
+        # Trusted constructor, the residues must already be in [0, ORDER).
+        r = _object_new(cls)
+        r.field = field
+        r.values = values
+        return r
+
+    @classmethod
+    def zero(cls, field, n: int) -> Self:
+        return cls._of_reduced(field, [field.backend().of_int(0)] * n)
+
+    @classmethod
+    def of_elements(cls, field, elements) -> Self:
+        return cls._of_reduced(field, [x.v for x in elements])
+
+    def to_elements(self) -> list:
+        of_reduced = self.field._of_reduced
+        return [of_reduced(v) for v in self.values]
+
+    @classmethod
+    def of_bytes_exn(cls, field, buffer, byteorder: str = "big") -> Self:
+        """Decode a vector from a buffer, see `PrimeFiniteField.decode_many_exn`."""
+        return cls._of_reduced(field, field._decode_ints_exn(buffer, byteorder))
+
+    def to_bytes(self, byteorder: str = "big") -> bytes:
+        return self.field._encode_ints(self.values, byteorder)
+
+    def to_bytes_into(self, buffer, offset: int = 0, byteorder: str = "big") -> int:
+        return self.field._encode_ints_into(buffer, self.values, offset, byteorder)
+
+    def copy(self) -> Self:
+        return self._of_reduced(self.field, self.values.copy())
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        of_reduced = self.field._of_reduced
+        return (of_reduced(v) for v in self.values)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._of_reduced(self.field, self.values[i])
+        return self.field._of_reduced(self.values[i])
+
+    def __setitem__(self, i, x):
+        if not isinstance(x, self.field):
+            raise ValueError("The element must belong to the field of the vector")
+        self.values[i] = x.v
+
+    def __repr__(self):
+        values = [int(v) for v in self.values]
+        return "PrimeFieldVector(F_%d, %r)" % (self.field.ORDER, values)
+
+    def __eq__(self, other):
+        if isinstance(other, PrimeFieldVector) and other.field is self.field:
+            return self.values == other.values
+        raise ValueError("Equality only possible between vectors of the same field")
+
+    def __check_same_shape(self, other):
+        if not isinstance(other, PrimeFieldVector) or other.field is not self.field:
+            raise ValueError("The vectors must be defined over the same field")
+        if len(other.values) != len(self.values):
+            raise ValueError(
+                "The vectors must have the same length (%d != %d)"
+                % (len(self.values), len(other.values))
+            )
+
+    def __add__(self, other):
+        self.__check_same_shape(other)
+        p = self.field._MODULUS
+        res = [(a + b) % p for a, b in zip(self.values, other.values)]
+        return self._of_reduced(self.field, res)
+
+    def __sub__(self, other):
+        self.__check_same_shape(other)
+        p = self.field._MODULUS
+        res = [(a - b) % p for a, b in zip(self.values, other.values)]
+        return self._of_reduced(self.field, res)
+
+    def __mul__(self, other):
+        """Elementwise (Hadamard) product. Use `scalar_mul` for a scalar."""
+        self.__check_same_shape(other)
+        p = self.field._MODULUS
+        res = [a * b % p for a, b in zip(self.values, other.values)]
+        return self._of_reduced(self.field, res)
+
+    def scalar_mul(self, c) -> Self:
+        if not isinstance(c, self.field):
+            raise ValueError("The scalar must belong to the field of the vector")
+        p = self.field._MODULUS
+        c = c.v
+        return self._of_reduced(self.field, [a * c % p for a in self.values])
+
+    def negate(self) -> Self:
+        p = self.field._MODULUS
+        return self._of_reduced(self.field, [p - a if a else 0 for a in self.values])
+
+    def dot(self, other):
+        self.__check_same_shape(other)
+        # Lazy reduction: a single modular reduction for the whole product
+        acc = sum(map(operator.mul, self.values, other.values))
+        return self.field._of_reduced(acc % self.field._MODULUS)
+
+    def sum(self):
+        return self.field._of_reduced(sum(self.values) % self.field._MODULUS)
+
+    def batch_inverse(self, skip_zeros: bool = False) -> Self:
+        """Coordinate-wise inverse with Montgomery's trick, see
+        `PrimeFiniteField.batch_inverse`."""
+        return self._of_reduced(
+            self.field, self.field._batch_inverse_values(self.values, skip_zeros)
+        )
+
+    def prefix_products(self) -> Self:
+        """Return the vector whose i-th coordinate is the product of the first
+        i + 1 coordinates of this vector."""
+        p = self.field._MODULUS
+        res = [0] * len(self.values)
+        acc = 1
+        for i, a in enumerate(self.values):
+            acc = acc * a % p
+            res[i] = acc
+        return self._of_reduced(self.field, res)
+
+
+def _prime_coefficients(x) -> list[int]:
+    # Coefficients of an element of a tower of extensions in the prime field
+    if isinstance(x, ExtensionField):
+        return [v for c in x.coefficients() for v in _prime_coefficients(c)]
+    return [x.to_int()]
+
+
+class ExtensionField(FiniteField):
+    """Base class of the extensions F[u] / (u^DEGREE - NON_RESIDUE) of a field
+    F = BASE_FIELD. The extensions can be stacked to build towers.
+
+    Elements are represented by their coefficients (c0, c1, ...) in the basis
+    (1, u, ...). ORDER is set when the class is created.
+    """
+
+    BASE_FIELD = None
+    NON_RESIDUE = None
+    DEGREE = None
+    # k -> coefficients used to compute the k-th Frobenius, computed once
+    FROBENIUS_COEFFICIENTS = None
+    # Parameters of Tonelli-Shanks, see `sqrt_parameters`
+    SQRT_PARAMETERS = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.BASE_FIELD is not None and cls.DEGREE is not None:
+            cls.ORDER = cls.BASE_FIELD.ORDER**cls.DEGREE
+            cls.FROBENIUS_COEFFICIENTS = {}
+            cls.SQRT_PARAMETERS = None
+
+    @classmethod
+    def characteristic(cls) -> int:
+        return cls.BASE_FIELD.characteristic()
+
+    @classmethod
+    def absolute_degree(cls) -> int:
+        """Degree of the field over its prime subfield."""
+        return cls.DEGREE * cls.BASE_FIELD.absolute_degree()
+
+    @classmethod
+    def mul_by_non_residue(cls, x):
+        """Multiplication of an element x of the base field by NON_RESIDUE.
+        Instances should override it when a cheaper formula exists (e.g. when
+        NON_RESIDUE is -1)."""
+        return x * cls.NON_RESIDUE
+
+    @classmethod
+    def frobenius_coefficients(cls, k: int) -> tuple:
+        """Return the elements NON_RESIDUE^(i * (p^k - 1) / DEGREE) of the base
+        field for 0 < i < DEGREE, such that (u^i)^(p^k) is the coefficient
+        times u^i."""
+        coefficients = cls.FROBENIUS_COEFFICIENTS.get(k)
+        if coefficients is None:
+            e = (cls.characteristic() ** k - 1) // cls.DEGREE
+            gamma = cls.NON_RESIDUE.pow(e)
+            coefficients = [gamma]
+            for _ in range(cls.DEGREE - 2):
+                coefficients.append(coefficients[-1] * gamma)
+            coefficients = tuple(coefficients)
+            cls.FROBENIUS_COEFFICIENTS[k] = coefficients
+        return coefficients
+
+    @classmethod
+    def of_coefficients(cls, coefficients) -> Self:
+        return cls(*coefficients)
+
+    def is_zero(self):
+        return all(c.is_zero() for c in self.coefficients())
+
+    def is_one(self):
+        c = self.coefficients()
+        return c[0].is_one() and all(x.is_zero() for x in c[1:])
+
+    def __repr__(self):
+        return "%s(%s)" % (
+            self.__class__.__name__,
+            ", ".join(repr(c) for c in self.coefficients()),
+        )
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.coefficients() == other.coefficients()
+        raise ValueError("Equality only possible between element of the same field")
+
+    def __hash__(self):
+        return hash(self.coefficients())
+
+    def __truediv__(self, other):
+        if isinstance(other, self.__class__):
+            if other.is_zero():
+                raise ValueError("Division by zero")
+            return self * other.inverse()
+        raise ValueError("Division only possible between element of the same field")
+
+    def double(self):
+        return self + self
+
+    def copy(self):
+        return self.of_coefficients([c.copy() for c in self.coefficients()])
+
+    def mul_by_base(self, x) -> Self:
+        """Multiplication by an element of the base field."""
+        return self.of_coefficients([c * x for c in self.coefficients()])
+
+    def frobenius(self, k: int = 1) -> Self:
+        """x^(p^k), p being the characteristic, using the precomputed
+        coefficients."""
+        k = k % self.absolute_degree()
+        if k == 0:
+            return self.copy()
+        c = [x.frobenius(k) for x in self.coefficients()]
+        gammas = self.frobenius_coefficients(k)
+        return self.of_coefficients([c[0]] + [x * g for x, g in zip(c[1:], gammas)])
+
+    @classmethod
+    def sqrt_parameters(cls):
+        """Return the parameters used to compute square roots, computed once per
+        field.
+
+        It is a tuple `(s, t, z_powers)` where ORDER - 1 = 2^s * t with t odd,
+        and `z_powers[k] = z^(t * 2^k)` for k < s, z being the first quadratic
+        non-residue of the form u + i, i = 0, 1, ...
+        """
+        if cls.SQRT_PARAMETERS is None:
+            q = cls.ORDER
+            s = 0
+            t = q - 1
+            while t % 2 == 0:
+                t //= 2
+                s += 1
+            one = cls.one()
+            minus_one = one.negate()
+            z = cls.of_coefficients(
+                [cls.BASE_FIELD.zero(), cls.BASE_FIELD.one()]
+                + [cls.BASE_FIELD.zero()] * (cls.DEGREE - 2)
+            )
+            while z.pow((q - 1) // 2) != minus_one:
+                z = z + one
+            c = z.pow(t)
+            z_powers = []
+            for _ in range(s):
+                z_powers.append(c)
+                c = c.square()
+            cls.SQRT_PARAMETERS = (s, t, tuple(z_powers))
+        return cls.SQRT_PARAMETERS
+
+    def sqrt_opt(self, sign: bool):
+        """Square root with Tonelli-Shanks over the field of order q^k, None
+        if this is not a square. The two roots are ordered by their
+        coefficients as integers: `sign` selects the smallest one, as for
+        prime fields."""
+        if self.is_zero():
+            return self.zero()
+        s, t, z_powers = self.sqrt_parameters()
+        x = self.pow((t - 1) // 2)
+        r = self * x
+        b = r * x
+        m = s
+        while not b.is_one():
+            i = 0
+            b2 = b
+            while not b2.is_one():
+                b2 = b2.square()
+                i += 1
+            if i == m:
+                return None
+            g = z_powers[s - i - 1]
+            r = r * g
+            b = b * g.square()
+            m = i
+        return self._select_root(r, sign)
+
+    @staticmethod
+    def _select_root(root, sign: bool):
+        # The smallest of root and -root, comparing their coefficients in the
+        # prime field, or its opposite
+        other = root.negate()
+        if _prime_coefficients(other) < _prime_coefficients(root):
+            root, other = other, root
+        return root if sign else other
+
+    @classmethod
+    def zero(cls):
+        zero = cls.BASE_FIELD.zero()
+        return cls.of_coefficients([zero] * cls.DEGREE)
+
+    @classmethod
+    def one(cls):
+        zero = cls.BASE_FIELD.zero()
+        return cls.of_coefficients([cls.BASE_FIELD.one()] + [zero] * (cls.DEGREE - 1))
+
+    @classmethod
+    def random(cls, rng: Optional[Random] = None):
+        return cls.of_coefficients(
+            [cls.BASE_FIELD.random(rng) for _ in range(cls.DEGREE)]
+        )
+
+    @classmethod
+    def bytes_length(cls) -> int:
+        return cls.DEGREE * cls.BASE_FIELD.bytes_length()
+
+    def to_be_bytes(self) -> str:
+        # Concatenation of the encodings of the coefficients, c0 first
+        return "".join(c.to_be_bytes() for c in self.coefficients())
+
+    @classmethod
+    def of_be_bytes_opt(cls, bs: str) -> Optional[Self]:
+        if len(bs) != cls.bytes_length() * 2:
+            return None
+        n = cls.BASE_FIELD.bytes_length() * 2
+        coefficients = [
+            cls.BASE_FIELD.of_be_bytes_opt(bs[i : i + n]) for i in range(0, len(bs), n)
+        ]
+        if any(c is None for c in coefficients):
+            return None
+        return cls.of_coefficients(coefficients)
+
+    @classmethod
+    def of_be_bytes_exn(cls, bs: str) -> Self:
+        exp_bs_length = cls.bytes_length() * 2
+        if len(bs) != exp_bs_length:
+            raise ValueError("The bytestring should be of length %d" % exp_bs_length)
+        n = cls.BASE_FIELD.bytes_length() * 2
+        return cls.of_coefficients(
+            [
+                cls.BASE_FIELD.of_be_bytes_exn(bs[i : i + n])
+                for i in range(0, len(bs), n)
+            ]
+        )
+
+
+class QuadraticExtensionField(ExtensionField):
+    """F[u] / (u^2 - NON_RESIDUE). Multiplication uses Karatsuba (3
+    multiplications in F instead of 4) and squaring the complex method (2
+    multiplications)."""
+
+    __slots__ = ("c0", "c1")
+    DEGREE = 2
+
+    def __init__(self, c0, c1):
+        assert isinstance(c0, self.BASE_FIELD)
+        assert isinstance(c1, self.BASE_FIELD)
+        self.c0 = c0
+        self.c1 = c1
+
+    def coefficients(self):
+        return (self.c0, self.c1)
+
+    def __add__(self, other):
+        if isinstance(other, self.__class__):
+            return self.__class__(self.c0 + other.c0, self.c1 + other.c1)
+        raise ValueError("Addition only possible between element of the same field")
+
+    def __sub__(self, other):
+        if isinstance(other, self.__class__):
+            return self.__class__(self.c0 - other.c0, self.c1 - other.c1)
+        raise ValueError("Substraction only possible between element of the same field")
+
+    def negate(self):
+        return self.__class__(self.c0.negate(), self.c1.negate())
+
+    def __mul__(self, other):
+        if isinstance(other, self.__class__):
+            a0, a1 = self.c0, self.c1
+            b0, b1 = other.c0, other.c1
+            v0 = a0 * b0
+            v1 = a1 * b1
+            c0 = v0 + self.mul_by_non_residue(v1)
+            c1 = (a0 + a1) * (b0 + b1) - v0 - v1
+            return self.__class__(c0, c1)
+        raise ValueError(
+            "Multiplication only possible between element of the same field"
+        )
+
+    def square(self):
+        a0, a1 = self.c0, self.c1
+        v0 = a0 * a1
+        t = (a0 + a1) * (a0 + self.mul_by_non_residue(a1))
+        c0 = t - v0 - self.mul_by_non_residue(v0)
+        return self.__class__(c0, v0.double())
+
+    def conjugate(self) -> Self:
+        return self.__class__(self.c0, self.c1.negate())
+
+    def norm(self):
+        """c0^2 - NON_RESIDUE * c1^2, in the base field."""
+        return self.c0.square() - self.mul_by_non_residue(self.c1.square())
+
+    def inverse(self):
+        if self.is_zero():
+            raise ValueError("Zero has no inverse")
+        t = self.norm().inverse()
+        return self.__class__(self.c0 * t, (self.c1 * t).negate())
+
+    def sqrt_opt(self, sign: bool):
+        """Square root with the complex method, using square roots in the base
+        field (of odd characteristic). None if this is not a square.
+
+        With N = c0^2 - NON_RESIDUE c1^2 = n^2 the norm, a root is x0 + x1 u
+        where x0^2 = (c0 + n) / 2 (or (c0 - n) / 2) and x1 = c1 / (2 x0).
+        The two roots are ordered by their coefficients as integers, from c0:
+        `sign` selects the smallest one, as for prime fields.
+        """
+        F = self.BASE_FIELD
+        if self.c1.is_zero():
+            # c0 or c0 / NON_RESIDUE is a square in the base field
+            x0 = self.c0.sqrt_opt(True)
+            if x0 is not None:
+                root = self.__class__(x0, F.zero())
+            else:
+                x1 = (self.c0 / self.NON_RESIDUE).sqrt_opt(True)
+                root = self.__class__(F.zero(), x1)
+        else:
+            n = self.norm().sqrt_opt(True)
+            if n is None:
+                return None
+            half = F.one().double().inverse()
+            x0 = ((self.c0 + n) * half).sqrt_opt(True)
+            if x0 is None:
+                x0 = ((self.c0 - n) * half).sqrt_opt(True)
+            if x0 is None:
+                return None
+            root = self.__class__(x0, self.c1 / x0.double())
+        if root.square() != self:
+            return None
+        return self._select_root(root, sign)
+
+
+class CubicExtensionField(ExtensionField):
+    """F[v] / (v^3 - NON_RESIDUE). Multiplication uses Karatsuba (6
+    multiplications in F instead of 9) and squaring Chung-Hasan SQR2 (2
+    multiplications and 3 squarings)."""
+
+    __slots__ = ("c0", "c1", "c2")
+    DEGREE = 3
+
+    def __init__(self, c0, c1, c2):
+        assert isinstance(c0, self.BASE_FIELD)
+        assert isinstance(c1, self.BASE_FIELD)
+        assert isinstance(c2, self.BASE_FIELD)
+        self.c0 = c0
+        self.c1 = c1
+        self.c2 = c2
+
+    def coefficients(self):
+        return (self.c0, self.c1, self.c2)
+
+    def __add__(self, other):
+        if isinstance(other, self.__class__):
+            return self.__class__(
+                self.c0 + other.c0, self.c1 + other.c1, self.c2 + other.c2
+            )
+        raise ValueError("Addition only possible between element of the same field")
+
+    def __sub__(self, other):
+        if isinstance(other, self.__class__):
+            return self.__class__(
+                self.c0 - other.c0, self.c1 - other.c1, self.c2 - other.c2
+            )
+        raise ValueError("Substraction only possible between element of the same field")
+
+    def negate(self):
+        return self.__class__(self.c0.negate(), self.c1.negate(), self.c2.negate())
+
+    def __mul__(self, other):
+        if isinstance(other, self.__class__):
+            a0, a1, a2 = self.c0, self.c1, self.c2
+            b0, b1, b2 = other.c0, other.c1, other.c2
+            v0 = a0 * b0
+            v1 = a1 * b1
+            v2 = a2 * b2
+            mul_by_non_residue = self.mul_by_non_residue
+            c0 = v0 + mul_by_non_residue((a1 + a2) * (b1 + b2) - v1 - v2)
+            c1 = (a0 + a1) * (b0 + b1) - v0 - v1 + mul_by_non_residue(v2)
+            c2 = (a0 + a2) * (b0 + b2) - v0 + v1 - v2
+            return self.__class__(c0, c1, c2)
+        raise ValueError(
+            "Multiplication only possible between element of the same field"
+        )
+
+    def square(self):
+        a0, a1, a2 = self.c0, self.c1, self.c2
+        s0 = a0.square()
+        s1 = (a0 * a1).double()
+        s2 = (a0 - a1 + a2).square()
+        s3 = (a1 * a2).double()
+        s4 = a2.square()
+        mul_by_non_residue = self.mul_by_non_residue
+        c0 = s0 + mul_by_non_residue(s3)
+        c1 = s1 + mul_by_non_residue(s4)
+        c2 = s1 + s2 + s3 - s0 - s4
+        return self.__class__(c0, c1, c2)
+
+    def mul_by_generator(self) -> Self:
+        """Multiplication by v: (c0, c1, c2) -> (NON_RESIDUE * c2, c0, c1). Useful
+        when v is the non-residue of a quadratic extension on top of this
+        field."""
+        return self.__class__(self.mul_by_non_residue(self.c2), self.c0, self.c1)
+
+    def inverse(self):
+        if self.is_zero():
+            raise ValueError("Zero has no inverse")
+        a0, a1, a2 = self.c0, self.c1, self.c2
+        mul_by_non_residue = self.mul_by_non_residue
+        t0 = a0.square() - mul_by_non_residue(a1 * a2)
+        t1 = mul_by_non_residue(a2.square()) - a0 * a1
+        t2 = a1.square() - a0 * a2
+        # Norm of the element, in the base field
+        d = a0 * t0 + mul_by_non_residue(a2 * t1 + a1 * t2)
+        d = d.inverse()
+        return self.__class__(t0 * d, t1 * d, t2 * d)
@@ -1,17 +1,61 @@
 from keum import PrimeFiniteField
-from keum import AffineWeierstrass
+from keum import AffineWeierstrass, JacobianWeierstrass
 
 
 class Fq(PrimeFiniteField):
     ORDER = (
         21888242871839275222246405745257275088548364400416034343698204186575808495617
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 28,
+        3: 2,
+        13: 1,
+        29: 1,
+        983: 1,
+        11003: 1,
+        237073: 1,
+        405928799: 1,
+        1670836401704629: 1,
+        13818364434197438864469338081: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 5
+    TWO_ADICITY = 28
+    TWO_ADIC_ROOT_OF_UNITY = (
+        19103219067921713944291392827692070036145651957329286315305642004821462161904
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        776454056201908206186590970419435932130236139910903033203789591477115950462
+    )
 
 
 class Fr(PrimeFiniteField):
     ORDER = (
         21888242871839275222246405745257275088696311157297823662689037894645226208583
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 1,
+        3: 2,
+        13: 1,
+        29: 1,
+        67: 1,
+        229: 1,
+        311: 1,
+        983: 1,
+        11003: 1,
+        405928799: 1,
+        11465965001: 1,
+        13427688667394608761327070753331941386769: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 3
+    TWO_ADICITY = 1
+    TWO_ADIC_ROOT_OF_UNITY = (
+        21888242871839275222246405745257275088696311157297823662689037894645226208582
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        21888242871839275222246405745257275088696311157297823662689037894645226208582
+    )
 
 
 class AffineWeierstrass(AffineWeierstrass):
@@ -22,3 +66,14 @@ class AffineWeierstrass(AffineWeierstrass):
     COFACTOR = 1
     GENERATOR_X = Fq(1)
     GENERATOR_Y = Fq(2)
+
+
+class JacobianWeierstrass(JacobianWeierstrass):
+    Fq = Fq
+    Fr = Fr
+    A = AffineWeierstrass.A
+    B = AffineWeierstrass.B
+    COFACTOR = AffineWeierstrass.COFACTOR
+    GENERATOR_X = AffineWeierstrass.GENERATOR_X
+    GENERATOR_Y = AffineWeierstrass.GENERATOR_Y
+    AFFINE = AffineWeierstrass
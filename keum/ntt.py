@@ -0,0 +1,418 @@
+"""Number theoretic transforms (NTT) over prime fields.
+
+An `EvaluationDomain` of size n is the multiplicative subgroup of order n of a
+prime field, generated by a primitive n-th root of unity w. Its transform maps
+the coefficients of a polynomial of degree < n to the evaluations of the
+polynomial at w^0, w^1, ..., w^(n - 1), in O(n log n) field operations. The
+coset variants evaluate at g w^0, ..., g w^(n - 1) instead.
+
+The transforms are iterative Cooley-Tukey (decimation in time) and work in
+place on the residues of a `PrimeFieldVector`: no element is allocated, and the
+temporary lists of a stage hold at most n / 2 residues. n can be any divisor of
+ORDER - 1. The power of two part of n is handled by radix-2 stages, the other
+factors (e.g. 3 for the pasta fields) by generic radix-r stages. The twiddle
+factors are computed once per domain, and the domains are cached per field and
+size, see `EvaluationDomain.of_size`.
+
+The transforms of large domains can be spread over several processes with the
+four-step algorithm: for n = n1 n2, the input is viewed as an n1 x n2 matrix,
+whose n1 rows are transformed independently (size n2) and multiplied by
+twiddle factors, then its n2 columns (size n1). The rows and columns are sent
+to the workers of an `Executor` in batches, packed as bytes.
+"""
+
+import operator
+import os
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Optional, Self
+
+from .backend import DEFAULT_BACKEND
+from .ff import PrimeFieldVector
+
+# Minimum size of the domains transformed in parallel when an executor is
+# given. Below, moving the residues to the workers costs more than the
+# transform itself.
+PARALLEL_NTT_THRESHOLD = 1 << 14
+
+
+def _radices(n: int) -> list[int]:
+    # The odd factors come first, as their stages are the cheapest on the
+    # smallest sub-transforms.
+    radices = []
+    m = n >> ((n & -n).bit_length() - 1)
+    f = 3
+    while f * f <= m:
+        while m % f == 0:
+            radices.append(f)
+            m //= f
+        f += 2
+    if m > 1:
+        radices.append(m)
+    return radices + [2] * ((n & -n).bit_length() - 1)
+
+
+@lru_cache(maxsize=32)
+def _evaluation_domain(cls, field, n: int):
+    return cls(field, n)
+
+
+class EvaluationDomain:
+    """Multiplicative subgroup of order n of a prime field, with the tables
+    used by the transforms."""
+
+    __slots__ = (
+        "field",
+        "size",
+        "radices",
+        "generator",
+        "generator_inverse",
+        "size_inverse",
+        "_twiddles",
+        "_inverse_twiddles",
+    )
+
+    def __init__(self, field, n: int):
+        # Raises ValueError if n does not divide ORDER - 1
+        w = field.root_of_unity(n)
+        self.field = field
+        self.size = n
+        self.radices = _radices(n)
+        self.generator = w
+        self.generator_inverse = w.inverse()
+        self.size_inverse = field(n).inverse()
+        self._twiddles = None
+        self._inverse_twiddles = None
+
+    @classmethod
+    def of_size(cls, field, n: int) -> Self:
+        """Return the domain of size n of the field. The domains, and their
+        twiddle factors, are cached."""
+        return _evaluation_domain(cls, field, n)
+
+    def __repr__(self):
+        return "EvaluationDomain(F_%d, %d)" % (self.field.ORDER, self.size)
+
+    def __len__(self):
+        return self.size
+
+    def elements(self) -> list:
+        """Return the elements w^0, w^1, ..., w^(n - 1) of the domain."""
+        of_reduced = self.field._of_reduced
+        return [of_reduced(v) for v in self._powers(self.generator.v, self.size)]
+
+    def _powers(self, w, k: int) -> list:
+        p = self.field._MODULUS
+        acc = self.field.backend().of_int(1)
+        res = [acc] * k
+        for i in range(1, k):
+            acc = acc * w % p
+            res[i] = acc
+        return res
+
+    def twiddles(self) -> list:
+        """Residues of the powers of the generator used by the forward
+        transform, computed on first use."""
+        if self._twiddles is None:
+            self._twiddles = self._powers(self.generator.v, _twiddles_size(self.size))
+        return self._twiddles
+
+    def inverse_twiddles(self) -> list:
+        if self._inverse_twiddles is None:
+            w_inv = self.generator_inverse.v
+            self._inverse_twiddles = self._powers(w_inv, _twiddles_size(self.size))
+        return self._inverse_twiddles
+
+    def __check_vector(self, vector):
+        if not isinstance(vector, PrimeFieldVector) or vector.field is not self.field:
+            raise ValueError("The vector must be defined over the field of the domain")
+        if len(vector.values) != self.size:
+            raise ValueError(
+                "The vector must have the size of the domain (%d != %d)"
+                % (len(vector.values), self.size)
+            )
+
+    def ntt(
+        self, vector: PrimeFieldVector, executor: Optional[Executor] = None
+    ) -> None:
+        """Replace the coefficients a_0, ..., a_(n - 1) in the vector by the
+        evaluations of sum a_i X^i on the domain.
+
+        With an executor (e.g. a `ProcessPoolExecutor`), domains of at least
+        `PARALLEL_NTT_THRESHOLD` elements are transformed with the four-step
+        algorithm, whose sub-transforms run in the executor. The same holds
+        for the other transforms."""
+        self.__check_vector(vector)
+        self._run(vector.values, False, executor)
+
+    def intt(
+        self, vector: PrimeFieldVector, executor: Optional[Executor] = None
+    ) -> None:
+        """Inverse of `ntt`: replace evaluations on the domain by the
+        coefficients of the interpolating polynomial."""
+        self.__check_vector(vector)
+        a = vector.values
+        self._run(a, True, executor)
+        p = self.field._MODULUS
+        n_inv = self.size_inverse.v
+        a[:] = [x * n_inv % p for x in a]
+
+    def coset_ntt(
+        self,
+        vector: PrimeFieldVector,
+        shift=None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Evaluate on the coset shift * domain. The shift defaults to the
+        multiplicative generator of the field."""
+        self.__check_vector(vector)
+        self._scale(vector.values, self.__shift(shift))
+        self._run(vector.values, False, executor)
+
+    def coset_intt(
+        self,
+        vector: PrimeFieldVector,
+        shift=None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Inverse of `coset_ntt` for the same shift."""
+        self.__check_vector(vector)
+        shift = self.__shift(shift)
+        a = vector.values
+        self._run(a, True, executor)
+        # The division by n is merged with the scaling by the powers of
+        # shift^(-1)
+        self._scale(a, shift.inverse(), self.size_inverse)
+
+    def __shift(self, shift):
+        if shift is None:
+            return self.field.multiplicative_generator()
+        if not isinstance(shift, self.field):
+            raise ValueError("The shift must belong to the field of the domain")
+        if shift.is_zero():
+            raise ValueError("The shift must be non zero")
+        return shift
+
+    def _scale(self, a, g, c=None):
+        # a_i <- c * g^i * a_i
+        p = self.field._MODULUS
+        g = g.v
+        if c is None:
+            acc = g
+            start = 1
+        else:
+            acc = c.v
+            start = 0
+        for i in range(start, len(a)):
+            a[i] = a[i] * acc % p
+            acc = acc * g % p
+
+    def _transform(self, a, twiddles):
+        _transform(a, self.radices, twiddles, self.field._MODULUS)
+
+    def _run(self, a, inverse: bool, executor):
+        # Transform with the generator (or its inverse), in parallel when an
+        # executor is given and the domain is large enough
+        if executor is None or self.size < PARALLEL_NTT_THRESHOLD:
+            self._transform(a, self.inverse_twiddles() if inverse else self.twiddles())
+            return
+        root = self.generator_inverse if inverse else self.generator
+        _four_step(a, self.radices, root.v, self.field, executor)
+
+
+def _transform(a, radices, twiddles, p):
+    n = len(a)
+    _permute(a, radices)
+    m = 1
+    for r in radices:
+        stride = n // (r * m)
+        if r == 2:
+            _radix_2_stage(a, twiddles, m, stride, p)
+        else:
+            _radix_r_stage(a, twiddles, r, m, stride, p)
+        m *= r
+
+
+def _twiddles_size(n: int) -> int:
+    # Only the first half of the powers is needed when all the stages are
+    # radix-2.
+    return n // 2 if n & (n - 1) == 0 else n
+
+
+def _permute(a, radices):
+    # Reorder the inputs so that every stage combines contiguous
+    # sub-transforms: bit reversal when n is a power of two, in place.
+    n = len(a)
+    if n & (n - 1) == 0:
+        j = 0
+        for i in range(1, n):
+            bit = n >> 1
+            while j & bit:
+                j ^= bit
+                bit >>= 1
+            j ^= bit
+            if i < j:
+                a[i], a[j] = a[j], a[i]
+        return
+    # Mixed radix digit reversal. The last stage splits the inputs by
+    # their index modulo its radix, the previous one by the next digit,
+    # and so on.
+    order = [0]
+    weight = 1
+    for r in reversed(radices):
+        order = [o + d * weight for o in order for d in range(r)]
+        weight *= r
+    a[:] = [a[i] for i in order]
+
+
+def _radix_2_stage(a, twiddles, m, stride, p):
+    # Combine the pairs of sub-transforms of size m at offset b and b + m:
+    # X[j] = A[j] + w^j B[j], X[j + m] = A[j] - w^j B[j]
+    n = len(a)
+    step = 2 * m
+    if m < n // step:
+        # Many small blocks: process the j-th butterflies of all the blocks
+        # at once, as they share the twiddle factor.
+        for j in range(m):
+            lo = a[j::step]
+            hi = a[j + m :: step]
+            if j:
+                w = twiddles[j * stride]
+                hi = [x * w % p for x in hi]
+            a[j::step] = [(x + y) % p for x, y in zip(lo, hi)]
+            a[j + m :: step] = [(x - y) % p for x, y in zip(lo, hi)]
+    else:
+        w = twiddles[: m * stride : stride]
+        for b in range(0, n, step):
+            lo = a[b : b + m]
+            hi = [x * y % p for x, y in zip(a[b + m : b + step], w)]
+            a[b : b + m] = [(x + y) % p for x, y in zip(lo, hi)]
+            a[b + m : b + step] = [(x - y) % p for x, y in zip(lo, hi)]
+
+
+def _radix_r_stage(a, twiddles, r, m, stride, p):
+    # Combine r sub-transforms A_0, ..., A_(r - 1) of size m:
+    # X[j + k m] = sum_t (w_(r m)^(t j) A_t[j]) w_r^(t k)
+    n = len(a)
+    step = r * m
+    roots = [twiddles[e * (n // r)] for e in range(r)]
+    rows = [[roots[t * k % r] for t in range(r)] for k in range(r)]
+    mul = operator.mul
+    for j in range(m):
+        cols = [a[j + t * m :: step] for t in range(r)]
+        if j:
+            for t in range(1, r):
+                w = twiddles[t * j * stride]
+                cols[t] = [x * w % p for x in cols[t]]
+        xs = list(zip(*cols))
+        for k, row in enumerate(rows):
+            a[j + k * m :: step] = [sum(map(mul, x, row)) % p for x in xs]
+
+
+def _split(n: int, radices) -> int:
+    # Divisor n1 of n close to sqrt(n), product of some of the radices
+    n1 = 1
+    for r in reversed(radices):
+        if n1 * n1 * r <= n:
+            n1 *= r
+    return n1
+
+
+def _batches(count: int) -> list[range]:
+    tasks = min(count, 4 * (os.cpu_count() or 1))
+    bounds = [count * i // tasks for i in range(tasks + 1)]
+    return [range(lo, hi) for lo, hi in zip(bounds, bounds[1:])]
+
+
+def _four_step(a, radices, w, field, executor):
+    """Transform a in place with the n-th root of unity w, n = n1 n2.
+
+    With j = j1 + n1 j2 and k = k2 + n2 k1, w^(j k) is
+    w^(j1 k2) (w^n2)^(j1 k1) (w^n1)^(j2 k2), so that
+    X[k2 + n2 k1] = sum_j1 (w^n2)^(j1 k1) w^(j1 k2) B[j1][k2], where
+    B[j1] is the transform of size n2 of the row a[j1::n1].
+    """
+    n = len(a)
+    n1 = _split(n, radices)
+    n2 = n // n1
+    p = field._MODULUS
+    w = int(w)
+    root1 = pow(w, n2, int(p))
+    root2 = pow(w, n1, int(p))
+    encode = field._encode_ints
+    # Rows, multiplied by the twiddle factors w^(j1 k2)
+    futures = [
+        executor.submit(
+            _transform_batch,
+            int(p),
+            n2,
+            root2,
+            w,
+            rows.start,
+            encode([x for j1 in rows for x in a[j1::n1]], "little"),
+        )
+        for rows in _batches(n1)
+    ]
+    b = []
+    for future in futures:
+        b += field._decode_ints_exn(future.result(), "little")
+    # Columns
+    futures = [
+        (
+            columns,
+            executor.submit(
+                _transform_batch,
+                int(p),
+                n1,
+                root1,
+                None,
+                columns.start,
+                encode([x for k2 in columns for x in b[k2::n2]], "little"),
+            ),
+        )
+        for columns in _batches(n2)
+    ]
+    for columns, future in futures:
+        c = field._decode_ints_exn(future.result(), "little")
+        for i, k2 in enumerate(columns):
+            a[k2::n2] = c[i * n1 : (i + 1) * n1]
+
+
+@lru_cache(maxsize=8)
+def _worker_tables(p: int, root: int, n: int):
+    of_int = DEFAULT_BACKEND.of_int
+    p = of_int(p)
+    acc = of_int(1)
+    twiddles = [acc] * _twiddles_size(n)
+    for i in range(1, len(twiddles)):
+        acc = acc * root % p
+        twiddles[i] = acc
+    return p, _radices(n), twiddles
+
+
+def _transform_batch(p: int, n: int, root: int, twiddle, start: int, data: bytes):
+    """Task of `_four_step`, run in a worker: transform each of the vectors of
+    size n packed in data with the n-th root of unity root. If twiddle is not
+    None, the k-th coordinate of the r-th vector is then multiplied by
+    twiddle^((start + r) k). Return the packed results."""
+    p, radices, twiddles = _worker_tables(p, root, n)
+    length = (int(p).bit_length() + 7) // 8
+    of_int = DEFAULT_BACKEND.of_int
+    from_bytes = int.from_bytes
+    with memoryview(data) as mv:
+        values = [
+            of_int(from_bytes(mv[i : i + length], "little"))
+            for i in range(0, len(mv), length)
+        ]
+    res = []
+    for r in range(len(values) // n):
+        v = values[r * n : (r + 1) * n]
+        _transform(v, radices, twiddles, p)
+        if twiddle is not None and start + r:
+            t = DEFAULT_BACKEND.powmod(of_int(twiddle), start + r, p)
+            acc = t
+            for k in range(1, n):
+                v[k] = v[k] * acc % p
+                acc = acc * t % p
+        res += v
+    return b"".join([int(v).to_bytes(length, "little") for v in res])
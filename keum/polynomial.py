@@ -0,0 +1,739 @@
+"""Dense univariate polynomials over prime fields.
+
+A `Polynomial` stores the residues of its coefficients, lowest degree first,
+without trailing zeros. Like `PrimeFieldVector`, the operations work on the
+residues directly and reduce as late as possible.
+
+The multiplication is chosen from the size of the operands: schoolbook below
+`KARATSUBA_THRESHOLD` coefficients, Karatsuba below `NTT_THRESHOLD`, and an NTT
+on an `EvaluationDomain` above, when the field has a large enough subgroup of
+order a power of two. The Euclidean division uses long division when the
+quotient or the divisor is small, and otherwise computes the inverse of the
+reversed divisor with Newton iteration, i.e. with a constant number of
+multiplications.
+
+A `SubproductTree` evaluates or interpolates polynomials on an arbitrary set
+of n points in O(M(n) log n) operations, M(n) being the cost of a
+multiplication. The tree is built once per set of points, and can be reused for
+any number of polynomials.
+
+A `LagrangeBasis` evaluates polynomials given by their values on a set of
+points at any other point with the barycentric formula, in O(n) operations and
+a single batch inversion. The weights are computed once, in closed form for
+the subgroups and their cosets.
+"""
+
+from concurrent.futures import Executor
+from functools import lru_cache
+from random import Random
+from typing import Optional, Self
+
+from .ff import PrimeFieldVector
+from .ntt import EvaluationDomain
+
+# Minimum size of the smallest operand for Karatsuba and NTT multiplications.
+# Tuned on bn254.Fr with gmpy2, see benchmarks/bench_polynomial.py.
+KARATSUBA_THRESHOLD = 48
+NTT_THRESHOLD = 192
+# Minimum size of both the quotient and the divisor for the division with
+# Newton iteration. Long division, whose rows are reduced lazily, is faster on
+# smaller sizes.
+NEWTON_DIVISION_THRESHOLD = 512
+# Maximum number of points of a node of a subproduct tree on which the
+# remainder is evaluated with Horner's method instead of being reduced further.
+MULTIPOINT_HORNER_THRESHOLD = 32
+# Minimum degree of a node of a subproduct tree for which the inverse of the
+# reversed node is cached, making each division two multiplications.
+MULTIPOINT_NEWTON_THRESHOLD = 192
+
+
+def _add(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    return [x + y for x, y in zip(a, b)] + a[len(b) :]
+
+
+def _sub(a, b):
+    if len(a) >= len(b):
+        return [x - y for x, y in zip(a, b)] + a[len(b) :]
+    return [x - y for x, y in zip(a, b)] + [-y for y in b[len(a) :]]
+
+
+def _mul_schoolbook(a, b):
+    # Unreduced. One row per coefficient of the smallest operand.
+    if len(a) < len(b):
+        a, b = b, a
+    la = len(a)
+    res = [0] * (la + len(b) - 1)
+    for j, y in enumerate(b):
+        if y:
+            res[j : j + la] = [r + x * y for r, x in zip(res[j : j + la], a)]
+    return res
+
+
+def _mul_karatsuba(a, b):
+    # Unreduced, the inputs can be unreduced too.
+    if len(a) < len(b):
+        a, b = b, a
+    la = len(a)
+    lb = len(b)
+    if lb < KARATSUBA_THRESHOLD:
+        return _mul_schoolbook(a, b)
+    h = (la + 1) // 2
+    if lb <= h:
+        # Unbalanced operands: split a only
+        lo = _mul_karatsuba(a[:h], b)
+        hi = _mul_karatsuba(a[h:], b)
+        res = lo + [0] * (la + lb - 1 - len(lo))
+        res[h:] = _add(res[h:], hi)
+        return res
+    a0, a1 = a[:h], a[h:]
+    b0, b1 = b[:h], b[h:]
+    z0 = _mul_karatsuba(a0, b0)
+    z2 = _mul_karatsuba(a1, b1)
+    z1 = _sub(_sub(_mul_karatsuba(_add(a0, a1), _add(b0, b1)), z0), z2)
+    res = z0 + [0] * (la + lb - 1 - len(z0))
+    res[h:] = _add(res[h:], z1)[: la + lb - 1 - h]
+    res[2 * h :] = _add(res[2 * h :], z2)[: la + lb - 1 - 2 * h]
+    return res
+
+
+def _ntt_size(field, n: int) -> Optional[int]:
+    # Size of the power of two domain on which a product with n coefficients
+    # can be computed, None if the field does not have one.
+    size = 1 << (n - 1).bit_length()
+    if size.bit_length() - 1 > field.highest_power_of_two():
+        return None
+    return size
+
+
+def _mul_ntt(field, a, b, size: int, executor=None):
+    # Reduced inputs and output. The transforms run in the executor if any.
+    D = EvaluationDomain.of_size(field, size)
+    zero = field.backend().of_int(0)
+    n = len(a) + len(b) - 1
+    u = PrimeFieldVector._of_reduced(field, a + [zero] * (size - len(a)))
+    v = PrimeFieldVector._of_reduced(field, b + [zero] * (size - len(b)))
+    D.ntt(u, executor)
+    D.ntt(v, executor)
+    p = field._MODULUS
+    u.values = [x * y % p for x, y in zip(u.values, v.values)]
+    D.intt(u, executor)
+    return u.values[:n]
+
+
+def _mul(field, a, b, executor=None):
+    """Product of two lists of reduced residues, reduced."""
+    if not a or not b:
+        return []
+    lb = min(len(a), len(b))
+    if lb >= NTT_THRESHOLD:
+        size = _ntt_size(field, len(a) + len(b) - 1)
+        if size is not None:
+            return _mul_ntt(field, a, b, size, executor)
+    p = field._MODULUS
+    if lb < KARATSUBA_THRESHOLD:
+        return [x % p for x in _mul_schoolbook(a, b)]
+    return [x % p for x in _mul_karatsuba(a, b)]
+
+
+def _inverse_series(field, f, k: int):
+    """Return g such that f * g = 1 mod X^k, with Newton iteration
+    g <- g (2 - f g) mod X^2m. f[0] must be non zero."""
+    p = field._MODULUS
+    g = [field.backend().invert(f[0], p)]
+    m = 1
+    while m < k:
+        m = min(2 * m, k)
+        e = [-x % p for x in _mul(field, f[:m], g)[:m]]
+        e[0] = (e[0] + 2) % p
+        g = _mul(field, g, e)[:m]
+    return g
+
+
+def _long_division(field, a, b):
+    p = field._MODULUS
+    n = len(b) - 1
+    r = list(a)
+    q = [0] * (len(a) - n)
+    lc_inv = field.backend().invert(b[-1], p)
+    divisor = b[:n]
+    for i in range(len(a) - n - 1, -1, -1):
+        # r is not reduced
+        c = r[i + n] * lc_inv % p
+        q[i] = c
+        if c and n:
+            r[i : i + n] = [x - c * y for x, y in zip(r[i : i + n], divisor)]
+    return q, [x % p for x in r[:n]]
+
+
+def _divmod(field, a, b):
+    """Euclidean division of lists of reduced residues, b without trailing
+    zeros. The remainder is not stripped."""
+    n = len(b) - 1
+    k = len(a) - n
+    if k <= 0:
+        return [], list(a)
+    if min(k, n) < NEWTON_DIVISION_THRESHOLD:
+        return _long_division(field, a, b)
+    # rev(b) has a non zero constant coefficient
+    return _divmod_with_inverse(field, a, b, _inverse_series(field, b[::-1], k))
+
+
+def _divmod_with_inverse(field, a, b, inv):
+    # inv is the inverse of rev(b) modulo X^k, with at least k = len(a) - n
+    # coefficients, rev reversing the coefficients. Requires 1 <= n < len(a).
+    p = field._MODULUS
+    n = len(b) - 1
+    k = len(a) - n
+    # rev(q) = rev(a) / rev(b) mod X^k
+    q = _mul(field, a[: n - 1 : -1], inv[:k])[:k][::-1]
+    # Only the n lowest coefficients of a - b q are non zero
+    r = [x % p for x in _sub(a[:n], _mul(field, b[:n], q[:n])[:n])]
+    return q, r
+
+
+def _strip(values):
+    # Remove the trailing zeros, in place
+    while values and not values[-1]:
+        values.pop()
+    return values
+
+
+class Polynomial:
+    """A polynomial with coefficients in a prime field."""
+
+    __slots__ = ("field", "values")
+
+    def __init__(self, field, coefficients):
+        """Build a polynomial from its coefficients (integers or residues),
+        lowest degree first."""
+        field.backend()
+        p = field._MODULUS
+        self.field = field
+        self.values = _strip([v % p for v in coefficients])
+
+    @classmethod
+    def _of_reduced(cls, field, values):
+        # Trusted constructor, the residues must already be in [0, ORDER).
+        # The trailing zeros are removed.
+        r = object.__new__(cls)
+        r.field = field
+        r.values = _strip(values)
+        return r
+
+    @classmethod
+    def zero(cls, field) -> Self:
+        return cls._of_reduced(field, [])
+
+    @classmethod
+    def one(cls, field) -> Self:
+        return cls._of_reduced(field, [field.backend().of_int(1)])
+
+    @classmethod
+    def monomial(cls, field, degree: int, c=None) -> Self:
+        """Return c X^degree, c defaulting to one."""
+        c = field.one() if c is None else c
+        return cls._of_reduced(field, [0] * degree + [c.v])
+
+    @classmethod
+    def of_coefficients(cls, field, coefficients) -> Self:
+        """Build a polynomial from a list of elements of the field, lowest
+        degree first."""
+        return cls._of_reduced(field, [x.v for x in coefficients])
+
+    def coefficients(self) -> list:
+        of_reduced = self.field._of_reduced
+        return [of_reduced(v) for v in self.values]
+
+    @classmethod
+    def random(cls, field, degree: int, rng: Optional[Random] = None) -> Self:
+        """Random polynomial of degree exactly `degree`."""
+        values = field.random_vector(degree + 1, rng).values
+        while not values[-1]:
+            values[-1] = field.random(rng).v
+        return cls._of_reduced(field, values)
+
+    def degree(self) -> int:
+        """Degree of the polynomial, -1 for the zero polynomial."""
+        return len(self.values) - 1
+
+    def is_zero(self) -> bool:
+        return not self.values
+
+    def leading_coefficient(self):
+        if not self.values:
+            return self.field.zero()
+        return self.field._of_reduced(self.values[-1])
+
+    def copy(self) -> Self:
+        return self._of_reduced(self.field, self.values.copy())
+
+    def __repr__(self):
+        values = [int(v) for v in self.values]
+        return "Polynomial(F_%d, %r)" % (self.field.ORDER, values)
+
+    def __check_same_field(self, other):
+        if not isinstance(other, Polynomial) or other.field is not self.field:
+            raise ValueError("The polynomials must be defined over the same field")
+
+    def __eq__(self, other):
+        if isinstance(other, Polynomial) and other.field is self.field:
+            return self.values == other.values
+        raise ValueError("Equality only possible between polynomials of the same field")
+
+    def __add__(self, other):
+        self.__check_same_field(other)
+        p = self.field._MODULUS
+        return self._of_reduced(
+            self.field, [x % p for x in _add(self.values, other.values)]
+        )
+
+    def __sub__(self, other):
+        self.__check_same_field(other)
+        p = self.field._MODULUS
+        return self._of_reduced(
+            self.field, [x % p for x in _sub(self.values, other.values)]
+        )
+
+    def negate(self) -> Self:
+        p = self.field._MODULUS
+        return self._of_reduced(self.field, [p - x if x else x for x in self.values])
+
+    def __neg__(self):
+        return self.negate()
+
+    def scalar_mul(self, c) -> Self:
+        if not isinstance(c, self.field):
+            raise ValueError("The scalar must belong to the field of the polynomial")
+        p = self.field._MODULUS
+        c = c.v
+        return self._of_reduced(self.field, [x * c % p for x in self.values])
+
+    def mul(self, other, executor: Optional[Executor] = None) -> Self:
+        """Product of polynomials. With an executor (e.g. a
+        `ProcessPoolExecutor`), the transforms of a product computed with an
+        NTT run in parallel, see `EvaluationDomain.ntt`."""
+        self.__check_same_field(other)
+        return self._of_reduced(
+            self.field, _mul(self.field, self.values, other.values, executor)
+        )
+
+    def __mul__(self, other):
+        """Product of polynomials. Use `scalar_mul` for a scalar."""
+        return self.mul(other)
+
+    def evaluate(self, x):
+        """Evaluate at x with Horner's method, reducing once per coefficient."""
+        if not isinstance(x, self.field):
+            raise ValueError("The point must belong to the field of the polynomial")
+        p = self.field._MODULUS
+        x = x.v
+        acc = self.field.backend().of_int(0)
+        for c in reversed(self.values):
+            acc = (acc * x + c) % p
+        return self.field._of_reduced(acc)
+
+    def __call__(self, x):
+        return self.evaluate(x)
+
+    def derivative(self) -> Self:
+        p = self.field._MODULUS
+        return self._of_reduced(
+            self.field, [i * c % p for i, c in enumerate(self.values) if i]
+        )
+
+    def __divmod__(self, other):
+        """Euclidean division, returns (quotient, remainder)."""
+        self.__check_same_field(other)
+        if other.is_zero():
+            raise ValueError("Division by zero")
+        q, r = _divmod(self.field, self.values, other.values)
+        return self._of_reduced(self.field, q), self._of_reduced(self.field, r)
+
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        return divmod(self, other)[1]
+
+    @classmethod
+    def vanishing_polynomial(cls, domain: EvaluationDomain, shift=None) -> Self:
+        """Return X^n - shift^n, vanishing on shift * domain, n being the size
+        of the domain. The shift defaults to one."""
+        field = domain.field
+        c = field.one() if shift is None else shift.pow(domain.size)
+        return cls._of_reduced(field, [c.negate().v] + [0] * (domain.size - 1) + [1])
+
+    def divide_by_vanishing_polynomial(
+        self, domain: EvaluationDomain, shift=None
+    ) -> tuple[Self, Self]:
+        """Euclidean division by X^n - c, c = shift^n (see
+        `vanishing_polynomial`), in a linear number of operations."""
+        field = self.field
+        if domain.field is not field:
+            raise ValueError(
+                "The domain must be defined over the field of the polynomial"
+            )
+        n = domain.size
+        a = self.values
+        if len(a) <= n:
+            return self.zero(field), self.copy()
+        p = field._MODULUS
+        c = 1 if shift is None else shift.pow(n).v
+        # With a = q (X^n - c) + r: q_i = a_(i + n) + c q_(i + n), from the
+        # top, and r_i = a_i + c q_i.
+        q = a[n:]
+        for i in range(len(q) - n - 1, -1, -1):
+            q[i] = (q[i] + c * q[i + n]) % p
+        r = [(x + c * y) % p for x, y in zip(a[:n], q)] + a[len(q) : n]
+        return self._of_reduced(field, q), self._of_reduced(field, r)
+
+    def evaluate_on_domain(
+        self,
+        domain: EvaluationDomain,
+        shift=None,
+        executor: Optional[Executor] = None,
+    ) -> PrimeFieldVector:
+        """Evaluations on the domain (or the coset shift * domain) with an NTT,
+        in parallel with an executor. The degree must be smaller than the size
+        of the domain."""
+        n = domain.size
+        if len(self.values) > n:
+            raise ValueError(
+                "The degree must be smaller than the size of the domain (%d >= %d)"
+                % (self.degree(), n)
+            )
+        zero = self.field.backend().of_int(0)
+        v = PrimeFieldVector._of_reduced(
+            self.field, self.values + [zero] * (n - len(self.values))
+        )
+        if shift is None:
+            domain.ntt(v, executor)
+        else:
+            domain.coset_ntt(v, shift, executor)
+        return v
+
+    @classmethod
+    def interpolate_on_domain(
+        cls,
+        domain: EvaluationDomain,
+        evaluations: PrimeFieldVector,
+        shift=None,
+        executor: Optional[Executor] = None,
+    ) -> Self:
+        """Inverse of `evaluate_on_domain`. The vector is left untouched."""
+        v = evaluations.copy()
+        if shift is None:
+            domain.intt(v, executor)
+        else:
+            domain.coset_intt(v, shift, executor)
+        return cls._of_reduced(domain.field, v.values)
+
+
+def _residues(field, elements):
+    # Residues of a PrimeFieldVector or of a sequence of elements of the field
+    if isinstance(elements, PrimeFieldVector):
+        if elements.field is not field:
+            raise ValueError("The vector must be defined over the field %r" % field)
+        return elements.values
+    values = []
+    for x in elements:
+        if not isinstance(x, field):
+            raise ValueError("The elements must belong to the field %r" % field)
+        values.append(x.v)
+    return values
+
+
+def _horner(field, values, x):
+    p = field._MODULUS
+    acc = 0
+    for c in reversed(values):
+        acc = (acc * x + c) % p
+    return acc
+
+
+class SubproductTree:
+    """Subproduct tree of a set of points x_0, ..., x_(n - 1) of a prime field.
+
+    The leaves are the polynomials X - x_i, and each node is the product of its
+    two children (the last node of a level is carried up as is when the level
+    has an odd number of nodes). `levels[0]` holds the leaves, `levels[-1]` the
+    root, i.e. the vanishing polynomial of the points. Node j of level k
+    vanishes on the points of indices j 2^k to (j + 1) 2^k - 1.
+
+    The evaluation reduces the polynomial modulo the nodes from the root down
+    to the nodes of at most `MULTIPOINT_HORNER_THRESHOLD` points, which are
+    evaluated with Horner's method. The inverses of the reversed nodes used by
+    the divisions are cached in the tree. The interpolation goes up the tree with the
+    weights 1 / M'(x_i), M being the root, computed once with a batch
+    inversion.
+    """
+
+    __slots__ = ("field", "points", "levels", "_inverses", "_weights")
+
+    def __init__(self, field, points):
+        """Build the tree of the points, given as a `PrimeFieldVector` or a
+        sequence of elements of the field."""
+        field.backend()
+        values = list(_residues(field, points))
+        if not values:
+            raise ValueError("At least one point is required")
+        p = field._MODULUS
+        level = [[-x % p, 1] for x in values]
+        levels = [level]
+        while len(level) > 1:
+            nodes = [
+                _mul(field, level[j], level[j + 1]) for j in range(0, len(level) - 1, 2)
+            ]
+            if len(level) % 2:
+                nodes.append(level[-1])
+            level = nodes
+            levels.append(level)
+        self.field = field
+        self.points = PrimeFieldVector._of_reduced(field, values)
+        self.levels = levels
+        self._inverses = {}
+        self._weights = None
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return "SubproductTree(F_%d, %d)" % (self.field.ORDER, len(self))
+
+    def vanishing_polynomial(self) -> Polynomial:
+        """The product of the X - x_i."""
+        return Polynomial._of_reduced(self.field, self.levels[-1][0].copy())
+
+    def _remainder(self, values, k: int, j: int):
+        # Remainder of the division by the node j of level k
+        field = self.field
+        b = self.levels[k][j]
+        n = len(b) - 1
+        if len(values) <= n or n < MULTIPOINT_NEWTON_THRESHOLD:
+            return _divmod(field, values, b)[1]
+        inv = self._inverses.get((k, j))
+        if inv is None:
+            # The remainders divided by a node have at most twice its degree
+            inv = _inverse_series(field, b[::-1], n)
+            self._inverses[(k, j)] = inv
+        if len(values) - n > len(inv):
+            return _divmod(field, values, b)[1]
+        return _divmod_with_inverse(field, values, b, inv)[1]
+
+    def _evaluate(self, values):
+        field = self.field
+        points = self.points.values
+        n = len(points)
+        levels = self.levels
+        top = len(levels) - 1
+        # Lowest level reached by the remainders
+        low = min(top, MULTIPOINT_HORNER_THRESHOLD.bit_length() - 1)
+        remainders = [self._remainder(values, top, 0)]
+        for k in range(top - 1, low - 1, -1):
+            width = len(levels[k])
+            reduced = []
+            for j, r in enumerate(remainders):
+                reduced.append(self._remainder(r, k, 2 * j))
+                if 2 * j + 1 < width:
+                    reduced.append(self._remainder(r, k, 2 * j + 1))
+            remainders = reduced
+        res = []
+        for j, r in enumerate(remainders):
+            for x in points[j << low : min((j + 1) << low, n)]:
+                res.append(_horner(field, r, x))
+        return res
+
+    def evaluate(self, polynomial: Polynomial) -> PrimeFieldVector:
+        """Evaluations of the polynomial at the points, in the same order."""
+        if not isinstance(polynomial, Polynomial) or polynomial.field is not self.field:
+            raise ValueError(
+                "The polynomial must be defined over the field of the tree"
+            )
+        return PrimeFieldVector._of_reduced(
+            self.field, self._evaluate(polynomial.values)
+        )
+
+    def weights(self) -> PrimeFieldVector:
+        """The 1 / M'(x_i), M being the vanishing polynomial of the points.
+        Computed on first use with a batch inversion, then cached. Raises
+        ValueError if the points are not distinct."""
+        if self._weights is None:
+            field = self.field
+            derivative = self.vanishing_polynomial().derivative()
+            # M'(x_i) is zero if and only if x_i is a multiple root of M
+            d = self._evaluate(derivative.values)
+            if not all(d):
+                raise ValueError("The points must be distinct")
+            d = PrimeFieldVector._of_reduced(field, d)
+            self._weights = d.batch_inverse()
+        return self._weights
+
+    def interpolate(self, values) -> Polynomial:
+        """The polynomial of degree smaller than the number of points taking
+        the given values (a `PrimeFieldVector` or a sequence of elements) at
+        the points."""
+        field = self.field
+        values = _residues(field, values)
+        if len(values) != len(self):
+            raise ValueError("Expected %d values, got %d" % (len(self), len(values)))
+        p = field._MODULUS
+        # The node j of level k holds sum_i c_i M_(j, k) / (X - x_i), M_(j, k)
+        # being the node of the tree, with c_i = y_i / M'(x_i).
+        acc = [[y * w % p] for y, w in zip(values, self.weights().values)]
+        for level in self.levels[:-1]:
+            combined = [
+                [
+                    x % p
+                    for x in _add(
+                        _mul(field, acc[j], level[j + 1]),
+                        _mul(field, acc[j + 1], level[j]),
+                    )
+                ]
+                for j in range(0, len(acc) - 1, 2)
+            ]
+            if len(acc) % 2:
+                combined.append(acc[-1])
+            acc = combined
+        return Polynomial._of_reduced(field, acc[0])
+
+
+@lru_cache(maxsize=32)
+def _lagrange_basis_of_domain(cls, domain, shift):
+    return cls._of_domain(domain, shift)
+
+
+class LagrangeBasis:
+    """Lagrange basis L_0, ..., L_(n - 1) of a set of n distinct points
+    x_0, ..., x_(n - 1), i.e. L_i(x_j) = 1 if i = j and 0 otherwise.
+
+    With Z = prod (X - x_j) and the barycentric weights w_i = 1 / Z'(x_i),
+    L_i(z) = Z(z) w_i / (z - x_i). For the subgroup of order n, or its coset
+    g * domain, Z = X^n - g^n and w_i = x_i / (n g^n).
+    """
+
+    __slots__ = ("field", "points", "weights", "_vanishing_constant")
+
+    def __init__(self, field, points):
+        """Basis of distinct points, given as a `PrimeFieldVector` or a sequence
+        of elements. The weights are computed with a `SubproductTree`."""
+        tree = SubproductTree(field, points)
+        self.field = field
+        self.points = tree.points
+        self.weights = tree.weights()
+        # Z(z) is computed as a product for arbitrary points
+        self._vanishing_constant = None
+
+    @classmethod
+    def of_domain(cls, domain: EvaluationDomain, shift=None) -> Self:
+        """Basis of the elements of the domain, or of the coset
+        shift * domain, in the order of `EvaluationDomain.elements`. The bases
+        are cached."""
+        if shift is not None and not isinstance(shift, domain.field):
+            raise ValueError("The shift must belong to the field of the domain")
+        if shift is not None and shift.is_zero():
+            raise ValueError("The shift must be non zero")
+        return _lagrange_basis_of_domain(cls, domain, shift)
+
+    @classmethod
+    def _of_domain(cls, domain, shift):
+        field = domain.field
+        g = field.one() if shift is None else shift
+        c = g.pow(domain.size)
+        p = field._MODULUS
+        # x_i = g w^i and w_i = x_i / (n c)
+        powers = domain._powers(domain.generator.v, domain.size)
+        gv = g.v
+        scale = (g * domain.size_inverse * c.inverse()).v
+        points = [x * gv % p for x in powers]
+        weights = [x * scale % p for x in powers]
+        r = object.__new__(cls)
+        r.field = field
+        r.points = PrimeFieldVector._of_reduced(field, points)
+        r.weights = PrimeFieldVector._of_reduced(field, weights)
+        r._vanishing_constant = c.v
+        return r
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return "LagrangeBasis(F_%d, %d)" % (self.field.ORDER, len(self))
+
+    def _scaled_inverses(self, z):
+        # Return (i, None, None) if z is the i-th point, and otherwise
+        # (None, [w_i / (z - x_i)], Z(z)), with a single inversion
+        p = self.field._MODULUS
+        d = [(z - x) % p for x in self.points.values]
+        for i, x in enumerate(d):
+            if not x:
+                return i, None, None
+        c = self._vanishing_constant
+        if c is None:
+            vanishing = 1
+            for x in d:
+                vanishing = vanishing * x % p
+        else:
+            vanishing = (self.field.backend().powmod(z, len(d), p) - c) % p
+        inverses = self.field._batch_inverse_values(d, False)
+        return (
+            None,
+            [x * y % p for x, y in zip(inverses, self.weights.values)],
+            vanishing,
+        )
+
+    def __check_point(self, z):
+        if not isinstance(z, self.field):
+            raise ValueError("The point must belong to the field of the basis")
+
+    def evaluate_basis(self, z) -> PrimeFieldVector:
+        """The values L_0(z), ..., L_(n - 1)(z). The evaluation at z of a
+        polynomial with values y_i at the points is then the dot product of
+        the y_i with this vector."""
+        self.__check_point(z)
+        field = self.field
+        zero = field.backend().of_int(0)
+        i, t, vanishing = self._scaled_inverses(z.v)
+        if i is not None:
+            values = [zero] * len(self)
+            values[i] = field.backend().of_int(1)
+            return PrimeFieldVector._of_reduced(field, values)
+        p = field._MODULUS
+        return PrimeFieldVector._of_reduced(field, [x * vanishing % p for x in t])
+
+    def evaluate(self, values, z):
+        """Evaluate at z the polynomial of degree smaller than n taking the
+        given values (a `PrimeFieldVector` or a sequence of elements) at the
+        points, without interpolating it."""
+        self.__check_point(z)
+        field = self.field
+        values = _residues(field, values)
+        if len(values) != len(self):
+            raise ValueError("Expected %d values, got %d" % (len(self), len(values)))
+        i, t, vanishing = self._scaled_inverses(z.v)
+        if i is not None:
+            return field._of_reduced(values[i])
+        p = field._MODULUS
+        acc = sum(x * y for x, y in zip(values, t)) % p
+        return field._of_reduced(acc * vanishing % p)
+
+
+def multi_evaluate(polynomial: Polynomial, points) -> PrimeFieldVector:
+    """Evaluate the polynomial at the points (a `PrimeFieldVector` or a
+    sequence of elements). Build a `SubproductTree` to evaluate several
+    polynomials at the same points."""
+    return SubproductTree(polynomial.field, points).evaluate(polynomial)
+
+
+def interpolate(points, values) -> Polynomial:
+    """The polynomial of degree smaller than n taking the n given values at the
+    n distinct points. Build a `SubproductTree` to interpolate several sets of
+    values on the same points."""
+    if isinstance(points, PrimeFieldVector):
+        field = points.field
+    elif len(points) > 0:
+        field = type(points[0])
+    else:
+        raise ValueError("At least one point is required")
+    return SubproductTree(field, points).interpolate(values)
@@ -1,17 +1,51 @@
 from keum import PrimeFiniteField
-from keum import AffineWeierstrass
+from keum import AffineWeierstrass, JacobianWeierstrass
 
 
 class Fr(PrimeFiniteField):
     ORDER = (
         115792089237316195423570985008687907852837564279074904382605163141518161494337
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 6,
+        3: 1,
+        149: 1,
+        631: 1,
+        107361793816595537: 1,
+        174723607534414371449: 1,
+        341948486974166000522343609283189: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 7
+    TWO_ADICITY = 6
+    TWO_ADIC_ROOT_OF_UNITY = (
+        5480320495727936603795231718619559942670027629901634955707709633242980176626
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        114539184217483645631749302494699790103953888271916457836991446622878418537756
+    )
 
 
 class Fq(PrimeFiniteField):
     ORDER = (
         115792089237316195423570985008687907853269984665640564039457584007908834671663
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 1,
+        3: 1,
+        7: 1,
+        13441: 1,
+        205115282021455665897114700593932402728804164701536103180137503955397371: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 3
+    TWO_ADICITY = 1
+    TWO_ADIC_ROOT_OF_UNITY = (
+        115792089237316195423570985008687907853269984665640564039457584007908834671662
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        115792089237316195423570985008687907853269984665640564039457584007908834671662
+    )
 
 
 class AffineWeierstrass(AffineWeierstrass):
@@ -26,3 +60,14 @@ class AffineWeierstrass(AffineWeierstrass):
     GENERATOR_Y = Fq(
         32670510020758816978083085130507043184471273380659243275938904335757337482424
     )
+
+
+class JacobianWeierstrass(JacobianWeierstrass):
+    Fq = Fq
+    Fr = Fr
+    A = AffineWeierstrass.A
+    B = AffineWeierstrass.B
+    COFACTOR = AffineWeierstrass.COFACTOR
+    GENERATOR_X = AffineWeierstrass.GENERATOR_X
+    GENERATOR_Y = AffineWeierstrass.GENERATOR_Y
+    AFFINE = AffineWeierstrass
@@ -1,17 +1,62 @@
 from keum import PrimeFiniteField
-from keum import AffineWeierstrass
+from keum import AffineWeierstrass, JacobianWeierstrass
 
 
 class Fr(PrimeFiniteField):
     ORDER = (
         115792089210356248762697446949407573529996955224135760342422259061068512044369
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 4,
+        3: 1,
+        71: 1,
+        131: 1,
+        373: 1,
+        3407: 1,
+        17449: 1,
+        38189: 1,
+        187019741: 1,
+        622491383: 1,
+        1002328039319: 1,
+        2624747550333869278416773953: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 7
+    TWO_ADICITY = 4
+    TWO_ADIC_ROOT_OF_UNITY = (
+        115695789336771192084080718687965001507772259361175921799893286721837170845186
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        72664086273192055409688005800099041138596643947880547182494517239577691240292
+    )
 
 
 class Fq(PrimeFiniteField):
     ORDER = (
         115792089210356248762697446949407573530086143415290314195533631308867097853951
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 1,
+        3: 1,
+        5: 2,
+        17: 1,
+        257: 1,
+        641: 1,
+        1531: 1,
+        65537: 1,
+        490463: 1,
+        6700417: 1,
+        835945042244614951780389953367877943453916927241: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 6
+    TWO_ADICITY = 1
+    TWO_ADIC_ROOT_OF_UNITY = (
+        115792089210356248762697446949407573530086143415290314195533631308867097853950
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        115792089210356248762697446949407573530086143415290314195533631308867097853950
+    )
 
 
 class AffineWeierstrass(AffineWeierstrass):
@@ -30,3 +75,14 @@ class AffineWeierstrass(AffineWeierstrass):
     GENERATOR_Y = Fq(
         36134250956749795798585127919587881956611106672985015071877198253568414405109
     )
+
+
+class JacobianWeierstrass(JacobianWeierstrass):
+    Fq = Fq
+    Fr = Fr
+    A = AffineWeierstrass.A
+    B = AffineWeierstrass.B
+    COFACTOR = AffineWeierstrass.COFACTOR
+    GENERATOR_X = AffineWeierstrass.GENERATOR_X
+    GENERATOR_Y = AffineWeierstrass.GENERATOR_Y
+    AFFINE = AffineWeierstrass
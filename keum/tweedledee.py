@@ -1,17 +1,47 @@
 from keum import PrimeFiniteField
-from keum import AffineWeierstrass
+from keum import AffineWeierstrass, JacobianWeierstrass
 
 
 class Fq(PrimeFiniteField):
     ORDER = (
         28948022309329048855892746252171976963322203655954433126947083963168578338817
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 34,
+        3: 1,
+        4322432633228119: 1,
+        129942003317277863333406104563609448670518081918257: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 5
+    TWO_ADICITY = 34
+    TWO_ADIC_ROOT_OF_UNITY = (
+        7800604369215000193760722976830082688947948669085139141819171589611499378668
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        8441925445603988557592436029963443735576479399847181472018263500751214009858
+    )
 
 
 class Fr(PrimeFiniteField):
     ORDER = (
         28948022309329048855892746252171976963322203655955319056773317069363642105857
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 33,
+        3: 1,
+        5179: 1,
+        216901160674121772178243990852639108850176422522235334586122689: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 5
+    TWO_ADICITY = 33
+    TWO_ADIC_ROOT_OF_UNITY = (
+        19400540447233431299362144148489679194329882900596822232901065060541459347406
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        12906780672999437371533316088611996510076619312442860467577970299777150764475
+    )
 
 
 class AffineWeierstrass(AffineWeierstrass):
@@ -22,3 +52,14 @@ class AffineWeierstrass(AffineWeierstrass):
     COFACTOR = 1
     GENERATOR_X = Fq(1).negate()
     GENERATOR_Y = Fq(2)
+
+
+class JacobianWeierstrass(JacobianWeierstrass):
+    Fq = Fq
+    Fr = Fr
+    A = AffineWeierstrass.A
+    B = AffineWeierstrass.B
+    COFACTOR = AffineWeierstrass.COFACTOR
+    GENERATOR_X = AffineWeierstrass.GENERATOR_X
+    GENERATOR_Y = AffineWeierstrass.GENERATOR_Y
+    AFFINE = AffineWeierstrass
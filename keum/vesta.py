@@ -1,17 +1,50 @@
 from keum import PrimeFiniteField
-from keum import AffineWeierstrass, ProjectiveWeierstrass
+from keum import AffineWeierstrass, ProjectiveWeierstrass, JacobianWeierstrass
 
 
 class Fq(PrimeFiniteField):
     ORDER = (
         28948022309329048855892746252171976963363056481941647379679742748393362948097
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 32,
+        3: 2,
+        1709: 1,
+        24859: 1,
+        1690502597179744445941507: 1,
+        10427374428728808478656897599072717: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 5
+    TWO_ADICITY = 32
+    TWO_ADIC_ROOT_OF_UNITY = (
+        20761624379169977859705911634190121761503565370703356079647768903521299517535
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        15473837148386567524843853340053283363563732086807834867098186504222884456502
+    )
 
 
 class Fr(PrimeFiniteField):
     ORDER = (
         28948022309329048855892746252171976963363056481941560715954676764349967630337
     )
+    TRUSTED_PRIME_ORDER = True
+    PRIME_DECOMPOSITION = {
+        2: 32,
+        3: 1,
+        463: 1,
+        539204044132271846773: 1,
+        8999194758858563409123804352480028797519453: 1,
+    }
+    MULTIPLICATIVE_GENERATOR = 5
+    TWO_ADICITY = 32
+    TWO_ADIC_ROOT_OF_UNITY = (
+        19814229590243028906643993866117402072516588566294623396325693409366934201135
+    )
+    TWO_ADIC_ROOT_OF_UNITY_INVERSE = (
+        20278381027301128054966451283949098903157062660188087428315625391740337164790
+    )
 
 
 class AffineWeierstrass(AffineWeierstrass):
@@ -32,3 +65,15 @@ class ProjectiveWeierstrass(ProjectiveWeierstrass):
     COFACTOR = 1
     GENERATOR_X = Fq(1).negate()
     GENERATOR_Y = Fq(2)
+    AFFINE = AffineWeierstrass
+
+
+class JacobianWeierstrass(JacobianWeierstrass):
+    Fq = Fq
+    Fr = Fr
+    A = AffineWeierstrass.A
+    B = AffineWeierstrass.B
+    COFACTOR = AffineWeierstrass.COFACTOR
+    GENERATOR_X = AffineWeierstrass.GENERATOR_X
+    GENERATOR_Y = AffineWeierstrass.GENERATOR_Y
+    AFFINE = AffineWeierstrass
@@ -1,5 +1,13 @@
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
-from keum import FiniteField, PrimeFiniteField
+from keum import FiniteField, PrimeFiniteField, ec
+from keum.backend import available_backends
 from keum import (
     babyjubjub,
     secp256k1,
@@ -24,6 +32,10 @@ from keum import (
         tweedledee.AffineWeierstrass,
         tweedledum.AffineWeierstrass,
         vesta.AffineWeierstrass,
+        secp256k1.JacobianWeierstrass,
+        secp256r1.JacobianWeierstrass,
+        pallas.JacobianWeierstrass,
+        bn254.JacobianWeierstrass,
     ]
 )
 def Ec(request):
@@ -55,6 +67,22 @@ def AffineEc(request):
     return request.param
 
 
+@pytest.fixture(
+    params=[
+        secp256k1,
+        secp256r1,
+        pallas,
+        vesta,
+        bn254,
+        grumpkin,
+        tweedledee,
+        tweedledum,
+    ]
+)
+def Curve(request):
+    return request.param
+
+
 def test_affine_random_is_on_the_curve(AffineEc):
     a = AffineEc.random()
     assert AffineEc.is_on_curve(a.x, a.y)
@@ -159,3 +187,325 @@ def test_distributivity_scalar_multiplication(Ec):
     lhs = (p1 + p2).mul(a)
     rhs = p1.mul(a) + p2.mul(a)
     assert lhs == rhs
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_curve_operations_on_every_backend(backend):
+    Fq = pallas.Fq.with_backend(backend)
+    Fr = pallas.Fr.with_backend(backend)
+
+    class Ec(pallas.AffineWeierstrass):
+        pass
+
+    Ec.Fq = Fq
+    Ec.Fr = Fr
+    Ec.A = Fq(0)
+    Ec.B = Fq(5)
+    Ec.GENERATOR_X = Fq(-1)
+    Ec.GENERATOR_Y = Fq(2)
+    g = Ec.generator()
+    p = Ec.random()
+    a = Fr.random()
+    assert Ec.is_on_curve(p.x, p.y)
+    assert (g + p).mul(a) == g.mul(a) + p.mul(a)
+    assert isinstance(p.x.v, type(backend.of_int(0)))
+    # Scalars given as residues of the backend
+    n = backend.of_int(a.to_int())
+    assert p.mul(n) == p.mul(a)
+    assert Ec.msm([g, p], [n, 3]) == g.mul(a) + p.mul(3)
+
+
+def test_random_with_seed(Ec):
+    assert Ec.random(random.Random(7)) == Ec.random(random.Random(7))
+
+
+def test_affine_random_points(AffineEc):
+    points = AffineEc.random_points(10, random.Random(3))
+    assert len(points) == 10
+    for p in points:
+        assert AffineEc.is_on_curve(p.x, p.y)
+        assert AffineEc.is_in_prime_subgroup(p.x, p.y)
+    assert points == AffineEc.random_points(10, random.Random(3))
+
+
+def test_projective_random_points(ProjectiveEc):
+    points = ProjectiveEc.random_points(10, random.Random(3))
+    assert len(points) == 10
+    for p in points:
+        assert ProjectiveEc.is_on_curve(x=p.x, y=p.y, z=p.z)
+    assert points == ProjectiveEc.random_points(10, random.Random(3))
+
+
+def test_hash_is_consistent_with_equality(Ec):
+    p = Ec.random()
+    q = p.double() + p.negate()
+    assert p == q
+    assert hash(p) == hash(q)
+    assert len({p, q, Ec.zero(), p + p.negate()}) == 2
+
+
+def test_jacobian_doubling_formula():
+    assert secp256k1.JacobianWeierstrass._double.__name__ == "_double_a_zero"
+    assert secp256r1.JacobianWeierstrass._double.__name__ == "_double_a_minus_three"
+    assert babyjubjub.JacobianWeierstrass._double.__name__ == "_double_generic"
+
+
+def test_jacobian_agrees_with_affine(Curve):
+    Jacobian = Curve.JacobianWeierstrass
+    Affine = Curve.AffineWeierstrass
+    p, q = Affine.random_points(2, random.Random(5))
+    jp = Jacobian.from_affine_coordinates_exn(p.x, p.y)
+    jq = Jacobian.from_affine_coordinates_exn(q.x, q.y)
+    assert Jacobian.generator().to_affine_coordinates() == (
+        Affine.GENERATOR_X,
+        Affine.GENERATOR_Y,
+    )
+    s = p + q
+    assert (jp + jq).to_affine_coordinates() == (s.x, s.y)
+    assert (jp.double() + jq).add_mixed(q) == jp.double() + jq.double()
+    d = p.double()
+    assert jp.double().to_affine_coordinates() == (d.x, d.y)
+    # Non trivial Z coordinates
+    r = jp.double() + jq
+    assert Jacobian.is_on_curve(r.x, r.y, r.z)
+    assert r.add_mixed(p) == r + jp
+    assert r.add_mixed(p.negate()) == r + jp.negate()
+    assert r.add_mixed(Affine.zero()) == r
+    assert Jacobian.zero().add_mixed(p) == jp
+    assert jp.add_mixed(p) == jp.double()
+    assert jp.add_mixed(p.negate()).is_zero()
+    a = Curve.Fr.random()
+    assert r.mul(a) == (jp.double() + jq).mul(a)
+    assert jp.mul(Curve.Fr(3)) == jp + jp + jp
+
+
+def test_projective_equality(ProjectiveEc):
+    p, q = ProjectiveEc.random().double(), ProjectiveEc.random()
+    c = ProjectiveEc.Fq.random()
+    assert p == ProjectiveEc(p.x * c, p.y * c, p.z * c)
+    assert p != q
+    assert p != p.negate()
+    assert p != ProjectiveEc.zero()
+    assert ProjectiveEc.zero() == ProjectiveEc(p.x, p.y, ProjectiveEc.Fq.zero())
+    assert hash(p) == hash(ProjectiveEc(p.x * c, p.y * c, p.z * c))
+
+
+def test_batch_to_affine(Curve):
+    for Ec in [
+        Curve.JacobianWeierstrass,
+        getattr(Curve, "ProjectiveWeierstrass", None),
+    ]:
+        if Ec is None:
+            continue
+        # Non trivial Z coordinates
+        points = [p.double() for p in Ec.random_points(5, random.Random(2))]
+        points.insert(2, Ec.zero())
+        affine = Ec.batch_to_affine(points)
+        assert all(isinstance(p, Curve.AffineWeierstrass) for p in affine)
+        assert affine[2].is_zero()
+        for p, a in zip(points, affine):
+            if not p.is_zero():
+                assert (a.x, a.y) == p.to_affine_coordinates()
+            assert p.to_affine() == a
+        assert Ec.batch_to_affine([]) == []
+
+
+def test_jacobian_generic_doubling():
+    Jacobian = babyjubjub.JacobianWeierstrass
+    p = Jacobian.random(random.Random(1))
+    q = p.double()
+    assert Jacobian.is_on_curve(q.x, q.y, q.z)
+    assert q.double() == q + q
+    assert q + p + p == q.double()
+
+
+def test_mul_matches_repeated_addition(Ec):
+    p = Ec.random()
+    acc = Ec.zero()
+    for n in range(40):
+        assert p.mul(n) == acc
+        assert p.mul(Ec.Fr(n)) == acc
+        assert p.mul(-n) == acc.negate()
+        for window in [2, 3, 6]:
+            assert p.mul(n, window) == acc
+        acc = acc + p
+
+
+def test_mul_is_exact_on_large_scalars(Ec):
+    # The scalars are not rounded: the order of the group is exact
+    if Ec is grumpkin.AffineWeierstrass:
+        pytest.skip("B is 3 instead of -17, Fr is not the order of this group")
+    g = Ec.generator()
+    assert g.mul(Ec.Fr.ORDER).is_zero()
+    assert g.mul(Ec.Fr.ORDER + 1) == g
+    a = Ec.Fr.random().to_int()
+    b = Ec.Fr.random().to_int()
+    assert g.mul(a) + g.mul(b) == g.mul(a + b)
+    assert g.mul(a).mul(b) == g.mul(a * b)
+    assert g.mul(a, window=2) == g.mul(a, window=7)
+    with pytest.raises(ValueError):
+        g.mul(a, window=1)
+
+
+def test_wnaf_chain():
+    for n in [1, 2, 7, 255, 1 << 100, 3**80]:
+        for w in [2, 3, 5]:
+            chain = ec._wnaf_chain(n, w)
+            acc = 0
+            for nb_doublings, digit in chain:
+                assert digit % 2 == 1 or digit == 0
+                assert abs(digit) < 1 << (w - 1)
+                acc = (acc << nb_doublings) + digit
+            assert acc == n
+
+
+def test_generator_is_cached(Ec):
+    g = Ec.generator()
+    assert Ec.generator() == g
+    assert Ec.generator() is not g
+
+
+@pytest.mark.parametrize("window", [1, 2, 5])
+def test_fixed_base(Ec, window):
+    p = Ec.random()
+    table = ec.FixedBase(p, window)
+    bits = Ec.Fr.ORDER.bit_length()
+    scalars = [0, 1, 2, 3, -1, Ec.Fr.ORDER - 1, (1 << bits) - 1, 1 << bits, 3 << 300]
+    for n in scalars + [Ec.Fr.random().to_int() for _ in range(3)]:
+        assert table.mul(n) == p.mul(n)
+    a = Ec.Fr.random()
+    assert table.mul(a) == p.mul(a)
+
+
+def test_fixed_base_caches(Ec):
+    p = Ec.random()
+    assert ec.FixedBase.of_point(p) is ec.FixedBase.of_point(p)
+    assert ec.FixedBase.of_point(p, 3) is not ec.FixedBase.of_point(p)
+    assert ec.FixedBase.of_generator(Ec) is ec.FixedBase.of_generator(Ec)
+    a = Ec.Fr.random()
+    assert Ec.mul_generator(a) == Ec.generator().mul(a)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 33])
+def test_msm(Ec, n):
+    points = Ec.random_points(n, random.Random(n))
+    scalars = [Ec.Fr.random() for _ in range(n)]
+    expected = Ec.zero()
+    for p, k in zip(points, scalars):
+        expected = expected + p.mul(k)
+    assert Ec.msm(points, scalars) == expected
+    ints = [k.to_int() for k in scalars]
+    for window in [1, 3, 8]:
+        assert Ec.msm(points, ints, window) == expected
+
+
+def test_msm_edge_cases(Ec):
+    p, q = Ec.random_points(2, random.Random(11))
+    assert Ec.msm([p, q, Ec.zero()], [-3, 0, 5]) == p.mul(-3)
+    assert Ec.msm([p, p], [1, -1]).is_zero()
+    assert Ec.msm([p, q], [1, 1 << 300]) == p + q.mul(1 << 300)
+    assert Ec.msm([p], [1]) is not p
+    with pytest.raises(ValueError):
+        Ec.msm([p, q], [1])
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 64])
+def test_sum_points(Ec, n):
+    points = Ec.random_points(n, random.Random(n))
+    expected = Ec.zero()
+    for p in points:
+        expected = expected + p
+    assert Ec.sum_points(points) == expected
+    # With zeros, opposite points and doublings
+    extra = [Ec.zero()] + [p.negate() for p in points[:3]] + points[:3] + points[:2]
+    for p in points[:2]:
+        expected = expected + p
+    assert Ec.sum_points(points + extra) == expected
+    assert Ec.sum_points([]).is_zero()
+
+
+def test_batch_add(AffineEc):
+    p, q = AffineEc.random_points(2, random.Random(5))
+    zero = AffineEc.zero()
+    pairs = [(p, q), (p, p), (p, p.negate()), (zero, q), (p, zero), (zero, zero)]
+    assert AffineEc.batch_add(pairs) == [a + b for a, b in pairs]
+    assert AffineEc.batch_add([]) == []
+
+
+@pytest.mark.parametrize(
+    "Ec",
+    [
+        pallas.AffineWeierstrass,
+        pallas.ProjectiveWeierstrass,
+        bn254.JacobianWeierstrass,
+    ],
+)
+def test_parallel_msm(Ec):
+    points = Ec.random_points(40, random.Random(3)) + [Ec.zero()]
+    scalars = [Ec.Fr.random() for _ in range(40)] + [5]
+    scalars[7] = -scalars[7].to_int()
+    scalars[8] = 0
+    expected = Ec.msm(points, scalars)
+    with ProcessPoolExecutor(2) as executor:
+        assert Ec.msm(points, scalars, executor=executor) == expected
+        assert Ec.msm(points, scalars, 4, workers=3, executor=executor) == expected
+        assert Ec.msm(points[:1], [0], executor=executor).is_zero()
+    assert Ec.msm(points, scalars, workers=2) == expected
+
+
+# The worker is started before the parent starts its resource tracker. With
+# "fork", the worker then starts its own tracker when it attaches the segment.
+SHARED_MEMORY_SCRIPT = """
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from keum import ec
+
+
+def attach(name):
+    shm = ec._attach_shared_memory(name)
+    value = bytes(shm.buf[:4])
+    shm.close()
+    return value
+
+
+if __name__ == "__main__":
+    context = multiprocessing.get_context(sys.argv[1])
+    executor = ProcessPoolExecutor(1, mp_context=context)
+    executor.submit(abs, 0).result()
+    shm = shared_memory.SharedMemory(create=True, size=4)
+    shm.buf[:4] = b"keum"
+    assert executor.submit(attach, shm.name).result() == b"keum"
+    executor.shutdown()
+    # Let the resource tracker of the worker exit
+    time.sleep(0.5)
+    other = shared_memory.SharedMemory(name=shm.name)
+    print(bytes(other.buf[:4]).decode())
+    other.close()
+    shm.close()
+    shm.unlink()
+"""
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn", "forkserver"])
+def test_shared_memory_survives_the_workers(method, tmp_path):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip("The start method %s is not available" % method)
+    # Run from a file, so that the workers started with "spawn" can import it
+    script = tmp_path / "shared_memory_script.py"
+    script.write_text(SHARED_MEMORY_SCRIPT)
+    root = os.path.dirname(os.path.dirname(ec.__file__))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([root, env.get("PYTHONPATH", "")])
+    output = subprocess.run(
+        [sys.executable, str(script), method],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert output.stdout.split() == ["keum"]
+    assert "leaked" not in output.stderr
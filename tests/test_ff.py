@@ -1,6 +1,19 @@
+import mmap
+import random
+
 import pytest
-from keum import FiniteField, PrimeFiniteField
-from keum import secp256k1
+import sympy
+
+import keum
+from keum import (
+    FiniteField,
+    PrimeFiniteField,
+    PrimeFieldVector,
+    ExtensionField,
+    QuadraticExtensionField,
+)
+from keum import secp256k1, secp256r1, bn254, pallas
+from keum.backend import available_backends, IntBackend
 
 
 class F13(PrimeFiniteField):
@@ -11,7 +24,14 @@ class F17(PrimeFiniteField):
     ORDER = 17
 
 
-@pytest.fixture(params=[F13, F17, secp256k1.AffineWeierstrass.Fr])
+@pytest.fixture(
+    params=[F13, F17, secp256k1.AffineWeierstrass.Fr]
+    + [
+        secp256k1.AffineWeierstrass.Fr.with_backend(backend)
+        for backend in available_backends()
+    ],
+    ids=lambda F: "%s-%d" % (F.__name__, F.ORDER % 1000),
+)
 def Finite_field_instance(request):
     return request.param
 
@@ -178,3 +198,578 @@ def test_encoding_decoding(Finite_field_instance):
     r = Finite_field_instance.random()
     assert Finite_field_instance.of_be_bytes_opt(r.to_be_bytes()) == r
     assert Finite_field_instance.of_be_bytes_exn(r.to_be_bytes()) == r
+
+
+def test_elements_have_no_dict(Finite_field_instance):
+    a = Finite_field_instance.random()
+    assert not hasattr(a, "__dict__")
+
+
+def test_constructor_reduces_modulo_order(Finite_field_instance):
+    order = Finite_field_instance.ORDER
+    assert Finite_field_instance(order + 3) == Finite_field_instance(3)
+    assert Finite_field_instance(-1) == Finite_field_instance(order - 1)
+
+
+def test_negate_zero_is_zero(Finite_field_instance):
+    assert Finite_field_instance.zero().negate().is_zero()
+
+
+def test_batch_inverse(Finite_field_instance):
+    xs = [Finite_field_instance.random() for _ in range(20)]
+    xs = [x for x in xs if not x.is_zero()]
+    assert Finite_field_instance.batch_inverse(xs) == [x.inverse() for x in xs]
+
+
+def test_batch_inverse_empty(Finite_field_instance):
+    assert Finite_field_instance.batch_inverse([]) == []
+
+
+def test_batch_inverse_raises_on_zero(Finite_field_instance):
+    xs = [Finite_field_instance.one(), Finite_field_instance.zero()]
+    with pytest.raises(ValueError):
+        Finite_field_instance.batch_inverse(xs)
+
+
+def test_batch_inverse_skip_zeros(Finite_field_instance):
+    two = Finite_field_instance(2)
+    zero = Finite_field_instance.zero()
+    res = Finite_field_instance.batch_inverse([zero, two, zero], skip_zeros=True)
+    assert res == [zero, two.inverse(), zero]
+
+
+def test_batch_inverse_iter_by_chunks(Finite_field_instance):
+    xs = [Finite_field_instance(i) for i in range(1, 12)]
+    res = list(Finite_field_instance.batch_inverse_iter(iter(xs), chunk_size=4))
+    assert res == [x.inverse() for x in xs]
+
+
+def test_batch_inverse_invalid_chunk_size(Finite_field_instance):
+    xs = [Finite_field_instance(i) for i in range(1, 5)]
+    for chunk_size in [0, -1]:
+        with pytest.raises(ValueError):
+            Finite_field_instance.batch_inverse_iter(xs, chunk_size=chunk_size)
+        with pytest.raises(ValueError):
+            Finite_field_instance.batch_inverse(xs, chunk_size=chunk_size)
+
+
+def random_vector(F, n):
+    return PrimeFieldVector.of_elements(F, [F.random() for _ in range(n)])
+
+
+def test_vector_conversion(Finite_field_instance):
+    xs = [Finite_field_instance.random() for _ in range(10)]
+    v = PrimeFieldVector.of_elements(Finite_field_instance, xs)
+    assert len(v) == 10
+    assert v.to_elements() == xs
+    assert list(v) == xs
+    assert v[3] == xs[3]
+    assert v[2:5].to_elements() == xs[2:5]
+
+
+def test_vector_elementwise_operations(Finite_field_instance):
+    a = random_vector(Finite_field_instance, 8)
+    b = random_vector(Finite_field_instance, 8)
+    xs, ys = a.to_elements(), b.to_elements()
+    assert (a + b).to_elements() == [x + y for x, y in zip(xs, ys)]
+    assert (a - b).to_elements() == [x - y for x, y in zip(xs, ys)]
+    assert (a * b).to_elements() == [x * y for x, y in zip(xs, ys)]
+    assert a.negate().to_elements() == [x.negate() for x in xs]
+    c = Finite_field_instance.random()
+    assert a.scalar_mul(c).to_elements() == [x * c for x in xs]
+
+
+def test_vector_reductions(Finite_field_instance):
+    a = random_vector(Finite_field_instance, 8)
+    b = random_vector(Finite_field_instance, 8)
+    xs, ys = a.to_elements(), b.to_elements()
+    expected_dot = Finite_field_instance.zero()
+    expected_sum = Finite_field_instance.zero()
+    for x, y in zip(xs, ys):
+        expected_dot += x * y
+        expected_sum += x
+    assert a.dot(b) == expected_dot
+    assert a.sum() == expected_sum
+    prefix = a.prefix_products().to_elements()
+    acc = Finite_field_instance.one()
+    for x, p in zip(xs, prefix):
+        acc = acc * x
+        assert p == acc
+    if all(not x.is_zero() for x in xs):
+        assert a.batch_inverse().to_elements() == [x.inverse() for x in xs]
+
+
+def test_vector_different_lengths():
+    a = random_vector(F13, 3)
+    b = random_vector(F13, 4)
+    with pytest.raises(ValueError):
+        a + b
+
+
+def test_vector_different_fields():
+    a = random_vector(F13, 3)
+    b = random_vector(F17, 3)
+    with pytest.raises(ValueError):
+        a.dot(b)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 5, 7, 15, 16, 17, 255, 2**31 + 5, 2**96 - 1])
+def test_generic_sliding_window_pow(Finite_field_instance, n):
+    a = Finite_field_instance.random()
+    assert FiniteField.pow(a, n) == a.pow(n)
+
+
+def test_generic_sliding_window_pow_large_exponents(Finite_field_instance):
+    a = Finite_field_instance.random()
+    order = Finite_field_instance.ORDER
+    for n in [order - 2, (order - 1) // 2, Finite_field_instance.random().to_int()]:
+        assert FiniteField.pow(a, n) == a.pow(n)
+
+
+def test_pow_negative_exponent(Finite_field_instance):
+    a = Finite_field_instance.random()
+    while a.is_zero():
+        a = Finite_field_instance.random()
+    assert a.pow(-3) == a.pow(3).inverse()
+
+
+class F19(PrimeFiniteField):
+    ORDER = 19
+
+
+class F41(PrimeFiniteField):
+    ORDER = 41
+
+
+class F97(PrimeFiniteField):
+    ORDER = 97
+
+
+# 19 = 3 mod 4, 13 = 5 mod 8, 17, 41 and 97 = 1 mod 8 (Tonelli-Shanks)
+@pytest.mark.parametrize("F", [F13, F17, F19, F41, F97])
+def test_sqrt_exhaustive_small_fields(F):
+    squares = {(x * x) % F.ORDER for x in range(F.ORDER)}
+    for v in range(F.ORDER):
+        s = F(v).sqrt_opt(sign=True)
+        if v in squares:
+            assert s * s == F(v)
+            assert s.to_int() <= F.ORDER - s.to_int() or s.is_zero()
+        else:
+            assert s is None
+
+
+@pytest.mark.parametrize("F", [bn254.Fr, pallas.Fq, secp256r1.Fq])
+def test_sqrt_large_two_adicity(F):
+    a = F.random().square()
+    s = a.sqrt_opt(sign=True)
+    assert s * s == a
+    # z^q, q odd, is a non-residue
+    non_residue = F(F.sqrt_parameters()[2][0])
+    if not a.is_zero():
+        assert (non_residue * a).sqrt_opt(sign=True) is None
+
+
+def test_highest_power_of_two():
+    assert F97.highest_power_of_two() == 5
+    assert bn254.Fr.highest_power_of_two() == 28
+    assert pallas.Fq.highest_power_of_two() == 32
+
+
+def test_batch_sqrt(Finite_field_instance):
+    xs = [Finite_field_instance.random() for _ in range(20)]
+    expected = [x.sqrt_opt(sign=False) for x in xs]
+    assert Finite_field_instance.batch_sqrt(xs, sign=False) == expected
+
+
+@pytest.mark.parametrize("byteorder", ["big", "little"])
+def test_bytes_encoding_decoding(Finite_field_instance, byteorder):
+    r = Finite_field_instance.random()
+    bs = r.to_bytes(byteorder)
+    assert len(bs) == Finite_field_instance.bytes_length()
+    assert Finite_field_instance.of_bytes_exn(bs, byteorder) == r
+    assert Finite_field_instance.of_bytes_opt(bs, byteorder) == r
+    assert bs == bytes.fromhex(r.to_be_bytes())[:: 1 if byteorder == "big" else -1]
+
+
+def test_bytes_decoding_out_of_range(Finite_field_instance):
+    n = Finite_field_instance.bytes_length()
+    bs = b"\xff" * n
+    assert Finite_field_instance.of_bytes_opt(bs) is None
+    assert Finite_field_instance.of_bytes_opt(b"\x00" * (n + 1)) is None
+    with pytest.raises(ValueError):
+        Finite_field_instance.of_bytes_exn(bs)
+
+
+@pytest.mark.parametrize("byteorder", ["big", "little"])
+def test_bulk_encoding_decoding(Finite_field_instance, byteorder):
+    xs = [Finite_field_instance.random() for _ in range(10)]
+    bs = Finite_field_instance.encode_many(xs, byteorder)
+    assert bs == b"".join(x.to_bytes(byteorder) for x in xs)
+    for buffer in [bs, bytearray(bs), memoryview(bs)]:
+        assert Finite_field_instance.decode_many_exn(buffer, byteorder) == xs
+    v = PrimeFieldVector.of_bytes_exn(Finite_field_instance, bs, byteorder)
+    assert v.to_elements() == xs
+    assert v.to_bytes(byteorder) == bs
+
+
+def test_bulk_encoding_decoding_mmap(Finite_field_instance):
+    xs = [Finite_field_instance.random() for _ in range(10)]
+    n = Finite_field_instance.bytes_length()
+    with mmap.mmap(-1, 10 * n + 3) as m:
+        end = Finite_field_instance.encode_many_into(m, xs, offset=3)
+        assert end == 10 * n + 3
+        assert Finite_field_instance.decode_many_exn(memoryview(m)[3:end]) == xs
+
+
+def test_bulk_decoding_errors(Finite_field_instance):
+    n = Finite_field_instance.bytes_length()
+    if n > 1:
+        with pytest.raises(ValueError):
+            Finite_field_instance.decode_many_exn(b"\x00" * (2 * n + 1))
+    with pytest.raises(ValueError):
+        Finite_field_instance.decode_many_exn(b"\x00" * n + b"\xff" * n)
+    one = Finite_field_instance.one()
+    with pytest.raises(ValueError):
+        Finite_field_instance.encode_many_into(bytearray(n), [one, one])
+
+
+@pytest.mark.parametrize(
+    "order, decomposition, generator",
+    [
+        # Composite orders with a consistent factorization
+        (91, {2: 1, 3: 2, 5: 1}, 2),
+        (561, {2: 4, 5: 1, 7: 1}, 2),
+        # 97 is prime but 8 and 4 are squares, and 2^3 * 3 != 96
+        (97, {2: 5, 3: 1}, 8),
+        (97, {2: 5, 3: 1}, 4),
+        (97, {2: 3, 3: 1}, 5),
+        # 9 is not prime
+        (97, {2: 5, 9: 1}, 5),
+        # No certificate
+        (97, None, None),
+    ],
+)
+def test_trusted_prime_order_invalid_certificate(order, decomposition, generator):
+    class F(PrimeFiniteField):
+        ORDER = order
+        TRUSTED_PRIME_ORDER = True
+        PRIME_DECOMPOSITION = decomposition
+        MULTIPLICATIVE_GENERATOR = generator
+
+    with pytest.raises(ValueError):
+        F(1)
+
+
+def test_trusted_prime_order_certificate():
+    class F(PrimeFiniteField):
+        ORDER = 97
+        TRUSTED_PRIME_ORDER = True
+        PRIME_DECOMPOSITION = {2: 5, 3: 1}
+        MULTIPLICATIVE_GENERATOR = 5
+
+    assert F(3) * F(33) == F(2)
+    assert F._PRIME_ORDER == 97
+    # The copies of with_backend do not check the order again
+    assert F.with_backend(IntBackend)._PRIME_ORDER == 97
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backend_of_field(backend):
+    F = bn254.Fr.with_backend(backend)
+    a = F.random()
+    assert F.backend() is backend
+    assert isinstance(a.v, type(backend.of_int(0)))
+    assert isinstance((a * a + a - a.inverse()).v, type(backend.of_int(0)))
+    assert isinstance(a.to_int(), int)
+    assert a.to_int() == bn254.Fr(a.to_int()).to_int()
+
+
+def test_backends_agree():
+    xs = [bn254.Fr.random() for _ in range(4)]
+    results = []
+    for backend in available_backends():
+        F = bn254.Fr.with_backend(backend)
+        a, b, c, d = [F(x.to_int()) for x in xs]
+        r = (a * b - c).pow(5) / d + a.square()
+        results.append(r.to_int())
+    assert len(set(results)) == 1
+
+
+def test_int_backend_is_always_available():
+    assert IntBackend in available_backends()
+
+
+def test_random_with_seed(Finite_field_instance):
+    a = Finite_field_instance.random(random.Random(42))
+    b = Finite_field_instance.random(random.Random(42))
+    assert a == b
+
+
+def test_random_vector(Finite_field_instance):
+    v = Finite_field_instance.random_vector(100, random.Random(1))
+    assert len(v) == 100
+    assert all(0 <= x.to_int() < Finite_field_instance.ORDER for x in v)
+    assert v == Finite_field_instance.random_vector(100, random.Random(1))
+    assert len(Finite_field_instance.random_vector(0)) == 0
+
+
+@pytest.fixture(params=[bn254.Fq2, bn254.Fq6, bn254.Fq12])
+def Extension_field(request):
+    return request.param
+
+
+def test_extension_field_ring_axioms(Extension_field):
+    a, b, c = [Extension_field.random() for _ in range(3)]
+    assert a + b == b + a
+    assert a * b == b * a
+    assert (a * b) * c == a * (b * c)
+    assert a * (b + c) == a * b + a * c
+    assert a - a == Extension_field.zero()
+    assert a + a.negate() == Extension_field.zero()
+    assert a * Extension_field.one() == a
+
+
+def test_extension_field_square(Extension_field):
+    a = Extension_field.random()
+    assert a.square() == a * a
+
+
+def test_extension_field_inverse(Extension_field):
+    a = Extension_field.random()
+    assert a * a.inverse() == Extension_field.one()
+    assert (a / a).is_one()
+    with pytest.raises(ValueError):
+        Extension_field.zero().inverse()
+
+
+def test_extension_field_frobenius(Extension_field):
+    a = Extension_field.random()
+    p = Extension_field.characteristic()
+    assert a.frobenius() == a.pow(p)
+    assert a.frobenius(2) == a.frobenius().frobenius()
+    assert a.frobenius(Extension_field.absolute_degree()) == a
+
+
+def test_extension_field_order():
+    for F in [bn254.Fq2, bn254.Fq6]:
+        assert F.random().pow(F.ORDER - 1).is_one()
+
+
+def test_extension_field_encoding_decoding(Extension_field):
+    a = Extension_field.random()
+    assert Extension_field.of_be_bytes_exn(a.to_be_bytes()) == a
+    assert Extension_field.of_be_bytes_opt(a.to_be_bytes()) == a
+    assert Extension_field.of_be_bytes_opt(a.to_be_bytes()[2:]) is None
+
+
+def test_quadratic_extension_sqrt():
+    class F13_2(QuadraticExtensionField):
+        BASE_FIELD = F13
+        NON_RESIDUE = F13(2)
+
+    # Exhaustively in a small field: half of the non zero elements are squares
+    elements = [F13_2(F13(a), F13(b)) for a in range(13) for b in range(13)]
+    squares = {x.square() for x in elements}
+    for x in elements:
+        r = x.sqrt_opt(True)
+        assert (r is not None) == (x in squares)
+        if r is not None:
+            assert r.square() == x
+            assert x.sqrt_opt(False) == r.negate()
+    for F in [bn254.Fq2, F13_2]:
+        a = F.random()
+        assert a.square().sqrt_opt(True) in [a, a.negate()]
+        assert F.zero().sqrt_opt(True).is_zero()
+
+
+def test_extension_field_sqrt(Extension_field):
+    for _ in range(3):
+        x = Extension_field.random()
+        r = x.square().sqrt_opt(True)
+        assert r.square() == x.square()
+        assert x.square().sqrt_opt(False) == r.negate()
+    assert Extension_field.zero().sqrt_opt(True).is_zero()
+    # The non-residue of Tonelli-Shanks has no square root
+    s, t, z_powers = Extension_field.sqrt_parameters()
+    assert z_powers[0].pow(1 << (s - 1)) == Extension_field.one().negate()
+    x = Extension_field.random()
+    assert (z_powers[0] * x.square()).sqrt_opt(True) is None
+
+
+def test_extension_field_sqrt_methods_agree():
+    # Generic Tonelli-Shanks and the complex method of quadratic extensions
+    for _ in range(3):
+        a = bn254.Fq2.random().square()
+        assert a.sqrt_opt(True) == ExtensionField.sqrt_opt(a, True)
+
+
+def test_extension_field_non_residue_multiplication():
+    # The specialized multiplications by the non-residues match the generic one
+    x = bn254.Fq.random()
+    assert bn254.Fq2.mul_by_non_residue(x) == x * bn254.Fq2.NON_RESIDUE
+    y = bn254.Fq2.random()
+    assert bn254.Fq6.mul_by_non_residue(y) == y * bn254.Fq6.NON_RESIDUE
+    z = bn254.Fq6.random()
+    assert bn254.Fq12.mul_by_non_residue(z) == z * bn254.Fq12.NON_RESIDUE
+
+
+@pytest.mark.parametrize("F", [F13, F17, F19, F41, F97])
+def test_legendre_symbol_exhaustive_small_fields(F):
+    squares = {(x * x) % F.ORDER for x in range(1, F.ORDER)}
+    for v in range(F.ORDER):
+        expected = 0 if v == 0 else (1 if v in squares else -1)
+        assert F(v).legendre_symbol() == expected
+        assert F(v).is_quadratic_residue() == (expected != -1)
+
+
+def test_legendre_symbol_matches_euler_criterion(Finite_field_instance):
+    order = Finite_field_instance.ORDER
+    for _ in range(20):
+        a = Finite_field_instance.random()
+        euler = a.pow((order - 1) // 2)
+        expected = 0 if a.is_zero() else (1 if euler.is_one() else -1)
+        assert a.legendre_symbol() == expected
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_jacobi_backends(backend):
+    for n in [3, 5, 7, 9, 15, 21, 45, 97, 105]:
+        for a in range(-5, 2 * n):
+            assert backend.jacobi(a % n, n) == sympy.jacobi_symbol(a, n)
+
+
+def test_split_quadratic_residues(Finite_field_instance):
+    xs = [Finite_field_instance.random() for _ in range(30)] + [
+        Finite_field_instance.zero()
+    ]
+    residues, non_residues = Finite_field_instance.split_quadratic_residues(xs)
+    assert len(residues) + len(non_residues) == len(xs)
+    assert all(x.sqrt_opt(sign=True) is not None for x in residues)
+    assert all(x.sqrt_opt(sign=True) is None for x in non_residues)
+
+
+def bundled_prime_fields():
+    fields = []
+    for name in keum.CURVE_MODULES:
+        curve = getattr(keum, name)
+        fields += [curve.Fq, curve.Fr]
+    return fields
+
+
+@pytest.mark.parametrize("F", bundled_prime_fields())
+def test_bundled_field_metadata(F):
+    p = F.ORDER
+    n = 1
+    for q, e in F.PRIME_DECOMPOSITION.items():
+        assert sympy.isprime(q)
+        n *= q**e
+    assert n == p - 1
+    g = F.MULTIPLICATIVE_GENERATOR
+    assert all(pow(g, (p - 1) // q, p) != 1 for q in F.PRIME_DECOMPOSITION)
+    s = F.TWO_ADICITY
+    assert s == F.PRIME_DECOMPOSITION[2]
+    w = F.two_adic_root_of_unity()
+    assert w == F(g).pow((p - 1) >> s)
+    assert w.pow(2**s).is_one()
+    assert not w.pow(2 ** (s - 1)).is_one()
+    assert w * F.two_adic_root_of_unity_inverse() == F.one()
+
+
+def test_metadata_of_user_defined_field(tmp_path, monkeypatch):
+    monkeypatch.setattr(keum.ff, "METADATA_CACHE_DIR", str(tmp_path))
+
+    class F(PrimeFiniteField):
+        ORDER = 97
+
+    assert F.prime_decomposition_multiplicative_subgroup() == {2: 5, 3: 1}
+    assert F.multiplicative_generator() == F(5)
+    assert F.highest_power_of_two() == 5
+    assert F.two_adic_root_of_unity().pow(32).is_one()
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # A new field with the same order reads the factorization from the cache
+    class G(PrimeFiniteField):
+        ORDER = 97
+
+    monkeypatch.setattr(
+        "sympy.ntheory.factorint", lambda n: pytest.fail("factorint called")
+    )
+    assert G.prime_decomposition_multiplicative_subgroup() == {2: 5, 3: 1}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        '{"order": "97"}',
+        '{"order": "97", "prime_decomposition": []}',
+        '{"order": "97", "prime_decomposition": {"2": 5, "x": 1}}',
+        '{"order": "97", "prime_decomposition": {"2": 5, "5": 1}}',
+        '{"order": "97", "prime_decomposition": {"2": 4, "6": 1}}',
+        '{"order": "97", "prime_decomposition": {"2": 5, "3": "1"}}',
+    ],
+)
+def test_metadata_cache_is_checked(tmp_path, monkeypatch, content):
+    monkeypatch.setattr(keum.ff, "METADATA_CACHE_DIR", str(tmp_path))
+    path = keum.ff._metadata_cache_path(97)
+    with open(path, "w") as f:
+        f.write(content)
+
+    class F(PrimeFiniteField):
+        ORDER = 97
+
+    # The invalid cache is discarded, and overwritten
+    assert F.prime_decomposition_multiplicative_subgroup() == {2: 5, 3: 1}
+    assert keum.ff._load_cached_prime_decomposition(97) == {2: 5, 3: 1}
+
+
+@pytest.mark.parametrize("F", [F97, bn254.Fr, pallas.Fq])
+@pytest.mark.parametrize("n", [1, 2, 3, 8, 16])
+def test_root_of_unity(F, n):
+    w = F.root_of_unity(n)
+    assert w.pow(n).is_one()
+    for q in sympy.primefactors(n):
+        assert not w.pow(n // q).is_one()
+
+
+def test_root_of_unity_invalid_order():
+    with pytest.raises(ValueError):
+        F97.root_of_unity(5)
+    with pytest.raises(ValueError):
+        F97.root_of_unity(64)
+
+
+def test_hash_is_consistent_with_equality(Finite_field_instance):
+    x = Finite_field_instance.random()
+    y = Finite_field_instance(int(x.v))
+    assert x == y
+    assert hash(x) == hash(y)
+    assert len({x, y, x.copy()}) == 1
+
+
+def test_zero_and_one_are_interned(Finite_field_instance):
+    F = Finite_field_instance
+    assert F.zero() is F.zero()
+    assert F.one() is F.one()
+    assert F.zero().is_zero() and F.one().is_one()
+    assert F.intern(3) is F.intern(F(3))
+    assert F.intern(-1) == F(-1)
+
+
+def test_subclass_does_not_share_interned_constants():
+    class F(PrimeFiniteField):
+        ORDER = 13
+
+    class G(F):
+        pass
+
+    assert F.zero().__class__ is F
+    assert G.zero().__class__ is G
+    assert G.intern(2).__class__ is G
+
+
+def test_extension_field_hash(Extension_field):
+    x = Extension_field.random()
+    y = Extension_field.of_coefficients(x.coefficients())
+    assert hash(x) == hash(y)
+    assert len({x, y, Extension_field.one(), Extension_field.one()}) <= 2
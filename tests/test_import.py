@@ -0,0 +1,94 @@
+import subprocess
+import sys
+import time
+
+import pytest
+import sympy
+
+import keum
+
+# Budget for `import keum` followed by the creation of an element of each
+# bundled field, in a fresh interpreter, relative to the start of a bare
+# interpreter (`python -c pass`) measured in the same run. It is a loose guard
+# against regressions like importing sympy at load time, the hard guard being
+# `test_import_does_not_load_sympy`.
+IMPORT_TIME_RATIO = 20
+
+IMPORT_SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+import keum
+
+for name in keum.CURVE_MODULES:
+    curve = getattr(keum, name)
+    curve.Fq(1)
+    curve.Fr(1)
+print(time.perf_counter() - start)
+print("sympy" in sys.modules)
+"""
+
+
+def run_import_script():
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), output[1] == "True"
+
+
+def wall_time(script):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", script], check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def test_import_time_budget():
+    # Keep the best of a few interleaved runs to be robust against a loaded
+    # machine
+    baseline = []
+    durations = []
+    for _ in range(5):
+        baseline.append(wall_time("pass"))
+        durations.append(wall_time(IMPORT_SCRIPT))
+    assert min(durations) < IMPORT_TIME_RATIO * min(baseline)
+
+
+def test_import_does_not_load_gmpy2():
+    # gmpy2 is imported when the first element is created
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import keum; print('gmpy2' in sys.modules)",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert output == ["False"]
+
+
+def test_import_does_not_load_sympy():
+    _, sympy_loaded = run_import_script()
+    assert not sympy_loaded
+
+
+@pytest.mark.parametrize("name", keum.CURVE_MODULES)
+def test_trusted_orders_are_prime(name):
+    curve = getattr(keum, name)
+    for F in [curve.Fq, curve.Fr]:
+        assert F.TRUSTED_PRIME_ORDER
+        assert sympy.isprime(F.ORDER)
+
+
+def test_curve_modules_are_lazily_loaded():
+    from keum import pallas
+
+    assert keum.pallas is pallas
+    assert "pallas" in dir(keum)
+    with pytest.raises(AttributeError):
+        keum.not_a_curve
@@ -0,0 +1,117 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from keum import PrimeFiniteField, PrimeFieldVector, bn254, pallas
+from keum import ntt
+from keum.ntt import EvaluationDomain
+
+
+class F97(PrimeFiniteField):
+    ORDER = 97
+
+
+@pytest.fixture(
+    params=[
+        (F97, 1),
+        (F97, 2),
+        (F97, 8),
+        (F97, 32),
+        (F97, 3),
+        (F97, 12),
+        (F97, 96),
+        (bn254.Fr, 16),
+        (bn254.Fr, 36),
+        (pallas.Fq, 64),
+        (pallas.Fq, 48),
+    ],
+    ids=lambda x: "%s-%d" % (x[0].__name__, x[1]),
+)
+def Domain(request):
+    F, n = request.param
+    return EvaluationDomain.of_size(F, n)
+
+
+def evaluate(coefficients, x):
+    acc = x.zero()
+    for c in reversed(coefficients):
+        acc = acc * x + c
+    return acc
+
+
+def test_ntt_evaluates_on_the_domain(Domain):
+    F = Domain.field
+    coefficients = [F.random() for _ in range(Domain.size)]
+    v = PrimeFieldVector.of_elements(F, coefficients)
+    Domain.ntt(v)
+    assert v.to_elements() == [evaluate(coefficients, x) for x in Domain.elements()]
+
+
+def test_intt_is_the_inverse_of_ntt(Domain):
+    F = Domain.field
+    v = F.random_vector(Domain.size)
+    w = v.copy()
+    Domain.ntt(w)
+    Domain.intt(w)
+    assert v == w
+
+
+def test_coset_ntt(Domain):
+    F = Domain.field
+    coefficients = [F.random() for _ in range(Domain.size)]
+    for shift in [None, F(5)]:
+        g = F.multiplicative_generator() if shift is None else shift
+        v = PrimeFieldVector.of_elements(F, coefficients)
+        Domain.coset_ntt(v, shift)
+        expected = [evaluate(coefficients, g * x) for x in Domain.elements()]
+        assert v.to_elements() == expected
+        Domain.coset_intt(v, shift)
+        assert v.to_elements() == coefficients
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+def test_parallel_ntt(Domain, executor, monkeypatch):
+    monkeypatch.setattr(ntt, "PARALLEL_NTT_THRESHOLD", 1)
+    F = Domain.field
+    v = F.random_vector(Domain.size)
+    for transform in [Domain.ntt, Domain.intt, Domain.coset_ntt, Domain.coset_intt]:
+        expected = v.copy()
+        transform(expected)
+        w = v.copy()
+        transform(w, executor=executor)
+        assert w == expected
+
+
+def test_ntt_is_in_place(Domain):
+    v = Domain.field.random_vector(Domain.size)
+    values = v.values
+    Domain.ntt(v)
+    assert v.values is values
+
+
+def test_domains_are_cached():
+    D = EvaluationDomain.of_size(bn254.Fr, 8)
+    assert EvaluationDomain.of_size(bn254.Fr, 8) is D
+    assert D.twiddles() is D.twiddles()
+    assert EvaluationDomain.of_size(pallas.Fq, 8) is not D
+
+
+def test_invalid_domain_size():
+    with pytest.raises(ValueError):
+        EvaluationDomain.of_size(F97, 5)
+    with pytest.raises(ValueError):
+        EvaluationDomain.of_size(F97, 64)
+
+
+def test_ntt_checks_the_vector():
+    D = EvaluationDomain.of_size(F97, 8)
+    with pytest.raises(ValueError):
+        D.ntt(F97.random_vector(4))
+    with pytest.raises(ValueError):
+        D.ntt(bn254.Fr.random_vector(8))
+    with pytest.raises(ValueError):
+        D.coset_ntt(F97.random_vector(8), F97.zero())
@@ -0,0 +1,240 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from keum import PrimeFieldVector, PrimeFiniteField, bn254, pallas
+from keum import ntt, polynomial
+from keum.ntt import EvaluationDomain
+from keum.polynomial import (
+    LagrangeBasis,
+    Polynomial,
+    SubproductTree,
+    interpolate,
+    multi_evaluate,
+)
+
+
+class F97(PrimeFiniteField):
+    ORDER = 97
+
+
+@pytest.fixture(params=[F97, bn254.Fr, pallas.Fq])
+def Field(request):
+    return request.param
+
+
+@pytest.fixture(params=["schoolbook", "karatsuba", "ntt"])
+def Algorithm(request, monkeypatch):
+    # Lower the thresholds to run every algorithm on small polynomials
+    if request.param != "schoolbook":
+        monkeypatch.setattr(polynomial, "KARATSUBA_THRESHOLD", 2)
+    if request.param == "ntt":
+        monkeypatch.setattr(polynomial, "NTT_THRESHOLD", 1)
+        monkeypatch.setattr(polynomial, "NEWTON_DIVISION_THRESHOLD", 1)
+        monkeypatch.setattr(polynomial, "MULTIPOINT_NEWTON_THRESHOLD", 1)
+        monkeypatch.setattr(polynomial, "MULTIPOINT_HORNER_THRESHOLD", 1)
+    return request.param
+
+
+def naive_mul(a, b):
+    F = a.field
+    res = [F.zero()] * (a.degree() + b.degree() + 1)
+    for i, x in enumerate(a.coefficients()):
+        for j, y in enumerate(b.coefficients()):
+            res[i + j] += x * y
+    return Polynomial.of_coefficients(F, res)
+
+
+def test_zero_and_one(Field):
+    assert Polynomial.zero(Field).degree() == -1
+    assert Polynomial.zero(Field).is_zero()
+    assert Polynomial.one(Field).degree() == 0
+    assert Polynomial(Field, [1, 2, 0, 0]).degree() == 1
+    assert Polynomial.monomial(Field, 3).coefficients() == [
+        Field.zero(),
+        Field.zero(),
+        Field.zero(),
+        Field.one(),
+    ]
+
+
+def test_add_sub_negate(Field):
+    a = Polynomial.random(Field, 10)
+    b = Polynomial.random(Field, 4)
+    assert (a + b) - b == a
+    assert a - a == Polynomial.zero(Field)
+    assert a + a.negate() == Polynomial.zero(Field)
+    assert -b == Polynomial.zero(Field) - b
+    # The leading coefficients cancel
+    c = Polynomial.monomial(Field, 5) + b
+    assert (c - Polynomial.monomial(Field, 5)).degree() == b.degree()
+
+
+def test_scalar_mul(Field):
+    a = Polynomial.random(Field, 7)
+    c = Field.random()
+    assert a.scalar_mul(c).coefficients() == [c * x for x in a.coefficients()]
+    assert a.scalar_mul(Field.zero()).is_zero()
+
+
+def test_evaluate(Field):
+    a = Polynomial.random(Field, 9)
+    x = Field.random()
+    expected = Field.zero()
+    for i, c in enumerate(a.coefficients()):
+        expected += c * x.pow(i)
+    assert a.evaluate(x) == expected
+    assert a(x) == expected
+    assert Polynomial.zero(Field).evaluate(x).is_zero()
+
+
+@pytest.mark.parametrize("degrees", [(0, 0), (3, 5), (17, 17), (40, 9), (70, 66)])
+def test_mul(Field, Algorithm, degrees):
+    a = Polynomial.random(Field, degrees[0])
+    b = Polynomial.random(Field, degrees[1])
+    assert a * b == naive_mul(a, b)
+    assert b * a == a * b
+    assert (a * Polynomial.zero(Field)).is_zero()
+
+
+@pytest.mark.parametrize("degrees", [(3, 5), (5, 0), (17, 17), (40, 9), (70, 33)])
+def test_divmod(Field, Algorithm, degrees):
+    a = Polynomial.random(Field, degrees[0])
+    b = Polynomial.random(Field, degrees[1])
+    q, r = divmod(a, b)
+    assert q * b + r == a
+    assert r.degree() < b.degree() or r.is_zero()
+    assert a // b == q
+    assert a % b == r
+    # Exact division
+    assert divmod(a * b, b) == (a, Polynomial.zero(Field))
+
+
+def test_division_by_zero(Field):
+    with pytest.raises(ValueError):
+        divmod(Polynomial.random(Field, 3), Polynomial.zero(Field))
+
+
+@pytest.mark.parametrize("degree", [2, 7, 8, 20, 33])
+def test_divide_by_vanishing_polynomial(Field, degree):
+    D = EvaluationDomain.of_size(Field, 8)
+    a = Polynomial.random(Field, degree)
+    for shift in [None, Field(3)]:
+        Z = Polynomial.vanishing_polynomial(D, shift)
+        q, r = a.divide_by_vanishing_polynomial(D, shift)
+        assert (q, r) == divmod(a, Z)
+        g = Field.one() if shift is None else shift
+        for x in D.elements():
+            assert Z.evaluate(g * x).is_zero()
+
+
+def test_evaluate_and_interpolate_on_domain(Field):
+    D = EvaluationDomain.of_size(Field, 16)
+    a = Polynomial.random(Field, 11)
+    for shift in [None, Field.multiplicative_generator()]:
+        g = Field.one() if shift is None else shift
+        v = a.evaluate_on_domain(D, shift)
+        assert v.to_elements() == [a.evaluate(g * x) for x in D.elements()]
+        assert Polynomial.interpolate_on_domain(D, v, shift) == a
+    with pytest.raises(ValueError):
+        Polynomial.random(Field, 16).evaluate_on_domain(D)
+
+
+def test_operations_check_the_field():
+    a = Polynomial.random(F97, 3)
+    b = Polynomial.random(bn254.Fr, 3)
+    with pytest.raises(ValueError):
+        a + b
+    with pytest.raises(ValueError):
+        a * b
+    with pytest.raises(ValueError):
+        a.evaluate(bn254.Fr(1))
+
+
+def test_derivative(Field):
+    a = Polynomial(Field, [5, 3, 0, 7])
+    assert a.derivative() == Polynomial(Field, [3, 0, 21])
+    assert Polynomial.one(Field).derivative().is_zero()
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 16, 33, 90])
+def test_subproduct_tree(Field, Algorithm, n):
+    # Distinct points
+    points = PrimeFieldVector(Field, random.sample(range(min(Field.ORDER, 1 << 60)), n))
+    tree = SubproductTree(Field, points)
+    M = tree.vanishing_polynomial()
+    assert M.degree() == n
+    assert all(M.evaluate(x).is_zero() for x in points)
+    for degree in [0, n - 1, n, 2 * n + 3]:
+        a = Polynomial.random(Field, degree)
+        expected = [a.evaluate(x) for x in points]
+        assert tree.evaluate(a).to_elements() == expected
+        assert multi_evaluate(a, points).to_elements() == expected
+    a = Polynomial.random(Field, n - 1)
+    v = tree.evaluate(a)
+    assert tree.interpolate(v) == a
+    assert interpolate(points.to_elements(), v.to_elements()) == a
+    assert tree.weights().to_elements() == [
+        M.derivative().evaluate(x).inverse() for x in points
+    ]
+
+
+def test_interpolate_errors(Field):
+    with pytest.raises(ValueError):
+        interpolate([Field(1), Field(2), Field(1)], [Field(0)] * 3)
+    with pytest.raises(ValueError):
+        interpolate([Field(1), Field(2)], [Field(0)])
+    with pytest.raises(ValueError):
+        interpolate([], [])
+    with pytest.raises(ValueError):
+        multi_evaluate(Polynomial.random(F97, 3), [bn254.Fr(1)])
+
+
+@pytest.mark.parametrize("n", [1, 4, 8, 16])
+def test_lagrange_basis_of_domain(Field, n):
+    D = EvaluationDomain.of_size(Field, n)
+    a = Polynomial.random(Field, n - 1)
+    z = Field.random()
+    for shift in [None, Field.multiplicative_generator()]:
+        g = Field.one() if shift is None else shift
+        L = LagrangeBasis.of_domain(D, shift)
+        assert LagrangeBasis.of_domain(D, shift) is L
+        assert L.points.to_elements() == [g * x for x in D.elements()]
+        v = a.evaluate_on_domain(D, shift)
+        assert L.evaluate(v, z) == a.evaluate(z)
+        assert L.evaluate_basis(z).dot(v) == a.evaluate(z)
+        assert L.evaluate_basis(z).sum() == Field.one()
+        # At a point of the domain
+        x = g * D.elements()[n - 1]
+        assert L.evaluate(v, x) == v[n - 1]
+        assert L.evaluate_basis(x).to_elements() == [Field.zero()] * (n - 1) + [
+            Field.one()
+        ]
+
+
+def test_lagrange_basis_of_points(Field):
+    points = PrimeFieldVector(Field, random.sample(range(min(Field.ORDER, 1 << 60)), 9))
+    L = LagrangeBasis(Field, points)
+    a = Polynomial.random(Field, 8)
+    v = SubproductTree(Field, points).evaluate(a)
+    z = Field.random()
+    assert L.evaluate(v, z) == a.evaluate(z)
+    assert L.evaluate(v.to_elements(), points[3]) == v[3]
+    assert L.evaluate_basis(z).sum() == Field.one()
+    with pytest.raises(ValueError):
+        L.evaluate(v.to_elements()[:8], z)
+    with pytest.raises(ValueError):
+        LagrangeBasis(Field, [Field(1), Field(1)])
+
+
+def test_parallel_mul(Field, monkeypatch):
+    monkeypatch.setattr(polynomial, "NTT_THRESHOLD", 1)
+    monkeypatch.setattr(ntt, "PARALLEL_NTT_THRESHOLD", 1)
+    a = Polynomial.random(Field, 20)
+    b = Polynomial.random(Field, 11)
+    D = EvaluationDomain.of_size(Field, 32)
+    with ProcessPoolExecutor(2) as executor:
+        assert a.mul(b, executor) == naive_mul(a, b)
+        v = a.evaluate_on_domain(D, executor=executor)
+        assert v == a.evaluate_on_domain(D)
+        assert Polynomial.interpolate_on_domain(D, v, executor=executor) == a